@@ -9,11 +9,21 @@ Endpoints:
     - GET  /health     : Health check
     - POST /predict    : 단일 예측
     - POST /predict/batch : 배치 예측
+
+Environment:
+    - INFERENCE_EXECUTOR  : 추론 실행기 (thread | process | inline, 기본 thread)
+    - INFERENCE_WORKERS   : 추론 워커 수 (기본 2)
+    - INFERENCE_MAX_QUEUE : 워커가 모두 바쁠 때 대기 가능한 요청 수 (기본 16, 초과 시 503)
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import multiprocessing
+import os
 import joblib
 import numpy as np
 from pathlib import Path
@@ -42,14 +52,111 @@ IRIS_SPECIES = {0: "setosa", 1: "versicolor", 2: "virginica"}
 try:
     logger.info(f"모델 로드 시도: {MODEL_PATH}")
     model = joblib.load(MODEL_PATH)
+    # predict_proba 열 순서(model.classes_)에 맞춘 품종 이름 배열
+    SPECIES_NAMES = np.array([IRIS_SPECIES[c] for c in model.classes_])
     MODEL_LOADED = True
     logger.info("✅ 모델 로드 성공")
 except Exception as e:
     model = None
+    SPECIES_NAMES = None
     MODEL_LOADED = False
     logger.error(f"❌ 모델 로드 실패: {e}")
 
 
+# ============================================================
+# 추론 실행기 설정
+# ============================================================
+# CPU 바운드 추론을 이벤트 루프 밖에서 실행하여 /health 등이 지연되지 않도록 함
+
+INFERENCE_EXECUTOR = os.getenv("INFERENCE_EXECUTOR", "thread")
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", "2"))
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "16"))
+
+executor = None
+inflight_requests = 0
+
+
+def create_executor():
+    """설정에 따른 추론 실행기 생성 (inline이면 None)"""
+    if INFERENCE_EXECUTOR == "process":
+        # spawn: 워커 프로세스가 app.main을 import하며 모델을 직접 로드
+        return ProcessPoolExecutor(
+            max_workers=INFERENCE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    if INFERENCE_EXECUTOR == "thread":
+        return ThreadPoolExecutor(
+            max_workers=INFERENCE_WORKERS,
+            thread_name_prefix="inference"
+        )
+    if INFERENCE_EXECUTOR == "inline":
+        return None
+    raise ValueError(
+        f"Unsupported INFERENCE_EXECUTOR: {INFERENCE_EXECUTOR} "
+        f"(supported: thread, process, inline)"
+    )
+
+
+def run_inference(input_data: np.ndarray):
+    """
+    추론 수행 (실행기 워커에서 호출)
+
+    predict_proba 한 번으로 클래스(argmax)와 신뢰도를 함께 계산
+    (predict + predict_proba 는 모든 트리를 두 번 순회함)
+
+    Returns:
+        (예측 품종 이름 배열, 신뢰도 배열)
+    """
+    probabilities = model.predict_proba(input_data)
+    class_index = probabilities.argmax(axis=1)
+    confidences = probabilities[np.arange(len(class_index)), class_index]
+    return SPECIES_NAMES[class_index], confidences
+
+
+def build_batch_response(species: np.ndarray, confidences: np.ndarray) -> dict:
+    """
+    배치 예측 응답 본문 생성
+
+    행마다 PredictionResponse 객체를 만들지 않고 배열을 한 번에 변환
+    """
+    return {
+        "predictions": [
+            {"prediction": name, "confidence": confidence}
+            for name, confidence in zip(species.tolist(), confidences.tolist())
+        ]
+    }
+
+
+async def submit_inference(input_data: np.ndarray):
+    """
+    추론 작업을 실행기에 제출
+
+    실행 중 + 대기 중 요청이 INFERENCE_WORKERS + INFERENCE_MAX_QUEUE 이상이면
+    큐에 쌓지 않고 즉시 503을 반환 (backpressure)
+
+    Raises:
+        HTTPException: 추론 큐가 가득 찬 경우 (503)
+    """
+    global inflight_requests
+
+    if inflight_requests >= INFERENCE_WORKERS + INFERENCE_MAX_QUEUE:
+        logger.warning(f"추론 큐 포화: {inflight_requests}개 요청 처리 중")
+        raise HTTPException(
+            status_code=503,
+            detail="Inference queue is full. Please retry later.",
+            headers={"Retry-After": "1"}
+        )
+
+    inflight_requests += 1
+    try:
+        if executor is None:
+            return run_inference(input_data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, run_inference, input_data)
+    finally:
+        inflight_requests -= 1
+
+
 # ============================================================
 # Pydantic 모델 정의
 # ============================================================
@@ -198,12 +305,11 @@ async def predict(features: IrisFeatures):
         ]])
         
         # 예측
-        prediction = model.predict(input_data)[0]
-        probabilities = model.predict_proba(input_data)[0]
+        species, confidences = await submit_inference(input_data)
         
         result = PredictionResponse(
-            prediction=IRIS_SPECIES[prediction],
-            confidence=float(probabilities[prediction])
+            prediction=species[0],
+            confidence=float(confidences[0])
         )
         
         logger.info(
@@ -213,6 +319,8 @@ async def predict(features: IrisFeatures):
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"예측 중 오류 발생: {e}")
         raise HTTPException(
@@ -252,21 +360,15 @@ async def predict_batch(features_list: List[IrisFeatures]):
         ])
         
         # 배치 예측
-        predictions = model.predict(input_data)
-        probabilities = model.predict_proba(input_data)
-        
-        # 결과 생성
-        results = []
-        for pred, probs in zip(predictions, probabilities):
-            results.append(PredictionResponse(
-                prediction=IRIS_SPECIES[pred],
-                confidence=float(probs[pred])
-            ))
+        species, confidences = await submit_inference(input_data)
         
-        logger.info(f"배치 예측 성공: {len(results)}개 샘플")
+        logger.info(f"배치 예측 성공: {len(species)}개 샘플")
         
-        return BatchPredictionResponse(predictions=results)
+        # 결과 생성 (response_model 재검증 없이 바로 직렬화)
+        return JSONResponse(content=build_batch_response(species, confidences))
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"배치 예측 중 오류 발생: {e}")
         raise HTTPException(
@@ -282,10 +384,17 @@ async def predict_batch(features_list: List[IrisFeatures]):
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행"""
+    global executor
+    executor = create_executor()
+    
     logger.info("=" * 60)
     logger.info("  Iris Classification API 시작")
     logger.info("=" * 60)
     logger.info(f"모델 로드 상태: {'✅ 성공' if MODEL_LOADED else '❌ 실패'}")
+    logger.info(
+        f"추론 실행기: {INFERENCE_EXECUTOR} "
+        f"(workers={INFERENCE_WORKERS}, max_queue={INFERENCE_MAX_QUEUE})"
+    )
     logger.info("API 문서: http://localhost:8000/docs")
     logger.info("=" * 60)
 
@@ -293,4 +402,6 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
+    if executor is not None:
+        executor.shutdown(wait=False)
     logger.info("Iris Classification API 종료")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Lab 2-1: 배치 예측 처리량 벤치마크
+==================================
+
+/predict/batch 의 추론 + 응답 생성 경로를 배치 크기별로 비교합니다.
+
+    - before: predict() + predict_proba() 두 번 순회, 행마다 PredictionResponse 생성
+    - after : predict_proba() 한 번 순회 (argmax), 배열 기반 응답 생성
+
+사용법:
+    python train_model.py                 # model.joblib 생성
+    python benchmarks/batch_throughput.py
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.main import (  # noqa: E402
+    IRIS_SPECIES,
+    BatchPredictionResponse,
+    PredictionResponse,
+    build_batch_response,
+    model,
+    run_inference,
+)
+
+BATCH_SIZES = (1, 32, 256, 4096)
+
+
+def before(input_data):
+    """이전 구현: 두 번 순회 + 행 단위 응답 객체 생성"""
+    predictions = model.predict(input_data)
+    probabilities = model.predict_proba(input_data)
+
+    results = []
+    for pred, probs in zip(predictions, probabilities):
+        results.append(PredictionResponse(
+            prediction=IRIS_SPECIES[pred],
+            confidence=float(probs[pred])
+        ))
+    return json.dumps(BatchPredictionResponse(predictions=results).model_dump())
+
+
+def after(input_data):
+    """현재 구현: 한 번 순회 + 배열 기반 응답 생성"""
+    species, confidences = run_inference(input_data)
+    return json.dumps(build_batch_response(species, confidences))
+
+
+def measure(fn, input_data, min_seconds):
+    """초당 요청 수 측정"""
+    fn(input_data)  # 워밍업
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        fn(input_data)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return iterations / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/predict/batch throughput benchmark")
+    parser.add_argument("--min-seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    if model is None:
+        print("❌ model.joblib 이 없습니다. 먼저 python train_model.py 를 실행하세요.")
+        return 1
+
+    rng = np.random.RandomState(42)
+    low = np.array([4.0, 2.0, 1.0, 0.1])
+    high = np.array([8.0, 4.5, 7.0, 2.5])
+
+    print("=" * 60)
+    print("  Lab 2-1: /predict/batch throughput (requests/sec)")
+    print("=" * 60)
+    print(f"  {'batch':>6} {'before':>12} {'after':>12} {'speedup':>9}")
+    print(f"  {'-' * 42}")
+
+    for batch_size in BATCH_SIZES:
+        input_data = low + rng.rand(batch_size, 4) * (high - low)
+
+        before_rps = measure(before, input_data, args.min_seconds)
+        after_rps = measure(after, input_data, args.min_seconds)
+
+        print(
+            f"  {batch_size:>6} {before_rps:>12.1f} {after_rps:>12.1f} "
+            f"{after_rps / before_rps:>8.2f}x"
+        )
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Lab 2-1: /health 지연시간 벤치마크 (배치 부하 중)
+=================================================
+
+/predict/batch 에 지속적인 부하를 주는 동안 /health 응답 지연시간(p50/p99)을 측정합니다.
+추론이 이벤트 루프를 막으면 /health 가 배치 추론 뒤에 줄을 서게 되어 p99가 크게 증가합니다.
+
+사용법:
+    # 서버 실행 (실행기 설정별로 비교)
+    INFERENCE_EXECUTOR=inline uvicorn app.main:app --port 8000
+    INFERENCE_EXECUTOR=thread uvicorn app.main:app --port 8000
+
+    # 벤치마크 실행
+    python benchmarks/health_latency_under_load.py --url http://localhost:8000
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+
+def make_batch(batch_size):
+    """임의의 Iris 배치 요청 본문 생성"""
+    rng = random.Random(42)
+    return json.dumps([
+        {
+            "sepal_length": round(rng.uniform(4.0, 8.0), 1),
+            "sepal_width": round(rng.uniform(2.0, 4.5), 1),
+            "petal_length": round(rng.uniform(1.0, 7.0), 1),
+            "petal_width": round(rng.uniform(0.1, 2.5), 1)
+        }
+        for _ in range(batch_size)
+    ]).encode()
+
+
+def load_worker(url, body, stop_event, counters):
+    """/predict/batch 부하 생성"""
+    while not stop_event.is_set():
+        request = urllib.request.Request(
+            f"{url}/predict/batch",
+            data=body,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+            counters["ok"] += 1
+        except urllib.error.HTTPError as e:
+            counters[str(e.code)] = counters.get(str(e.code), 0) + 1
+        except Exception:
+            counters["error"] += 1
+
+
+def probe_health(url, duration, interval):
+    """/health 지연시간 측정 (밀리초 리스트)"""
+    latencies = []
+    end_time = time.perf_counter() + duration
+    while time.perf_counter() < end_time:
+        start = time.perf_counter()
+        with urllib.request.urlopen(f"{url}/health", timeout=60) as response:
+            response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(interval)
+    return latencies
+
+
+def summarize(name, latencies):
+    """지연시간 요약 출력"""
+    values = np.array(latencies)
+    print(
+        f"  {name:<14} n={len(values):<5} "
+        f"p50={np.percentile(values, 50):8.2f} ms  "
+        f"p99={np.percentile(values, 99):8.2f} ms  "
+        f"max={values.max():8.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/health latency under /predict/batch load")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("  Lab 2-1: /health latency under batch load")
+    print("=" * 60)
+    print(f"  URL: {args.url}")
+    print(f"  batch_size={args.batch_size}, concurrency={args.concurrency}")
+    print()
+
+    try:
+        idle = probe_health(args.url, duration=min(3.0, args.duration), interval=args.interval)
+    except Exception as e:
+        print(f"❌ 서버 연결 실패: {e}", file=sys.stderr)
+        return 1
+
+    body = make_batch(args.batch_size)
+    stop_event = threading.Event()
+    counters = {"ok": 0, "error": 0}
+    workers = [
+        threading.Thread(
+            target=load_worker,
+            args=(args.url, body, stop_event, counters),
+            daemon=True
+        )
+        for _ in range(args.concurrency)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        loaded = probe_health(args.url, duration=args.duration, interval=args.interval)
+    finally:
+        stop_event.set()
+        for worker in workers:
+            worker.join(timeout=60)
+
+    summarize("idle", idle)
+    summarize("under load", loaded)
+    print()
+    print(f"  /predict/batch 응답: {counters}")
+    print(f"  /predict/batch 처리량: {counters['ok'] / args.duration:.2f} req/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Test package for Iris serving API"""
@@ -0,0 +1,9 @@
+"""
+Pytest configuration and shared fixtures
+"""
+
+import sys
+import os
+
+# Add app to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,106 @@
+"""
+Test cases for Iris serving API (backpressure, event loop responsiveness)
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+SAMPLE = {
+    "sepal_length": 5.1,
+    "sepal_width": 3.5,
+    "petal_length": 1.4,
+    "petal_width": 0.2
+}
+
+
+@pytest.fixture
+def blocked_client(monkeypatch):
+    """
+    추론이 release 될 때까지 멈추는 클라이언트 (워커 1개, 대기 큐 0)
+
+    Returns:
+        (TestClient, 추론 시작 이벤트, 추론 해제 이벤트)
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_inference(input_data):
+        started.set()
+        release.wait(timeout=10)
+        return np.array(["setosa"] * len(input_data)), np.ones(len(input_data))
+
+    monkeypatch.setattr(main, "MODEL_LOADED", True)
+    monkeypatch.setattr(main, "run_inference", blocking_inference)
+    monkeypatch.setattr(main, "INFERENCE_EXECUTOR", "thread")
+    monkeypatch.setattr(main, "INFERENCE_WORKERS", 1)
+    monkeypatch.setattr(main, "INFERENCE_MAX_QUEUE", 0)
+
+    with TestClient(main.app) as client:
+        yield client, started, release
+        release.set()
+
+
+def start_request(client):
+    """백그라운드 스레드에서 /predict 호출 (응답은 반환 리스트에 저장)"""
+    responses = []
+    thread = threading.Thread(
+        target=lambda: responses.append(client.post("/predict", json=SAMPLE))
+    )
+    thread.start()
+    return thread, responses
+
+
+class TestBackpressure:
+    """추론 큐 포화 테스트"""
+
+    def test_full_queue_returns_503_with_retry_after(self, blocked_client):
+        """워커와 대기 큐가 가득 차면 즉시 503 + Retry-After"""
+        client, started, release = blocked_client
+        thread, responses = start_request(client)
+        assert started.wait(timeout=5)
+
+        rejected = client.post("/predict", json=SAMPLE)
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "1"
+
+        rejected = client.post("/predict/batch", json=[SAMPLE, SAMPLE])
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "1"
+
+        release.set()
+        thread.join(timeout=5)
+        assert responses[0].status_code == 200
+        assert main.inflight_requests == 0
+
+        # 큐가 비면 다시 처리
+        assert client.post("/predict", json=SAMPLE).status_code == 200
+
+
+class TestEventLoop:
+    """이벤트 루프 응답성 테스트"""
+
+    def test_health_responsive_during_inference(self, blocked_client):
+        """추론이 실행 중이어도 /health는 바로 응답"""
+        client, started, release = blocked_client
+        thread, responses = start_request(client)
+        assert started.wait(timeout=5)
+
+        start = time.perf_counter()
+        response = client.get("/health")
+        elapsed = time.perf_counter() - start
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+        assert elapsed < 1.0
+        assert main.inflight_requests == 1
+        assert not responses
+
+        release.set()
+        thread.join(timeout=5)
+        assert responses[0].status_code == 200
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 모델 아티팩트 형식 벤치마크
+====================================
+
+CaliforniaHousingModel.save()의 형식(full / compact)과 압축 수준별 파일 크기,
+load() 시간, 원본 대비 최대 예측 오차를 비교합니다.
+압축하지 않은 파일은 load(mmap_mode="r")로 memory-map 하여 로드합니다.
+memory-map은 로드 시간만 줄이며, 트리는 어느 형식이든 로드 후 프로세스마다
+따로 메모리에 올라가므로 워커 간 상주 메모리 공유 효과는 없습니다.
+
+사용법:
+    python benchmarks/bench_artifact_format.py
+    python benchmarks/bench_artifact_format.py --model gradient_boosting --compress 0 3 9
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.model.trainer import ARTIFACT_FORMATS, CaliforniaHousingModel  # noqa: E402
+
+
+def measure_load(path, mmap_mode, repeat):
+    """(로드된 모델, 최소 로드 시간 초) - 첫 로드는 페이지 캐시 워밍업으로 제외"""
+    CaliforniaHousingModel.load(path, mmap_mode=mmap_mode)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model = CaliforniaHousingModel.load(path, mmap_mode=mmap_mode)
+        best = min(best, time.perf_counter() - start)
+    return model, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model artifact format benchmark")
+    parser.add_argument("--model", default="random_forest",
+                        choices=list(CaliforniaHousingModel.SUPPORTED_MODELS))
+    parser.add_argument("--rows", type=int, default=16_512)
+    parser.add_argument("--compress", type=int, nargs="+", default=[0, 3, 9])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # California Housing 학습 세트와 같은 크기의 합성 데이터
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(args.rows, 8))
+    y = (
+        2.0 * X[:, 0] + np.sin(X[:, 1]) + 0.5 * X[:, 2] * X[:, 3]
+        + rng.normal(0, 0.3, args.rows)
+    )
+
+    model = CaliforniaHousingModel(model_type=args.model)
+    model.train(X, y, train_metrics="none")
+    expected = model.predict(X)
+
+    print("=" * 72)
+    print(f"  Lab 3-2: artifact formats ({args.model}, {args.rows} training rows)")
+    print("=" * 72)
+    print(
+        f"  {'format':<10} {'compress':>8} {'mmap':>6} {'size':>10} {'load':>10} "
+        f"{'max |Δpred|':>14}"
+    )
+    print(f"  {'-' * 64}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for artifact_format in ARTIFACT_FORMATS:
+            for compress in args.compress:
+                path = os.path.join(directory, f"{artifact_format}-{compress}.joblib")
+                model.save(path, artifact_format=artifact_format, compress=compress)
+
+                mmap_mode = "r" if compress == 0 else None
+                loaded, seconds = measure_load(path, mmap_mode, args.repeat)
+                error = np.abs(loaded.predict(X) - expected).max()
+
+                print(
+                    f"  {artifact_format:<10} {compress:>8} {mmap_mode or '-':>6} "
+                    f"{os.path.getsize(path) / 2 ** 20:>8.2f}MB {seconds * 1000:>8.1f}ms "
+                    f"{error:>14.2e}"
+                )
+
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
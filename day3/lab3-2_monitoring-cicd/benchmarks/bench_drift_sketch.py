@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 스케치 기준 분포 정확도/메모리 벤치마크
+================================================
+
+기준 데이터를 KLL 스케치로 요약했을 때의 메모리와 KS 검정 정확도를
+원본을 보관하는 정확 KS 검정과 비교합니다.
+
+    - memory  : 특성당 보관 바이트 (원본은 rows × 8 바이트)
+    - rank err: 추정 누적 분포의 최대 순위 오차
+    - |ΔD|    : 정확 KS 통계량 대비 최대 절대 오차
+    - agree   : 유의수준 0.05 드리프트 판정 일치율 (평균 이동 0~0.1 윈도우)
+
+사용법:
+    python benchmarks/bench_drift_sketch.py
+    python benchmarks/bench_drift_sketch.py --rows 5000000 --window 5000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.monitoring.drift import DriftDetector  # noqa: E402
+
+SKETCH_KS = (50, 100, 200, 400, 800)
+SHIFTS = (0.0, 0.02, 0.05, 0.1)
+BATCH_ROWS = 10_000
+
+
+def build(detector, reference):
+    """기준 분포 설정 (스케치는 배치 단위 스트리밍 입력)"""
+    start = time.perf_counter()
+    if detector.sketch_k is None:
+        detector.set_reference(reference)
+    else:
+        detector.set_reference(reference[:BATCH_ROWS])
+        for start_row in range(BATCH_ROWS, len(reference), BATCH_ROWS):
+            detector.update_reference(reference[start_row:start_row + BATCH_ROWS])
+    return time.perf_counter() - start
+
+
+def evaluate(detector, windows):
+    """윈도우별 (통계량, 드리프트 판정), 평균 감지 시간"""
+    start = time.perf_counter()
+    outcomes = []
+    for window in windows:
+        _, results = detector.detect_drift(window)
+        outcomes.append((
+            np.array([r.statistic for r in results]),
+            np.array([r.drift_detected for r in results])
+        ))
+    return outcomes, (time.perf_counter() - start) / len(windows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sketch reference accuracy/memory benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="기준 데이터 행 수")
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--window", type=int, default=2_000, help="현재 윈도우 행 수")
+    parser.add_argument("--trials", type=int, default=5, help="이동량별 윈도우 수")
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+    reference = rng.randn(args.rows, args.features)
+    windows = [
+        rng.randn(args.window, args.features) + shift
+        for shift in SHIFTS for _ in range(args.trials)
+    ]
+    grid = np.tile(np.linspace(-3, 3, 121)[:, None], (1, args.features))
+    exact_cdf = np.stack([
+        np.searchsorted(np.sort(reference[:, j]), grid[:, j], side="right") / args.rows
+        for j in range(args.features)
+    ], axis=1)
+
+    exact = DriftDetector()
+    exact_build = build(exact, reference)
+    expected, exact_detect = evaluate(exact, windows)
+
+    print("=" * 78)
+    print(
+        f"  Lab 3-2: sketch reference ({args.rows} rows x {args.features} features, "
+        f"window {args.window})"
+    )
+    print("=" * 78)
+    print(
+        f"  {'k':>6} {'bytes/feat':>11} {'build(s)':>9} {'detect(ms)':>11} "
+        f"{'rank err':>9} {'|dD|':>8} {'agree':>7}"
+    )
+    print(f"  {'-' * 68}")
+    print(
+        f"  {'exact':>6} {args.rows * 8:>11} {exact_build:>9.2f} "
+        f"{exact_detect * 1000:>11.1f} {0:>9.4f} {0:>8.4f} {1:>7.1%}"
+    )
+
+    for k in SKETCH_KS:
+        detector = DriftDetector(sketch_k=k)
+        build_s = build(detector, reference)
+        actual, detect_s = evaluate(detector, windows)
+
+        sketch = detector.reference_sketch
+        rank_error = np.abs(sketch.cdf(grid) - exact_cdf).max()
+        stat_error = max(np.abs(a[0] - e[0]).max() for a, e in zip(actual, expected))
+        agree = np.mean([a[1] == e[1] for a, e in zip(actual, expected)])
+
+        print(
+            f"  {k:>6} {sketch.size_bytes // args.features:>11} {build_s:>9.2f} "
+            f"{detect_s * 1000:>11.1f} {rank_error:>9.4f} {stat_error:>8.4f} {agree:>7.1%}"
+        )
+
+    print("=" * 78)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
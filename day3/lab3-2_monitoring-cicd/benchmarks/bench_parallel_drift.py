@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 병렬 드리프트 검정 벤치마크
+====================================
+
+DriftDetector(n_jobs=...)의 특성 샤드 병렬 KS 검정 wall time을 특성 수별로 비교합니다.
+기준 데이터는 메모리 매핑 .npy로 공유되므로 워커 수가 늘어도 작업마다 피클링되지 않습니다.
+첫 호출(워커 기동, 기준 데이터 기록)은 워밍업으로 제외합니다.
+
+사용법:
+    python benchmarks/bench_parallel_drift.py
+    python benchmarks/bench_parallel_drift.py --jobs 1 2 4 8 --features 8 100 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.monitoring.drift import DriftDetector  # noqa: E402
+
+FEATURE_COUNTS = (8, 100, 1000)
+
+
+def measure(fn, *args, min_seconds):
+    """호출당 평균 시간 (초)"""
+    fn(*args)  # 워밍업
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        fn(*args)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel drift detection benchmark")
+    parser.add_argument("--reference-rows", type=int, default=50_000)
+    parser.add_argument("--window-rows", type=int, default=5_000)
+    parser.add_argument("--features", type=int, nargs="+", default=list(FEATURE_COUNTS))
+    parser.add_argument(
+        "--jobs", type=int, nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1})
+    )
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+
+    print("=" * 72)
+    print(
+        f"  Lab 3-2: parallel KS drift ({args.reference_rows} reference rows, "
+        f"{args.window_rows} window rows, {os.cpu_count()} CPUs)"
+    )
+    print("=" * 72)
+    print(f"  {'features':>8} " + " ".join(f"{f'n_jobs={n}':>11}" for n in args.jobs))
+    print(f"  {'-' * (9 + 12 * len(args.jobs))}")
+
+    for n_features in args.features:
+        reference = rng.randn(args.reference_rows, n_features)
+        current = rng.randn(args.window_rows, n_features) + 0.01
+
+        timings = []
+        for n_jobs in args.jobs:
+            detector = DriftDetector(n_jobs=n_jobs)
+            detector.set_reference(reference)
+            timings.append(measure(detector.detect_drift, current, min_seconds=args.min_seconds))
+            detector.close()
+
+        print(f"  {n_features:>8} " + " ".join(f"{t * 1000:>9.1f}ms" for t in timings))
+
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
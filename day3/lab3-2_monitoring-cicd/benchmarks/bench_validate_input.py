@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 입력 검증 비용 벤치마크
+================================
+
+/predict 입력 검증을 행 수별로 비교합니다.
+
+    - before: 인스턴스마다 len() + isinstance() 를 도는 Python 루프
+    - after : ndarray 변환 1회 + 형상/dtype/np.isfinite/특성 범위 검사
+
+사용법:
+    python benchmarks/bench_validate_input.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.serving.validation import validate_array  # noqa: E402
+
+ROW_COUNTS = (1, 1_000, 100_000)
+
+
+def before(instances):
+    """이전 구현: 요소 단위 Python 루프"""
+    if not instances:
+        return False
+    for instance in instances:
+        if len(instance) != 8:
+            return False
+        if not all(isinstance(x, (int, float)) for x in instance):
+            return False
+    return True
+
+
+def after(instances, feature_ranges):
+    """현재 구현: ndarray 변환 후 벡터 검사"""
+    return validate_array(instances, feature_ranges=feature_ranges)
+
+
+def measure(fn, *args, min_seconds):
+    """호출당 평균 시간 (마이크로초)"""
+    fn(*args)  # 워밍업
+    iterations = 0
+    start = time.perf_counter()
+    while True:
+        fn(*args)
+        iterations += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="validate_input cost benchmark")
+    parser.add_argument("--min-seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+    feature_ranges = np.vstack([np.full(8, -1.0), np.full(8, 2.0)])
+
+    print("=" * 72)
+    print("  Lab 3-2: input validation cost (us per request)")
+    print("=" * 72)
+    print(
+        f"  {'rows':>8} {'before':>12} {'after(list)':>12} "
+        f"{'after(array)':>13} {'speedup':>9}"
+    )
+    print(f"  {'-' * 58}")
+
+    for rows in ROW_COUNTS:
+        X = rng.rand(rows, 8)
+        instances = X.tolist()
+
+        before_us = measure(before, instances, min_seconds=args.min_seconds)
+        # JSON 경로: 리스트 → ndarray 변환 비용 포함
+        list_us = measure(after, instances, feature_ranges, min_seconds=args.min_seconds)
+        # 바이너리 경로: 이미 ndarray
+        array_us = measure(after, X, feature_ranges, min_seconds=args.min_seconds)
+
+        print(
+            f"  {rows:>8} {before_us:>12.1f} {list_us:>12.1f} "
+            f"{array_us:>13.1f} {before_us / list_us:>8.2f}x"
+        )
+
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
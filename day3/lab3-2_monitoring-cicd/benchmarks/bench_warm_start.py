@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: 증분(warm start) 재학습 벤치마크
+========================================
+
+Drift 이후 재학습 방식별 학습 시간과 최근 분포 테스트 데이터 정확도를 비교합니다.
+
+- full retrain: 이력 + 최근 데이터 전체로 처음부터 학습
+- warm start: 최근 데이터로 트리만 추가 (CaliforniaHousingModel.update)
+- warm start + drop: 트리를 추가하고 가장 오래된 트리를 제거해 트리 수 유지 (random_forest)
+- no retrain: 기존 모델 그대로
+
+데이터는 California Housing과 같은 8개 특성의 합성 회귀 데이터이며, 최근 데이터는
+일부 특성 분포와 타깃 관계가 이동한 상태입니다.
+
+사용법:
+    python benchmarks/bench_warm_start.py
+    python benchmarks/bench_warm_start.py --history-rows 100000 --recent-rows 5000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.model.trainer import CaliforniaHousingModel, WARM_START_MODELS  # noqa: E402
+
+
+def make_data(rng, n_rows, shift):
+    """합성 회귀 데이터 (shift만큼 특성 분포와 타깃 관계 이동)"""
+    X = rng.normal(size=(n_rows, 8))
+    X[:, 0] += shift
+    y = (
+        2.0 * X[:, 0] + np.sin(X[:, 1]) + 0.5 * X[:, 2] * X[:, 3]
+        + shift * X[:, 4] + rng.normal(0, 0.3, n_rows)
+    )
+    return X, y
+
+
+def timed(fn):
+    """(결과, 소요 시간 초)"""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-start retraining benchmark")
+    parser.add_argument("--history-rows", type=int, default=50_000)
+    parser.add_argument("--recent-rows", type=int, default=5_000)
+    parser.add_argument("--test-rows", type=int, default=5_000)
+    parser.add_argument("--shift", type=float, default=1.0)
+    parser.add_argument("--new-estimators", type=int, default=20)
+    parser.add_argument(
+        "--models", nargs="+", choices=WARM_START_MODELS, default=list(WARM_START_MODELS)
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    X_history, y_history = make_data(rng, args.history_rows, 0.0)
+    X_recent, y_recent = make_data(rng, args.recent_rows, args.shift)
+    X_test, y_test = make_data(rng, args.test_rows, args.shift)
+    X_all = np.vstack([X_history, X_recent])
+    y_all = np.concatenate([y_history, y_recent])
+
+    print("=" * 72)
+    print(
+        f"  Lab 3-2: warm-start retraining ({args.history_rows} history rows, "
+        f"{args.recent_rows} recent rows, +{args.new_estimators} trees)"
+    )
+    print("=" * 72)
+    print(f"  {'model':<18} {'strategy':<18} {'trees':>6} {'fit':>10} {'test MAE':>10}")
+    print(f"  {'-' * 66}")
+
+    for model_type in args.models:
+        base = CaliforniaHousingModel(model_type=model_type)
+        base.train(X_history, y_history, train_metrics="none")
+        n_trees = len(base.model.estimators_)
+
+        def warm_start(max_estimators=None):
+            model = CaliforniaHousingModel(model_type=model_type)
+            model.train(X_history, y_history, train_metrics="none")
+            _, seconds = timed(lambda: model.update(
+                X_recent, y_recent,
+                n_new_estimators=args.new_estimators,
+                max_estimators=max_estimators
+            ))
+            return model, seconds
+
+        full = CaliforniaHousingModel(model_type=model_type)
+        _, full_seconds = timed(lambda: full.train(X_all, y_all, train_metrics="none"))
+
+        results = [
+            ("no retrain", base, 0.0),
+            ("full retrain", full, full_seconds),
+            ("warm start", *warm_start())
+        ]
+        if model_type == "random_forest":
+            results.append(("warm start + drop", *warm_start(max_estimators=n_trees)))
+
+        for strategy, model, seconds in results:
+            mae = model.evaluate(X_test, y_test)["mae"]
+            print(
+                f"  {model_type:<18} {strategy:<18} {len(model.model.estimators_):>6} "
+                f"{seconds * 1000:>8.0f}ms {mae:>10.4f}"
+            )
+
+    print("=" * 72)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Lab 3-2: Parquet 데이터셋 Drift 감지 스크립트
+
+ETL 랩의 Bronze/Silver/Gold 레이아웃(Parquet 디렉토리)을 전체 로드하지 않고
+필요한 열만 배치 단위로 읽어 기준/현재 데이터셋의 Drift를 비교합니다.
+S3 대신 로컬 디렉토리도 같은 방식으로 사용할 수 있습니다.
+
+사용법:
+    python scripts/6_detect_drift_parquet.py data/processed/customers_cleaned/ data/curated/customers/
+    python scripts/6_detect_drift_parquet.py \\
+        s3://mlops-training-user01/processed/customers_cleaned/ \\
+        s3://mlops-training-user01/curated/customer_features/ --method psi
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.monitoring.drift import DEFAULT_BINS, METHODS  # noqa: E402
+from src.monitoring.parquet import DEFAULT_BATCH_ROWS, detect_drift_parquet  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parquet 데이터셋 Drift 감지")
+    parser.add_argument("reference", help="기준 데이터셋 경로 (로컬 디렉토리 또는 s3://)")
+    parser.add_argument("current", help="현재 데이터셋 경로 (로컬 디렉토리 또는 s3://)")
+    parser.add_argument("--columns", nargs="+", help="비교할 열 (기본: 공통 숫자형 열)")
+    parser.add_argument("--method", choices=METHODS, default="ks", help="Drift 지표")
+    parser.add_argument("--bins", type=int, default=DEFAULT_BINS, help="열별 구간 수")
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS, help="배치당 행 수")
+    parser.add_argument("--significance", type=float, default=0.05, help="유의 수준")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    has_drift, results = detect_drift_parquet(
+        args.reference,
+        args.current,
+        columns=args.columns,
+        method=args.method,
+        significance_level=args.significance,
+        n_bins=args.bins,
+        batch_rows=args.batch_rows
+    )
+
+    if args.json:
+        print(json.dumps({
+            "drift_detected": has_drift,
+            "features": [r.to_dict() for r in results]
+        }, indent=2))
+    else:
+        print("=" * 60)
+        print(f"  Parquet Drift Detection ({args.method})")
+        print("=" * 60)
+        for r in results:
+            p_value = "-" if r.p_value is None else f"{r.p_value:.4f}"
+            status = "DRIFT" if r.drift_detected else "OK"
+            print(
+                f"  {r.feature_name:<24} stat={r.statistic:.4f}  p={p_value:<8} "
+                f"{r.drift_level.value:<8} {status}"
+            )
+        print("-" * 60)
+        drifted = sum(r.drift_detected for r in results)
+        print(f"  Drifted features: {drifted}/{len(results)}")
+
+    return 1 if has_drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
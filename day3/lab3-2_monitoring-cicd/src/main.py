@@ -7,6 +7,7 @@ KServe/Knative 환경에서 모델 서빙을 위한 진입점
 
 import os
 import sys
+import time
 import logging
 
 # Configure logging
@@ -21,31 +22,105 @@ def main():
     """서버 시작"""
     try:
         import uvicorn
-        from src.model.trainer import train_model
+        from src.model.trainer import load_or_train_model
         from src.serving.api import create_app
         
         # 환경 변수에서 설정 읽기
         port = int(os.environ.get("PORT", 8080))
         model_name = os.environ.get("MODEL_NAME", "california-housing")
         model_version = os.environ.get("MODEL_VERSION", "v1.0")
+        backend = os.environ.get("MODEL_BACKEND", "sklearn")
+        batch_max_size = int(os.environ.get("BATCH_MAX_SIZE", 0))
+        batch_max_wait_us = int(os.environ.get("BATCH_MAX_WAIT_US", 2000))
+        validate_ranges = os.environ.get("VALIDATE_FEATURE_RANGES", "0") == "1"
+        model_dir = os.environ.get("MODEL_DIR", "models")
+        memory_budget_mb = int(os.environ.get("MODEL_MEMORY_BUDGET_MB", 0))
+        drift_window_rows = int(os.environ.get("DRIFT_WINDOW_ROWS", 0))
+        drift_emit_every_rows = int(os.environ.get("DRIFT_EMIT_EVERY_ROWS", 1000))
+        model_path = os.environ.get(
+            "MODEL_PATH",
+            os.path.join(model_dir, f"{model_name}-{model_version}.joblib")
+        )
+        drift_baseline_path = os.environ.get(
+            "DRIFT_BASELINE_PATH",
+            os.path.splitext(model_path)[0] + ".baseline.joblib"
+        )
+        
+        # Prometheus 레이블 (scripts/2_query_metrics.py, alert-rules.yaml 쿼리와 동일)
+        metrics_labels = {"model_name": model_name, "version": model_version}
+        for label, env_name in (("user_id", "USER_ID"), ("namespace", "NAMESPACE")):
+            if os.environ.get(env_name):
+                metrics_labels[label] = os.environ[env_name]
         
         logger.info(f"=" * 50)
         logger.info(f"Starting Model Server")
         logger.info(f"  Model: {model_name}")
         logger.info(f"  Version: {model_version}")
+        logger.info(f"  Artifact: {model_path}")
+        logger.info(f"  Backend: {backend}")
+        logger.info(f"  Micro-batching: max_size={batch_max_size}, max_wait_us={batch_max_wait_us}")
+        logger.info(f"  Feature range validation: {validate_ranges}")
+        logger.info(f"  Registry memory budget: {memory_budget_mb or 'unlimited'} MB")
+        logger.info(f"  Streaming drift window: {drift_window_rows or 'disabled'} rows")
         logger.info(f"  Port: {port}")
         logger.info(f"=" * 50)
         
-        # 모델 학습
-        logger.info("Training model...")
-        model, metrics = train_model(model_type="random_forest")
-        logger.info(f"Model trained successfully!")
-        logger.info(f"  MAE: {metrics['mae']:.4f}")
-        logger.info(f"  R²: {metrics['r2']:.4f}")
+        # 모델 로드 (아티팩트가 없을 때만 학습)
+        start_time = time.perf_counter()
+        model, source = load_or_train_model(
+            model_path,
+            model_type="random_forest",
+            model_version=model_version
+        )
+        startup_seconds = time.perf_counter() - start_time
+        logger.info(f"Model ready ({source}) in {startup_seconds:.2f}s")
+        
+        # 스트리밍 드리프트 감지 (기준: 모델 버전별 저장된 기준 분포, 없으면 학습 데이터 전체
+        # 스케치로 생성 - reference_sample은 워밍업/패리티 검사용 256행이라 기준으로 쓰지 않음)
+        drift_detector = None
+        if drift_window_rows > 0:
+            from src.monitoring.drift import load_or_build_baseline
+            from src.monitoring.streaming import StreamingDriftDetector
+            
+            reference = model.reference_sketch
+            if reference is None:
+                # 스케치가 없는 이전 아티팩트: 학습 분할 전체 사용 (로컬 캐시에서 memory-map)
+                reference = model.load_data()[0]
+            baseline, baseline_source = load_or_build_baseline(
+                drift_baseline_path,
+                reference,
+                model.FEATURE_NAMES,
+                model_version=model_version
+            )
+            logger.info(f"Drift baseline ready ({baseline_source}): {drift_baseline_path}")
+            drift_detector = StreamingDriftDetector(
+                window_rows=drift_window_rows,
+                emit_every_rows=drift_emit_every_rows
+            )
+            drift_detector.set_reference_baseline(baseline)
         
         # FastAPI 앱 생성
         logger.info("Creating FastAPI application...")
-        app = create_app(model=model, model_version=model_version)
+        app = create_app(
+            model=model,
+            model_version=model_version,
+            startup_seconds=startup_seconds,
+            batch_max_size=batch_max_size,
+            batch_max_wait_us=batch_max_wait_us,
+            backend=backend,
+            validate_ranges=validate_ranges,
+            metrics_labels=metrics_labels,
+            model_name=model_name,
+            model_dir=model_dir,
+            memory_budget_bytes=memory_budget_mb * 1024 * 1024 or None,
+            drift_detector=drift_detector,
+            backend_options={
+                "onnx_path": os.path.splitext(model_path)[0] + f".{backend}.onnx",
+                "intra_op_threads": int(os.environ.get("ORT_INTRA_OP_THREADS", 1)),
+                "inter_op_threads": int(os.environ.get("ORT_INTER_OP_THREADS", 1)),
+                "parity_tolerance": float(os.environ.get("PARITY_TOLERANCE", 1e-3))
+            }
+        )
         
         if app is None:
             logger.error("Failed to create FastAPI app")
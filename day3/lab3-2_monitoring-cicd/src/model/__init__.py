@@ -1,5 +1,14 @@
 """Model training and inference module"""
 
-from .trainer import CaliforniaHousingModel, train_model
+from .dataset import load_dataset, load_split
+from .trainer import CaliforniaHousingModel, train_model, load_or_train_model
+from .search import search_hyperparameters
 
-__all__ = ["CaliforniaHousingModel", "train_model"]
+__all__ = [
+    "CaliforniaHousingModel",
+    "train_model",
+    "load_or_train_model",
+    "load_dataset",
+    "load_split",
+    "search_hyperparameters"
+]
@@ -0,0 +1,213 @@
+"""
+Dataset Cache Module
+
+California Housing 데이터셋을 한 번만 변환해 .npy로 캐시하고 이후 memory-map으로 로드
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from sklearn.datasets import fetch_california_housing, get_data_home
+from sklearn.model_selection import train_test_split
+
+logger = logging.getLogger(__name__)
+
+DATASET_NAME = "california_housing"
+
+# 캐시 형식 버전 (호환되지 않는 변경 시 증가)
+CACHE_VERSION = 1
+
+
+def default_cache_dir() -> str:
+    """캐시 디렉토리 (DATA_CACHE_DIR, 기본 scikit-learn 데이터 디렉토리 아래 cache/)"""
+    return os.environ.get("DATA_CACHE_DIR", os.path.join(get_data_home(), "cache"))
+
+
+def load_dataset(
+    cache_dir: Optional[str] = None,
+    mmap_mode: Optional[str] = "r",
+    fetch: Callable = fetch_california_housing
+) -> Tuple[np.ndarray, np.ndarray, str]:
+    """
+    캐시된 데이터셋 로드 (없으면 원본을 한 번 변환해 캐시)
+
+    특성/타깃은 내용 해시로 구분된 디렉토리에 .npy로 저장되며, 이후 로드는
+    파싱 없이 memory-map으로 연결된다.
+
+    Args:
+        cache_dir: 캐시 디렉토리 (기본 default_cache_dir())
+        mmap_mode: numpy memory-map 모드 (None이면 메모리로 읽음)
+        fetch: 원본 데이터셋 로더 (data, target 속성을 가진 객체 반환)
+
+    Returns:
+        (특성 (n_samples, n_features), 타깃 (n_samples,), 내용 해시)
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    manifest_path = os.path.join(cache_dir, f"{DATASET_NAME}.json")
+
+    manifest = _read_manifest(manifest_path)
+    if manifest is not None:
+        directory = os.path.join(cache_dir, f"{DATASET_NAME}-{manifest['hash']}")
+        try:
+            X = np.load(os.path.join(directory, "data.npy"), mmap_mode=mmap_mode)
+            y = np.load(os.path.join(directory, "target.npy"), mmap_mode=mmap_mode)
+            return X, y, manifest["hash"]
+        except OSError as e:
+            logger.warning(f"Dataset cache at {directory} is unreadable ({e}), rebuilding")
+
+    dataset = fetch()
+    X = np.ascontiguousarray(dataset.data, dtype=np.float64)
+    y = np.ascontiguousarray(dataset.target, dtype=np.float64)
+    content_hash = dataset_hash(X, y)
+
+    try:
+        directory = os.path.join(cache_dir, f"{DATASET_NAME}-{content_hash}")
+        _write_arrays(directory, {"data": X, "target": y})
+        _write_json(manifest_path, {
+            "cache_version": CACHE_VERSION,
+            "hash": content_hash,
+            "n_samples": int(X.shape[0]),
+            "n_features": int(X.shape[1])
+        })
+        logger.info(f"Dataset cached: {directory}")
+    except OSError as e:
+        logger.warning(f"Could not cache dataset in {cache_dir}: {e}")
+
+    return X, y, content_hash
+
+
+def split_indices(
+    n_samples: int,
+    test_size: float = 0.2,
+    random_state: Optional[int] = 42,
+    cache_dir: Optional[str] = None,
+    content_hash: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    train_test_split과 동일한 학습/테스트 인덱스 (content_hash가 있으면 캐시)
+
+    Args:
+        n_samples: 전체 샘플 수
+        test_size: 테스트 세트 비율
+        random_state: 랜덤 시드 (None이면 캐시하지 않음)
+        cache_dir: 캐시 디렉토리 (기본 default_cache_dir())
+        content_hash: 데이터셋 내용 해시 (None이면 캐시하지 않음)
+
+    Returns:
+        (학습 인덱스, 테스트 인덱스)
+    """
+    if content_hash is None or random_state is None:
+        # random_state=None은 호출마다 다른 분할이어야 하므로 캐시하지 않음
+        return tuple(train_test_split(
+            np.arange(n_samples), test_size=test_size, random_state=random_state
+        ))
+
+    cache_dir = cache_dir or default_cache_dir()
+    directory = os.path.join(
+        cache_dir, f"{DATASET_NAME}-{content_hash}", f"split-{test_size}-{random_state}"
+    )
+    try:
+        return (
+            np.load(os.path.join(directory, "train.npy"), mmap_mode="r"),
+            np.load(os.path.join(directory, "test.npy"), mmap_mode="r")
+        )
+    except OSError:
+        pass
+
+    train_index, test_index = split_indices(n_samples, test_size, random_state)
+    try:
+        _write_arrays(directory, {"train": train_index, "test": test_index})
+    except OSError as e:
+        logger.warning(f"Could not cache split indices in {directory}: {e}")
+    return train_index, test_index
+
+
+def load_split(
+    test_size: float = 0.2,
+    random_state: int = 42,
+    cache_dir: Optional[str] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    캐시된 데이터셋과 분할 인덱스로 학습/테스트 세트 구성
+
+    fetch_california_housing() 후 train_test_split()을 호출한 것과 같은 결과를 반환한다.
+
+    Args:
+        test_size: 테스트 세트 비율
+        random_state: 랜덤 시드
+        cache_dir: 캐시 디렉토리 (기본 default_cache_dir())
+
+    Returns:
+        X_train, X_test, y_train, y_test
+    """
+    X, y, content_hash = load_dataset(cache_dir)
+    train_index, test_index = split_indices(
+        len(X), test_size, random_state, cache_dir, content_hash
+    )
+    return X[train_index], X[test_index], y[train_index], y[test_index]
+
+
+def dataset_hash(X: np.ndarray, y: np.ndarray) -> str:
+    """
+    데이터셋 내용 해시 (형태, dtype, 값 기준)
+
+    Args:
+        X: 특성 배열
+        y: 타깃 배열
+
+    Returns:
+        SHA-256 앞 16자리 16진수
+    """
+    digest = hashlib.sha256()
+    for array in (X, y):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    return digest.hexdigest()[:16]
+
+
+def _read_manifest(path: str) -> Optional[dict]:
+    """캐시 목록 파일 읽기 (없거나 버전이 다르면 None)"""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("cache_version") != CACHE_VERSION:
+        return None
+    return manifest
+
+
+def _write_arrays(directory: str, arrays: dict) -> None:
+    """배열을 임시 디렉토리에 쓴 뒤 한 번에 이동 (동시 실행 시에도 불완전한 캐시 없음)"""
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".tmp-", dir=parent)
+    try:
+        for name, array in arrays.items():
+            np.save(os.path.join(staging, f"{name}.npy"), array)
+        if os.path.isdir(directory):
+            # 분할 인덱스가 같은 디렉토리 아래에 있으므로 기존 디렉토리에는 파일만 이동
+            for name in arrays:
+                os.replace(
+                    os.path.join(staging, f"{name}.npy"),
+                    os.path.join(directory, f"{name}.npy")
+                )
+        else:
+            os.replace(staging, directory)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _write_json(path: str, data: dict) -> None:
+    """JSON 파일 원자적 쓰기"""
+    fd, staging = tempfile.mkstemp(prefix=".tmp-", dir=os.path.dirname(path))
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(staging, path)
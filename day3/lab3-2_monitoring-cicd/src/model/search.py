@@ -0,0 +1,222 @@
+"""
+Hyperparameter Search Module
+
+CaliforniaHousingModel 하이퍼파라미터 탐색 (grid / random / successive halving, 프로세스 병렬)
+"""
+
+import os
+import math
+import time
+import shutil
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+
+from ..shared import load_shared_array, make_shared_dir
+from .trainer import CaliforniaHousingModel, regression_metrics
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("grid", "random", "halving")
+
+# successive halving 기본값: 단계마다 후보를 1/factor로 줄이고 학습 행 수를 factor배 늘림
+DEFAULT_HALVING_FACTOR = 3
+DEFAULT_MIN_RESOURCES = 1000
+
+
+def search_hyperparameters(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    param_grid: Dict[str, list],
+    model_type: str = "random_forest",
+    strategy: str = "grid",
+    n_iter: int = 10,
+    factor: int = DEFAULT_HALVING_FACTOR,
+    min_resources: int = DEFAULT_MIN_RESOURCES,
+    n_jobs: int = 1,
+    random_state: int = 42
+) -> Tuple[CaliforniaHousingModel, List[Dict]]:
+    """
+    하이퍼파라미터 탐색 후 최적 설정으로 전체 학습 데이터 재학습
+
+    후보는 검증 MAE로 비교한다. n_jobs > 1이면 학습/검증 배열을 공유 디렉토리에
+    한 번 저장하고 워커가 memory-map으로 읽으므로 작업마다 배열을 피클링하지 않는다.
+    'halving'은 무작위로 섞은 학습 데이터의 앞부분(min_resources행부터 factor배씩)으로
+    먼저 학습해 상위 1/factor 후보만 다음 단계로 올린다.
+
+    Args:
+        X_train: 학습 데이터 특성
+        y_train: 학습 데이터 타겟
+        X_val: 검증 데이터 특성
+        y_val: 검증 데이터 타겟
+        param_grid: 파라미터 이름 → 후보 값 리스트 (random은 scipy 분포도 가능)
+        model_type: 모델 유형
+        strategy: 탐색 전략 ('grid', 'random', 'halving' - halving 후보는 grid 전체)
+        n_iter: 'random' 후보 수
+        factor: 'halving' 단계별 축소 비율
+        min_resources: 'halving' 첫 단계 학습 행 수
+        n_jobs: 후보 평가 프로세스 수
+        random_state: 후보 샘플링/데이터 섞기 시드
+
+    Returns:
+        (최적 파라미터로 재학습한 모델, 후보별 결과 테이블 - 평가 순서)
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown search strategy: {strategy} (expected one of {STRATEGIES})")
+    if factor < 2:
+        raise ValueError(f"factor must be >= 2, got {factor}")
+
+    if strategy == "random":
+        candidates = list(ParameterSampler(param_grid, n_iter, random_state=random_state))
+    else:
+        candidates = list(ParameterGrid(param_grid))
+    if not candidates:
+        raise ValueError("param_grid produced no candidates")
+
+    # 부분 데이터 학습이 무작위 부분집합이 되도록 한 번 섞음
+    order = np.random.default_rng(random_state).permutation(len(X_train))
+    arrays = {
+        "X_train": np.asarray(X_train, dtype=np.float64)[order],
+        "y_train": np.asarray(y_train, dtype=np.float64)[order],
+        "X_val": np.asarray(X_val, dtype=np.float64),
+        "y_val": np.asarray(y_val, dtype=np.float64)
+    }
+
+    schedule = _schedule(len(candidates), len(X_train), strategy, factor, min_resources)
+    logger.info(
+        f"Hyperparameter search: {strategy}, {len(candidates)} candidates, "
+        f"rungs={[n for _, n in schedule]}, n_jobs={n_jobs}"
+    )
+
+    with _Evaluator(arrays, model_type, n_jobs) as evaluator:
+        table: List[Dict] = []
+        for rung, (n_keep, n_samples) in enumerate(schedule):
+            rows = evaluator.run(candidates, n_samples)
+            for row in rows:
+                row["rung"] = rung
+            table.extend(rows)
+
+            ranked = sorted(range(len(rows)), key=lambda i: rows[i]["val_mae"])
+            candidates = [candidates[i] for i in ranked[:n_keep]]
+
+    best_params = candidates[0]
+    model = CaliforniaHousingModel(model_type=model_type)
+    model.model_params = {**model.model_params, **best_params}
+    # 후보를 평가한 것과 같은 (섞인) 학습 데이터로 재학습
+    model.train(arrays["X_train"], arrays["y_train"], X_val, y_val)
+
+    logger.info(f"Best parameters: {best_params} (val MAE={model.metrics['val_mae']:.4f})")
+    return model, table
+
+
+def _schedule(
+    n_candidates: int,
+    n_rows: int,
+    strategy: str,
+    factor: int,
+    min_resources: int
+) -> List[Tuple[int, int]]:
+    """단계별 (다음 단계로 남길 후보 수, 학습 행 수) - 마지막 단계는 전체 데이터"""
+    if strategy != "halving":
+        return [(1, n_rows)]
+
+    sizes = [n_candidates]
+    while sizes[-1] > factor:
+        sizes.append(math.ceil(sizes[-1] / factor))
+
+    first = min(n_rows, max(min_resources, n_rows // factor ** (len(sizes) - 1)))
+    return [
+        (keep, n_rows if rung == len(sizes) - 1 else min(n_rows, first * factor ** rung))
+        for rung, keep in enumerate(sizes[1:] + [1])
+    ]
+
+
+class _Evaluator:
+    """후보 평가기 (n_jobs > 1이면 공유 배열 + 프로세스 풀)"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], model_type: str, n_jobs: int):
+        self.arrays = arrays
+        self.model_type = model_type
+        self.n_jobs = n_jobs
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._dir: Optional[str] = None
+        self._paths: Dict[str, str] = {}
+
+    def __enter__(self) -> "_Evaluator":
+        if self.n_jobs > 1:
+            self._dir = make_shared_dir("search-")
+            for name, array in self.arrays.items():
+                self._paths[name] = os.path.join(self._dir, f"{name}.npy")
+                np.save(self._paths[name], array)
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._dir is not None:
+            shutil.rmtree(self._dir, ignore_errors=True)
+
+    def run(self, candidates: List[Dict], n_samples: int) -> List[Dict]:
+        """후보 목록을 n_samples행으로 학습/검증 (입력 순서로 결과 반환)"""
+        if self._pool is None:
+            return [
+                _fit_score(self.model_type, params, n_samples, self.arrays)
+                for params in candidates
+            ]
+
+        futures = [
+            self._pool.submit(_evaluate_shared, self.model_type, params, n_samples, self._paths)
+            for params in candidates
+        ]
+        return [future.result() for future in futures]
+
+
+def _evaluate_shared(
+    model_type: str,
+    params: Dict,
+    n_samples: int,
+    paths: Dict[str, str]
+) -> Dict:
+    """워커: 공유 배열로 후보 하나 평가 (배열은 워커당 한 번만 매핑)"""
+    arrays = {name: load_shared_array(path) for name, path in paths.items()}
+    return _fit_score(model_type, params, n_samples, arrays, single_thread=True)
+
+
+def _fit_score(
+    model_type: str,
+    params: Dict,
+    n_samples: int,
+    arrays: Dict[str, np.ndarray],
+    single_thread: bool = False
+) -> Dict:
+    """후보 하나를 앞 n_samples행으로 학습하고 검증 메트릭과 소요 시간 반환"""
+    model_params = {**CaliforniaHousingModel(model_type=model_type).model_params, **params}
+    if single_thread and "n_jobs" in model_params:
+        # 프로세스 단위로 병렬화하므로 모델 내부 스레드는 1개
+        model_params["n_jobs"] = 1
+
+    start = time.perf_counter()
+    model = CaliforniaHousingModel.SUPPORTED_MODELS[model_type](**model_params)
+    model.fit(arrays["X_train"][:n_samples], arrays["y_train"][:n_samples])
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = model.predict(arrays["X_val"])
+    score_seconds = time.perf_counter() - start
+
+    metrics = regression_metrics(arrays["y_val"], predictions)
+    return {
+        "params": dict(params),
+        "n_samples": int(n_samples),
+        "val_mae": metrics["mae"],
+        "val_rmse": metrics["rmse"],
+        "val_r2": metrics["r2"],
+        "fit_seconds": fit_seconds,
+        "score_seconds": score_seconds
+    }
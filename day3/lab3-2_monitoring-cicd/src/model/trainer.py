@@ -5,19 +5,33 @@ California Housing 데이터셋을 사용한 회귀 모델 학습 및 추론
 """
 
 import os
+import copy
 import logging
+import warnings
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import joblib
-from sklearn.datasets import fetch_california_housing
-from sklearn.model_selection import train_test_split
+import sklearn
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+from ..monitoring.sketch import QuantileSketch
+from .dataset import load_split
 
 logger = logging.getLogger(__name__)
 
+TRAIN_METRICS_MODES = ("auto", "full", "oob", "none")
+
+# 아티팩트 형식 ('full' - 추정기 그대로, 'compact' - 트리 배열을 압축 dtype으로 저장)
+ARTIFACT_FORMATS = ("full", "compact")
+
+# update()로 트리를 이어서 학습할 수 있는 모델 유형
+WARM_START_MODELS = ("random_forest", "gradient_boosting")
+
+# update()에서 n_new_estimators 미지정 시 추가할 트리 비율 (현재 트리 수 대비)
+DEFAULT_UPDATE_FRACTION = 0.2
+
 
 class CaliforniaHousingModel:
     """California Housing 가격 예측 모델"""
@@ -33,6 +47,15 @@ class CaliforniaHousingModel:
         "Population", "AveOccup", "Latitude", "Longitude"
     ]
 
+    # 저장 포맷 버전 (호환되지 않는 변경 시 증가)
+    ARTIFACT_VERSION = 2
+
+    # 아티팩트에 함께 저장하는 학습 샘플 수 (백엔드 패리티 검사, 워밍업에 사용)
+    REFERENCE_SAMPLE_SIZE = 256
+
+    # 드리프트 기준 분포용 학습 데이터 스케치 시드 (같은 데이터면 같은 스케치)
+    REFERENCE_SKETCH_SEED = 0
+
     def __init__(
         self,
         model_type: str = "random_forest",
@@ -54,6 +77,11 @@ class CaliforniaHousingModel:
         self.model_type = model_type
         self.model_params = model_params or self._get_default_params(model_type)
         self.model = None
+        self.model_version = None
+        self.reference_sample = None
+        self.reference_sketch = None
+        self.feature_ranges = None
+        self.update_count = 0
         self.is_fitted = False
         self.metrics = {}
 
@@ -84,6 +112,9 @@ class CaliforniaHousingModel:
         """
         California Housing 데이터 로드 및 분할
 
+        데이터셋과 분할 인덱스는 로컬 캐시(DATA_CACHE_DIR)에서 memory-map으로 읽으며,
+        처음 한 번만 원본을 내려받아 변환한다.
+
         Args:
             test_size: 테스트 세트 비율
             random_state: 랜덤 시드
@@ -91,12 +122,7 @@ class CaliforniaHousingModel:
         Returns:
             X_train, X_test, y_train, y_test
         """
-        data = fetch_california_housing()
-        X_train, X_test, y_train, y_test = train_test_split(
-            data.data, data.target,
-            test_size=test_size,
-            random_state=random_state
-        )
+        X_train, X_test, y_train, y_test = load_split(test_size, random_state)
         logger.info(f"Data loaded: train={len(X_train)}, test={len(X_test)}")
         return X_train, X_test, y_train, y_test
 
@@ -105,7 +131,8 @@ class CaliforniaHousingModel:
         X_train: np.ndarray,
         y_train: np.ndarray,
         X_val: Optional[np.ndarray] = None,
-        y_val: Optional[np.ndarray] = None
+        y_val: Optional[np.ndarray] = None,
+        train_metrics: str = "auto"
     ) -> Dict[str, float]:
         """
         모델 학습
@@ -115,33 +142,176 @@ class CaliforniaHousingModel:
             y_train: 학습 데이터 타겟
             X_val: 검증 데이터 특성 (선택)
             y_val: 검증 데이터 타겟 (선택)
+            train_metrics: 학습 메트릭 계산 방식
+                ('full' - 학습 데이터 전체 재예측 (train_*),
+                 'oob' - 랜덤 포레스트 out-of-bag 예측 (oob_*, oob_score=True 필요),
+                 'none' - 계산 안 함, 'auto' - OOB 예측이 있으면 'oob', 없으면 'full')
 
         Returns:
             학습 메트릭
         """
+        if train_metrics not in TRAIN_METRICS_MODES:
+            raise ValueError(
+                f"Unknown train_metrics mode: {train_metrics} "
+                f"(expected one of {TRAIN_METRICS_MODES})"
+            )
+
         model_class = self.SUPPORTED_MODELS[self.model_type]
         self.model = model_class(**self.model_params)
+        self.metrics = {}
+        self.update_count = 0
 
         logger.info(f"Training {self.model_type} model...")
         self.model.fit(X_train, y_train)
         self.is_fitted = True
-
-        # 학습 메트릭 계산
-        train_pred = self.model.predict(X_train)
-        self.metrics["train_mae"] = mean_absolute_error(y_train, train_pred)
-        self.metrics["train_mse"] = mean_squared_error(y_train, train_pred)
-        self.metrics["train_r2"] = r2_score(y_train, train_pred)
+        self.reference_sample = np.array(
+            X_train[:self.REFERENCE_SAMPLE_SIZE], dtype=np.float64
+        )
+        # 드리프트 기준 분포는 학습 데이터 전체의 분위수 스케치로 (크기는 행 수와 무관)
+        self.reference_sketch = QuantileSketch(
+            X_train.shape[1], seed=self.REFERENCE_SKETCH_SEED
+        ).update(X_train)
+        self.feature_ranges = np.vstack([
+            np.min(X_train, axis=0), np.max(X_train, axis=0)
+        ]).astype(np.float64)
+
+        # 학습 메트릭 계산 (OOB 예측이 있으면 학습 데이터 재예측 생략)
+        oob_pred = getattr(self.model, "oob_prediction_", None)
+        if train_metrics == "auto":
+            train_metrics = "oob" if oob_pred is not None else "full"
+        if train_metrics == "oob":
+            if oob_pred is None:
+                raise ValueError("OOB predictions unavailable (set oob_score=True)")
+            self._record_metrics("oob", y_train, oob_pred)
+        elif train_metrics == "full":
+            self._record_metrics("train", y_train, self.model.predict(X_train))
 
         # 검증 메트릭 계산 (제공된 경우)
         if X_val is not None and y_val is not None:
-            val_pred = self.model.predict(X_val)
-            self.metrics["val_mae"] = mean_absolute_error(y_val, val_pred)
-            self.metrics["val_mse"] = mean_squared_error(y_val, val_pred)
-            self.metrics["val_r2"] = r2_score(y_val, val_pred)
+            self._record_metrics("val", y_val, self.model.predict(X_val))
 
-        logger.info(f"Training completed. MAE={self.metrics['train_mae']:.4f}")
+        summary = next(
+            (f" MAE={self.metrics[key]:.4f}" for key in ("train_mae", "oob_mae", "val_mae")
+             if key in self.metrics),
+            ""
+        )
+        logger.info(f"Training completed.{summary}")
         return self.metrics
 
+    def update(
+        self,
+        X_new: np.ndarray,
+        y_new: np.ndarray,
+        n_new_estimators: Optional[int] = None,
+        max_estimators: Optional[int] = None,
+        X_val: Optional[np.ndarray] = None,
+        y_val: Optional[np.ndarray] = None
+    ) -> Dict[str, float]:
+        """
+        최근 데이터로 트리를 추가하는 증분 재학습 (warm_start)
+
+        기존 트리는 그대로 두고 X_new로 학습한 트리만 추가하므로 비용은 전체 이력이
+        아니라 새 데이터 크기에 비례한다. random_forest는 추가한 트리가 기존 트리와
+        평균되고, max_estimators를 지정하면 가장 오래된 트리부터 제거해 전체 트리 수를
+        유지한다. gradient_boosting은 기존 앙상블의 잔차를 새 데이터로 이어서 학습한다
+        (각 단계가 이전 단계에 의존하므로 오래된 단계 제거는 지원하지 않음).
+
+        Args:
+            X_new: 최근 데이터 특성
+            y_new: 최근 데이터 타겟
+            n_new_estimators: 추가할 트리 수 (기본 현재 트리 수의 20%)
+            max_estimators: 업데이트 후 최대 트리 수 (random_forest 전용)
+            X_val: 검증 데이터 특성 (선택)
+            y_val: 검증 데이터 타겟 (선택)
+
+        Returns:
+            업데이트 메트릭 (update_* - 새 데이터, val_* - 검증 데이터)
+
+        Raises:
+            RuntimeError: 학습되지 않은 모델일 때
+            ValueError: warm_start를 지원하지 않는 모델 유형이거나 트리 수가 잘못된 경우
+        """
+        if not self.is_fitted:
+            raise RuntimeError("Model is not fitted. Call train() first.")
+        if self.model_type not in WARM_START_MODELS:
+            raise ValueError(
+                f"Incremental update not supported for {self.model_type} "
+                f"(supported: {WARM_START_MODELS})"
+            )
+
+        n_current = len(self.model.estimators_)
+        if n_new_estimators is None:
+            n_new_estimators = max(1, int(n_current * DEFAULT_UPDATE_FRACTION))
+        if n_new_estimators < 1:
+            raise ValueError(f"n_new_estimators must be >= 1, got {n_new_estimators}")
+
+        if max_estimators is not None:
+            if self.model_type != "random_forest":
+                raise ValueError("max_estimators is only supported for random_forest")
+            if max_estimators < n_new_estimators:
+                raise ValueError(
+                    f"max_estimators ({max_estimators}) must be >= "
+                    f"n_new_estimators ({n_new_estimators})"
+                )
+            n_keep = min(n_current, max_estimators - n_new_estimators)
+            if n_keep < n_current:
+                self.model.estimators_ = self.model.estimators_[n_current - n_keep:]
+                logger.info(f"Dropped {n_current - n_keep} oldest trees")
+            n_current = n_keep
+
+        params = {"warm_start": True, "n_estimators": n_current + n_new_estimators}
+
+        # warm_start는 트리 인덱스 순서로 시드를 뽑으므로 고정 시드 그대로면 새 트리가
+        # 유지된 트리와 같은 부트스트랩/특성 샘플링을 반복함: 업데이트마다 시드 파생
+        self.update_count += 1
+        base_seed = self.model_params.get("random_state")
+        if isinstance(base_seed, (int, np.integer)):
+            params["random_state"] = int(
+                np.random.SeedSequence([int(base_seed), self.update_count]).generate_state(1)[0]
+            )
+        if self.model_type == "random_forest":
+            # 기존 트리의 OOB 예측은 새 데이터로 다시 계산할 수 없음
+            params["oob_score"] = False
+            for name in ("oob_score_", "oob_prediction_"):
+                if hasattr(self.model, name):
+                    delattr(self.model, name)
+
+        logger.info(
+            f"Updating {self.model_type} model: +{n_new_estimators} trees "
+            f"on {len(X_new)} samples ({n_current} kept)"
+        )
+        self.model.set_params(**params)
+        try:
+            self.model.fit(X_new, y_new)
+        finally:
+            # 이후 fit() 호출은 다시 처음부터 학습
+            self.model.set_params(warm_start=False)
+
+        ranges = np.vstack([np.min(X_new, axis=0), np.max(X_new, axis=0)])
+        if self.feature_ranges is not None:
+            ranges = np.vstack([
+                np.minimum(self.feature_ranges[0], ranges[0]),
+                np.maximum(self.feature_ranges[1], ranges[1])
+            ])
+        self.feature_ranges = ranges.astype(np.float64)
+
+        # 이전 학습 메트릭은 더 이상 현재 모델을 설명하지 않음
+        self.metrics = {}
+        self._record_metrics("update", y_new, self.model.predict(X_new))
+        if X_val is not None and y_val is not None:
+            self._record_metrics("val", y_val, self.model.predict(X_val))
+
+        logger.info(
+            f"Update completed. {len(self.model.estimators_)} trees, "
+            f"MAE={self.metrics.get('val_mae', self.metrics['update_mae']):.4f}"
+        )
+        return self.metrics
+
+    def _record_metrics(self, prefix: str, y_true: np.ndarray, y_pred: np.ndarray) -> None:
+        """메트릭을 '{prefix}_{이름}' 키로 기록"""
+        for name, value in regression_metrics(y_true, y_pred).items():
+            self.metrics[f"{prefix}_{name}"] = value
+
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         예측 수행
@@ -181,49 +351,222 @@ class CaliforniaHousingModel:
         Returns:
             평가 메트릭
         """
-        predictions = self.predict(X_test)
-
-        metrics = {
-            "mae": mean_absolute_error(y_test, predictions),
-            "mse": mean_squared_error(y_test, predictions),
-            "rmse": np.sqrt(mean_squared_error(y_test, predictions)),
-            "r2": r2_score(y_test, predictions)
-        }
+        metrics = regression_metrics(y_test, self.predict(X_test))
 
         logger.info(f"Evaluation: MAE={metrics['mae']:.4f}, R²={metrics['r2']:.4f}")
         return metrics
 
-    def save(self, filepath: str) -> None:
-        """모델 저장"""
+    def save(
+        self,
+        filepath: str,
+        model_version: Optional[str] = None,
+        artifact_format: str = "full",
+        compress: Union[int, str, Tuple[str, int]] = 0
+    ) -> None:
+        """
+        모델 저장
+
+        'compact' 형식은 트리 앙상블의 노드 배열을 모든 트리에 걸쳐 필드별로 이어 붙이고
+        float32/int32로 줄여 저장한다 (분기 임계값은 float32로 내림하므로 분기 결과는
+        동일하고, 리프 값만 float32 정밀도로 반올림됨). 트리가 없는 모델은 'full'과 같다.
+        압축하지 않은 파일(compress=0)은 load() 시 배열을 memory-map 할 수 있다
+        (로드 속도만 빨라지며 워커 간 메모리 공유는 아님, load() 참고).
+
+        Args:
+            filepath: 저장 경로
+            model_version: 아티팩트에 기록할 모델 버전 (선택)
+            artifact_format: 아티팩트 형식 ('full', 'compact')
+            compress: joblib 압축 설정 (0-9 또는 ('zlib', 3) 등, 0이면 압축 안 함)
+        """
         if not self.is_fitted:
             raise RuntimeError("Model is not fitted. Cannot save.")
+        if artifact_format not in ARTIFACT_FORMATS:
+            raise ValueError(
+                f"Unknown artifact format: {artifact_format} (expected one of {ARTIFACT_FORMATS})"
+            )
+
+        model, trees = self.model, None
+        if artifact_format == "compact" and hasattr(self.model, "estimators_"):
+            model, trees = _pack_trees(self.model)
 
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
         joblib.dump({
-            "model": self.model,
+            "artifact_version": self.ARTIFACT_VERSION,
+            "artifact_format": artifact_format,
+            "sklearn_version": sklearn.__version__,
+            "model_version": model_version,
+            "model": model,
+            "trees": trees,
             "model_type": self.model_type,
             "model_params": self.model_params,
-            "metrics": self.metrics
-        }, filepath)
-        logger.info(f"Model saved to {filepath}")
+            "metrics": self.metrics,
+            "reference_sample": self.reference_sample,
+            "reference_sketch": self.reference_sketch,
+            "feature_ranges": self.feature_ranges,
+            "update_count": self.update_count
+        }, filepath, compress=compress)
+        logger.info(f"Model saved to {filepath} ({artifact_format}, compress={compress})")
 
     @classmethod
-    def load(cls, filepath: str) -> "CaliforniaHousingModel":
-        """모델 로드"""
-        data = joblib.load(filepath)
+    def load(
+        cls,
+        filepath: str,
+        mmap_mode: Optional[str] = None
+    ) -> "CaliforniaHousingModel":
+        """
+        모델 로드
+
+        memory-map은 로드 시 파일 읽기/복사를 줄일 뿐 상주 메모리를 줄이지 않는다.
+        scikit-learn 트리는 노드 배열을 자체 메모리로 복사하고 ('full'),
+        'compact' 형식은 memory-map 된 필드별 배열에서 트리마다 노드 배열을 다시
+        만든 뒤 원본을 버리므로, 어느 형식이든 트리는 프로세스(워커)마다 따로
+        메모리에 올라간다. 여러 워커가 공유하는 것은 reference_sample 등 numpy
+        배열로 남는 속성뿐이다.
+
+        Args:
+            filepath: 모델 파일 경로
+            mmap_mode: numpy 배열 memory-map 모드 ('r' 등, 압축 파일은 무시됨)
+
+        Returns:
+            로드된 모델 인스턴스
+        """
+        with warnings.catch_warnings():
+            # 압축 파일은 memory-map 없이 읽음 (문서화된 동작이므로 경고 생략)
+            warnings.filterwarnings("ignore", message="mmap_mode .* compressed file")
+            data = joblib.load(filepath, mmap_mode=mmap_mode)
+
+        artifact_version = data.get("artifact_version", 0)
+        if artifact_version > cls.ARTIFACT_VERSION:
+            raise ValueError(
+                f"Unsupported artifact version: {artifact_version} "
+                f"(max supported: {cls.ARTIFACT_VERSION})"
+            )
+
+        saved_sklearn = data.get("sklearn_version")
+        if saved_sklearn and saved_sklearn != sklearn.__version__:
+            logger.warning(
+                f"Model saved with scikit-learn {saved_sklearn}, "
+                f"running {sklearn.__version__}"
+            )
 
         instance = cls(
             model_type=data["model_type"],
             model_params=data["model_params"]
         )
         instance.model = data["model"]
+        if data.get("trees") is not None:
+            _unpack_trees(instance.model, data["trees"])
         instance.metrics = data.get("metrics", {})
+        instance.model_version = data.get("model_version")
+        instance.reference_sample = data.get("reference_sample")
+        instance.reference_sketch = data.get("reference_sketch")
+        instance.feature_ranges = data.get("feature_ranges")
+        instance.update_count = data.get("update_count", 0)
         instance.is_fitted = True
 
         logger.info(f"Model loaded from {filepath}")
         return instance
 
 
+def _pack_trees(model) -> Tuple[object, Dict]:
+    """
+    트리 앙상블을 트리 구조가 빠진 모델 사본과 압축 dtype 노드 배열로 분리
+
+    Args:
+        model: estimators_에 DecisionTreeRegressor를 가진 앙상블
+
+    Returns:
+        (tree_ 속성을 제거한 모델 사본, 필드별로 이어 붙인 노드/리프 값 배열)
+    """
+    estimators = np.asarray(model.estimators_, dtype=object)
+    shells = np.empty(estimators.shape, dtype=object)
+    states = []
+    for index, estimator in np.ndenumerate(estimators):
+        shell = copy.copy(estimator)
+        del shell.tree_
+        shells[index] = shell
+        tree_class, tree_args, state = estimator.tree_.__reduce__()
+        states.append(state)
+
+    nodes = np.concatenate([state["nodes"] for state in states])
+    packed_nodes = {}
+    for name in nodes.dtype.names:
+        column = nodes[name]
+        if column.dtype.kind == "f":
+            packed = column.astype(np.float32)
+            if name == "threshold":
+                # 트리는 입력을 float32로 비교하므로 임계값을 내림하면 분기 결과가 같음
+                rounded_up = packed > column
+                packed[rounded_up] = np.nextafter(packed[rounded_up], np.float32(-np.inf))
+            column = packed
+        elif column.dtype.kind == "i":
+            column = column.astype(np.int32)
+        packed_nodes[name] = column
+
+    skeleton = copy.copy(model)
+    skeleton.estimators_ = list(shells) if isinstance(model.estimators_, list) else shells
+    return skeleton, {
+        "tree_class": tree_class,
+        "tree_args": tree_args,
+        "node_dtype": nodes.dtype,
+        "max_depth": np.array([state["max_depth"] for state in states], dtype=np.int32),
+        "node_count": np.array([state["node_count"] for state in states], dtype=np.int64),
+        "nodes": packed_nodes,
+        "values": np.concatenate([state["values"] for state in states]).astype(np.float32)
+    }
+
+
+def _unpack_trees(skeleton, packed: Dict) -> None:
+    """_pack_trees() 결과로 skeleton의 각 트리 구조(tree_) 복원 (제자리 변경)"""
+    offsets = np.concatenate([[0], np.cumsum(packed["node_count"])])
+    estimators = np.asarray(skeleton.estimators_, dtype=object).ravel()
+    for i, estimator in enumerate(estimators):
+        start, end = offsets[i], offsets[i + 1]
+        nodes = np.empty(end - start, dtype=packed["node_dtype"])
+        for name, column in packed["nodes"].items():
+            nodes[name] = column[start:end]
+
+        tree = packed["tree_class"](*packed["tree_args"])
+        tree.__setstate__({
+            "max_depth": int(packed["max_depth"][i]),
+            "node_count": int(end - start),
+            "nodes": nodes,
+            "values": np.ascontiguousarray(packed["values"][start:end], dtype=np.float64)
+        })
+        estimator.tree_ = tree
+
+
+def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """
+    잔차 배열 하나로 MAE, MSE, RMSE, R² 계산 (sklearn.metrics와 동일한 값)
+
+    Args:
+        y_true: 실제값
+        y_pred: 예측값
+
+    Returns:
+        {"mae", "mse", "rmse", "r2"}
+    """
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuals = y_true - np.asarray(y_pred, dtype=np.float64)
+
+    mse = float(np.dot(residuals, residuals) / len(residuals))
+    centered = y_true - y_true.mean()
+    total = float(np.dot(centered, centered))
+    if total > 0:
+        r2 = 1.0 - mse * len(residuals) / total
+    else:
+        # 실제값이 상수인 경우 (sklearn r2_score와 동일한 처리)
+        r2 = 1.0 if mse == 0 else 0.0
+
+    return {
+        "mae": float(np.abs(residuals).mean()),
+        "mse": mse,
+        "rmse": float(np.sqrt(mse)),
+        "r2": r2
+    }
+
+
 def train_model(
     model_type: str = "random_forest",
     test_size: float = 0.2,
@@ -250,3 +593,37 @@ def train_model(
         model.save(save_path)
 
     return model, metrics
+
+
+def load_or_train_model(
+    model_path: str,
+    model_type: str = "random_forest",
+    model_version: Optional[str] = None,
+    mmap_mode: Optional[str] = "r"
+) -> Tuple[CaliforniaHousingModel, str]:
+    """
+    저장된 모델 아티팩트를 로드하고, 없을 때만 학습
+
+    Args:
+        model_path: 모델 아티팩트 경로
+        model_type: 아티팩트가 없을 때 학습할 모델 유형
+        model_version: 학습 후 저장 시 기록할 모델 버전
+        mmap_mode: 로드 시 memory-map 모드 (로드 속도용, 트리는 워커 간 공유되지 않음)
+
+    Returns:
+        (모델, 출처 - "artifact" 또는 "trained")
+    """
+    if os.path.exists(model_path):
+        return CaliforniaHousingModel.load(model_path, mmap_mode=mmap_mode), "artifact"
+
+    logger.warning(f"No model artifact at {model_path}. Training a new model...")
+    model, metrics = train_model(model_type=model_type)
+    logger.info(f"  MAE: {metrics['mae']:.4f}")
+    logger.info(f"  R²: {metrics['r2']:.4f}")
+
+    try:
+        model.save(model_path, model_version=model_version)
+    except OSError as e:
+        logger.warning(f"Could not persist trained model to {model_path}: {e}")
+
+    return model, "trained"
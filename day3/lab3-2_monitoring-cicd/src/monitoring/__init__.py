@@ -6,8 +6,14 @@ from .drift import (
     DriftLevel,
     ModelMetrics,
     ModelMonitor,
-    calculate_drift_score
+    calculate_drift_score,
+    calculate_drift_scores,
+    ks_2samp_sorted,
+    ks_2samp_sketch
 )
+from .sketch import QuantileSketch
+from .parquet import detect_drift_parquet
+from .quality import OnlineQualityEstimator
 
 __all__ = [
     "DriftDetector",
@@ -15,5 +21,11 @@ __all__ = [
     "DriftLevel",
     "ModelMetrics",
     "ModelMonitor",
-    "calculate_drift_score"
+    "calculate_drift_score",
+    "calculate_drift_scores",
+    "ks_2samp_sorted",
+    "ks_2samp_sketch",
+    "QuantileSketch",
+    "detect_drift_parquet",
+    "OnlineQualityEstimator"
 ]
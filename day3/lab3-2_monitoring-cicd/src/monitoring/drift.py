@@ -4,17 +4,88 @@ Monitoring and Drift Detection Module
 모델 성능 모니터링 및 데이터 드리프트 감지
 """
 
+import os
+import math
+import time
+import pickle
+import struct
 import logging
-from typing import Dict, List, Optional, Tuple
+import tempfile
+import warnings
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
+import joblib
 import numpy as np
-from scipy import stats
+from scipy import special, stats
+
+from .history import DEFAULT_HISTORY_CAPACITY, MetricsHistory
+from .parallel import ParallelKS, resolve_n_jobs, score_windows_parallel
+from .sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
 
+def _probe_exact_2kssamp():
+    """
+    scipy 비공개 정확 p-value 함수 확인 (import 시 1회)
+
+    scipy.stats.ks_2samp의 정확(exact) p-value와 동일한 결과를 통계량별로 계산하기 위해
+    사용한다. 없거나 알려진 정확 p-value(n1=7, n2=5, D=3/7 → 6/11)와 결과가 다르면
+    None (특성별 ks_2samp 호출로 대체).
+    """
+    try:
+        from scipy.stats._stats_py import _attempt_exact_2kssamp
+
+        success, _, p_value = _attempt_exact_2kssamp(7, 5, 1, 3 / 7, "two-sided")
+        if success and math.isclose(p_value, 6 / 11):
+            return _attempt_exact_2kssamp
+    except (ImportError, TypeError, ValueError):
+        pass
+    logger.info("scipy exact KS helper unavailable, using stats.ks_2samp per feature")
+    return None
+
+
+_attempt_exact_2kssamp = _probe_exact_2kssamp()
+
+# 잘리거나 손상된 기준 분포 파일(동시 쓰기 중단 등)을 역직렬화할 때 나오는 예외
+BASELINE_CORRUPTION_ERRORS = (
+    EOFError, pickle.UnpicklingError, struct.error, ValueError, IndexError
+)
+
+# load_or_build_baseline이 다시 계산할 오류 (손상 파일, 파일/모델 버전 불일치 ValueError)
+BASELINE_LOAD_ERRORS = (EOFError, pickle.UnpicklingError, struct.error, ValueError)
+
+# scipy.stats.ks_2samp(method="auto")가 정확 p-value를 쓰는 최대 표본 크기
+KS_EXACT_MAX_N = 10000
+
+# KS 병합 단계에서 한 번에 처리할 임시 배열 크기 (특성 블록 단위로 분할)
+KS_BLOCK_BYTES = 256 * 1024 * 1024
+
+# 구간 기반 지표(PSI, JS, Wasserstein)의 특성별 구간 수 (기준 분포 분위수로 경계 결정)
+DEFAULT_BINS = 64
+MAX_BINS = 65535
+
+# PSI 계산 시 빈 구간의 비율 하한 (log(0) 방지)
+PSI_EPSILON = 1e-4
+
+# 지표별 드리프트 수준 하한 (LOW, MEDIUM, HIGH, CRITICAL), MEDIUM 이상이면 드리프트
+# - psi: 업계 관행 (0.1 이상 주의, 0.25 이상 유의)
+# - js: Jensen-Shannon 거리 (log base 2, 0~1, 동일 분포 5천 행/64구간의 표본 잡음 약 0.05)
+# - wasserstein: 기준 표준편차로 정규화한 1-D Wasserstein 거리
+STATISTIC_LEVELS = {
+    "psi": (0.05, 0.1, 0.25, 0.5),
+    "js": (0.1, 0.15, 0.25, 0.4),
+    "wasserstein": (0.05, 0.1, 0.25, 0.5)
+}
+
+METHODS = ("ks",) + tuple(STATISTIC_LEVELS)
+
+# 기준 분포 파일 형식 버전 (save_baseline/load_baseline)
+BASELINE_VERSION = 1
+
+
 class DriftLevel(Enum):
     """드리프트 수준"""
     NONE = "none"
@@ -29,7 +100,7 @@ class DriftResult:
     """드리프트 감지 결과"""
     feature_name: str
     drift_detected: bool
-    p_value: float
+    p_value: Optional[float]
     statistic: float
     drift_level: DriftLevel
 
@@ -37,7 +108,7 @@ class DriftResult:
         return {
             "feature_name": self.feature_name,
             "drift_detected": self.drift_detected,
-            "p_value": round(self.p_value, 6),
+            "p_value": round(self.p_value, 6) if self.p_value is not None else None,
             "statistic": round(self.statistic, 6),
             "drift_level": self.drift_level.value
         }
@@ -68,19 +139,44 @@ class DriftDetector:
     def __init__(
         self,
         significance_level: float = 0.05,
-        method: str = "ks"
+        method: str = "ks",
+        sketch_k: Optional[int] = None,
+        n_bins: int = DEFAULT_BINS,
+        n_jobs: Optional[int] = 1
     ):
         """
         드리프트 감지기 초기화
 
         Args:
-            significance_level: 유의 수준 (기본 0.05)
-            method: 검정 방법 ('ks' - Kolmogorov-Smirnov)
+            significance_level: 유의 수준 (기본 0.05, 'ks'에만 적용)
+            method: 검정 방법
+                ('ks' - Kolmogorov-Smirnov, 'psi' - Population Stability Index,
+                 'js' - Jensen-Shannon 거리, 'wasserstein' - 정규화 Wasserstein 거리)
+            sketch_k: 지정 시 기준 데이터를 원본 대신 KLL 스케치(용량 k)로 요약해 보관
+            n_bins: 구간 기반 지표의 특성별 구간 수
+            n_jobs: 'ks' 검정을 특성 단위로 나눠 수행할 프로세스 수 (-1이면 CPU 코어 수)
         """
+        if method not in METHODS:
+            raise ValueError(f"Unknown drift method: {method} (expected one of {METHODS})")
+        if not 2 <= n_bins <= MAX_BINS:
+            raise ValueError(f"n_bins must be between 2 and {MAX_BINS}, got {n_bins}")
+
         self.significance_level = significance_level
         self.method = method
+        self.sketch_k = sketch_k
+        self.n_bins = n_bins
+        self.n_jobs = resolve_n_jobs(n_jobs)
         self.reference_data = None
+        self.reference_sorted = None
+        self.reference_sketch: Optional[QuantileSketch] = None
+        self.bin_edges: Optional[np.ndarray] = None
+        self.reference_hist: Optional[np.ndarray] = None
+        self.reference_bounds: Optional[np.ndarray] = None
+        self.reference_scale: Optional[np.ndarray] = None
+        self.reference_count = 0
         self.feature_names = None
+        self.model_version: Optional[str] = None
+        self._parallel: Optional[ParallelKS] = None
 
     def set_reference(
         self,
@@ -94,7 +190,33 @@ class DriftDetector:
             data: 기준 데이터 (n_samples, n_features)
             feature_names: 특성 이름 리스트
         """
-        self.reference_data = np.asarray(data)
+        data = np.asarray(data)
+        self.close()
+        if self.sketch_k is not None:
+            sketch = QuantileSketch(data.shape[1], k=self.sketch_k).update(data)
+            self.set_reference_sketch(sketch, feature_names)
+            return
+
+        self.reference_data = data
+        # 특성별 정렬 결과를 한 번만 계산해 캐시 (n_features, n_samples)
+        reference_sorted = np.array(data.T, dtype=np.float64, order="C")
+        reference_sorted.sort(axis=1)
+        self.reference_sorted = reference_sorted if self.method == "ks" else None
+
+        # 구간 경계와 기준 히스토그램을 미리 계산 (윈도우 평가는 구간 집계 1회)
+        edges = quantile_edges(reference_sorted, self.n_bins)
+        cdf = np.stack([
+            np.searchsorted(column, column_edges, side="right")
+            for column, column_edges in zip(reference_sorted, edges)
+        ]) / data.shape[0]
+        self._set_bins(
+            edges,
+            cdf,
+            bounds=reference_sorted[:, [0, -1]],
+            scale=reference_sorted.std(axis=1)
+        )
+        self.reference_count = data.shape[0]
+        self.reference_sketch = None
         self.feature_names = feature_names or [
             f"feature_{i}" for i in range(data.shape[1])
         ]
@@ -103,6 +225,55 @@ class DriftDetector:
             f"{data.shape[1]} features"
         )
 
+    def set_reference_sketch(
+        self,
+        sketch: QuantileSketch,
+        feature_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        기준 분포를 스케치로 설정 (샤드/일자별 스케치를 병합한 결과 등)
+
+        Args:
+            sketch: 기준 데이터 스케치
+            feature_names: 특성 이름 리스트
+        """
+        self.close()
+        self.reference_sketch = sketch
+        self.reference_data = None
+        self.reference_sorted = None
+        self.reference_count = sketch.count
+
+        # 구간 기준도 함께 계산 (detect_drift_histogram은 'ks'에서도 사용)
+        edges = np.stack([sketch.quantile(q) for q in edge_quantiles(self.n_bins)], axis=1)
+        items, cumulative = sketch.sorted_view()
+        weights = np.diff(cumulative, axis=0, prepend=0)
+        mean = (items * weights).sum(axis=0)
+        variance = ((items - mean) ** 2 * weights).sum(axis=0)
+        self._set_bins(
+            edges,
+            sketch.cdf(edges.T).T,
+            bounds=np.stack([sketch.min, sketch.max], axis=1),
+            scale=np.sqrt(variance)
+        )
+        self.feature_names = feature_names or [
+            f"feature_{i}" for i in range(sketch.n_features)
+        ]
+        logger.info(
+            f"Reference sketch set: {sketch.count} samples, "
+            f"{sketch.n_features} features, {sketch.size_bytes} bytes"
+        )
+
+    def update_reference(self, data: np.ndarray) -> None:
+        """
+        스케치 기준 분포에 데이터 배치 추가 (원본은 보관하지 않음)
+
+        Args:
+            data: 추가할 기준 데이터 (n_samples, n_features)
+        """
+        if self.reference_sketch is None:
+            raise RuntimeError("Reference sketch not set. Use sketch_k or set_reference_sketch().")
+        self.reference_sketch.update(data)
+
     def detect_drift(
         self,
         current_data: np.ndarray
@@ -116,29 +287,270 @@ class DriftDetector:
         Returns:
             (전체 드리프트 여부, 특성별 결과 리스트)
         """
-        if self.reference_data is None:
+        statistics, p_values = self.compute_statistics(current_data)
+        overall_drift, results = self._build_results(statistics, p_values)
+
+        logger.info(
+            f"Drift detection completed: "
+            f"{sum(1 for r in results if r.drift_detected)}/{len(results)} "
+            f"features drifted"
+        )
+
+        return overall_drift, results
+
+    def compute_statistics(
+        self,
+        current_data: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        특성별 통계량/p-value 계산 (결과 객체 생성, 로깅 없음)
+
+        Args:
+            current_data: 현재 데이터 (n_samples, n_features)
+
+        Returns:
+            (특성별 통계량 배열, 특성별 p-value 배열 - 'ks'가 아니면 None)
+        """
+        if self.bin_edges is None:
             raise RuntimeError("Reference data not set. Call set_reference() first.")
 
         current_data = np.asarray(current_data)
+        n_features = len(self.feature_names)
 
-        if current_data.shape[1] != self.reference_data.shape[1]:
+        if current_data.ndim != 2:
+            raise ValueError(
+                f"Expected 2-D data (n_samples, n_features), got shape {current_data.shape}"
+            )
+        if current_data.shape[1] != n_features:
             raise ValueError(
-                f"Feature count mismatch: reference={self.reference_data.shape[1]}, "
+                f"Feature count mismatch: reference={n_features}, "
                 f"current={current_data.shape[1]}"
             )
 
+        # 전체 특성 통계량을 한 번에 계산
+        if self.method != "ks":
+            counts = bin_counts(bin_indices(current_data, self.bin_edges), self.n_bins)
+            return self._histogram_statistics(counts)
+        if self.reference_sketch is not None:
+            return ks_2samp_sketch(self.reference_sketch, current_data)
+        if self.n_jobs > 1 and n_features > 1:
+            if self._parallel is None:
+                self._parallel = ParallelKS(self.reference_sorted, self.n_jobs)
+            return self._parallel.run(current_data)
+        return ks_2samp_sorted(self.reference_sorted, current_data)
+
+    def drift_flags(
+        self,
+        statistics: np.ndarray,
+        p_values: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        통계량/p-value로 특성별 드리프트 여부 판정 (_build_results와 같은 기준)
+
+        Args:
+            statistics: 통계량 배열
+            p_values: p-value 배열 ('ks'), 없으면 지표 임계값 사용
+
+        Returns:
+            드리프트 여부 bool 배열 (statistics와 같은 형태)
+        """
+        if p_values is None:
+            return np.asarray(statistics) >= STATISTIC_LEVELS[self.method][1]
+        return np.asarray(p_values) < self.significance_level
+
+    def detect_drift_histogram(self, counts: np.ndarray) -> Tuple[bool, List[DriftResult]]:
+        """
+        구간 카운트로 드리프트 감지 (대용량 데이터를 배치별로 집계한 결과 사용)
+
+        'ks'는 구간 경계에서 평가한 KS 통계량(정확값의 하한)과 점근 p-value를 사용한다.
+
+        Args:
+            counts: bin_edges 기준 현재 데이터의 특성별 구간 카운트 (n_features, n_bins)
+
+        Returns:
+            (전체 드리프트 여부, 특성별 결과 리스트)
+        """
+        if self.bin_edges is None:
+            raise RuntimeError(
+                "Reference bins not set. Use a binned method or set_reference_sketch()."
+            )
+
+        counts = np.asarray(counts)
+        if counts.shape != self.reference_hist.shape:
+            raise ValueError(
+                f"Histogram shape mismatch: reference={self.reference_hist.shape}, "
+                f"current={counts.shape}"
+            )
+        if counts[0].sum() == 0:
+            raise ValueError("Histogram must not be empty")
+
+        statistics, p_values = self._histogram_statistics(counts)
+        return self._build_results(statistics, p_values)
+
+    def save_baseline(self, filepath: str, model_version: Optional[str] = None) -> None:
+        """
+        미리 계산한 기준 분포 저장 (정렬 열, 구간 경계, 스케치, 특성 이름)
+
+        압축 없이 저장하므로 load_baseline() 시 배열을 memory-map 할 수 있다.
+        같은 디렉토리의 임시 파일에 쓴 뒤 이름을 바꾸므로 읽는 쪽에서 쓰다 만 파일을 보지 않는다.
+
+        Args:
+            filepath: 저장 경로
+            model_version: 기준 분포를 만든 모델 버전 (선택)
+        """
+        if self.bin_edges is None:
+            raise RuntimeError("Reference data not set. Call set_reference() first.")
+
+        directory = os.path.dirname(filepath) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, staging = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+        os.close(fd)
+        try:
+            joblib.dump({
+                "baseline_version": BASELINE_VERSION,
+                "model_version": model_version or self.model_version,
+                "created_at": time.time(),
+                "method": self.method,
+                "significance_level": self.significance_level,
+                "n_bins": self.n_bins,
+                "feature_names": list(self.feature_names),
+                "reference_count": self.reference_count,
+                "reference_sorted": self.reference_sorted,
+                "reference_sketch": self.reference_sketch,
+                "bin_edges": self.bin_edges,
+                "reference_hist": self.reference_hist,
+                "reference_bounds": self.reference_bounds,
+                "reference_scale": self.reference_scale
+            }, staging)
+            os.replace(staging, filepath)
+        except BaseException:
+            os.unlink(staging)
+            raise
+        logger.info(f"Drift baseline saved to {filepath}")
+
+    @classmethod
+    def load_baseline(
+        cls,
+        filepath: str,
+        model_version: Optional[str] = None,
+        mmap_mode: Optional[str] = "r",
+        n_jobs: Optional[int] = 1
+    ) -> "DriftDetector":
+        """
+        저장된 기준 분포로 감지기 생성 (기준 데이터 재계산 없음)
+
+        Args:
+            filepath: 기준 분포 파일 경로
+            model_version: 지정 시 파일의 모델 버전과 일치해야 함
+            mmap_mode: numpy 배열 memory-map 모드 ('r' 등, None이면 메모리로 읽음)
+            n_jobs: 'ks' 검정 프로세스 수
+
+        Returns:
+            기준 분포가 설정된 감지기
+
+        Raises:
+            ValueError: 손상된 파일, 지원하지 않는 파일 버전 또는 모델 버전 불일치
+        """
+        try:
+            data = joblib.load(filepath, mmap_mode=mmap_mode)
+        except BASELINE_CORRUPTION_ERRORS as e:
+            raise ValueError(f"Corrupt drift baseline {filepath}: {e!r}") from e
+
+        baseline_version = data.get("baseline_version", 0)
+        if baseline_version > BASELINE_VERSION:
+            raise ValueError(
+                f"Unsupported baseline version: {baseline_version} "
+                f"(max supported: {BASELINE_VERSION})"
+            )
+        if model_version is not None and data.get("model_version") != model_version:
+            raise ValueError(
+                f"Baseline model version mismatch: expected {model_version}, "
+                f"found {data.get('model_version')}"
+            )
+
+        detector = cls(
+            significance_level=data["significance_level"],
+            method=data["method"],
+            n_bins=data["n_bins"],
+            n_jobs=n_jobs
+        )
+        detector.model_version = data.get("model_version")
+        detector.feature_names = data["feature_names"]
+        detector.reference_count = data["reference_count"]
+        detector.reference_sorted = data["reference_sorted"]
+        detector.reference_sketch = data["reference_sketch"]
+        detector.bin_edges = data["bin_edges"]
+        detector.reference_hist = data["reference_hist"]
+        detector.reference_bounds = data["reference_bounds"]
+        detector.reference_scale = data["reference_scale"]
+
+        logger.info(
+            f"Drift baseline loaded from {filepath}: {detector.reference_count} samples, "
+            f"{len(detector.feature_names)} features, model {detector.model_version}"
+        )
+        return detector
+
+    def close(self) -> None:
+        """병렬 KS 워커 종료 및 공유 기준 데이터 삭제 (n_jobs > 1)"""
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
+
+    def _set_bins(
+        self,
+        edges: np.ndarray,
+        cdf: np.ndarray,
+        bounds: np.ndarray,
+        scale: np.ndarray
+    ) -> None:
+        """구간 경계, 기준 히스토그램(비율), 값 범위, 척도 설정"""
+        self.bin_edges = edges
+        self.reference_hist = np.diff(cdf, axis=1, prepend=0, append=1)
+        self.reference_bounds = bounds
+        self.reference_scale = scale
+
+    def _histogram_statistics(
+        self,
+        counts: np.ndarray
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """현재 데이터 구간 카운트로 지표 계산 (p-value는 'ks'에서만)"""
+        n = int(counts[0].sum())
+        current_hist = counts / n
+
+        if self.method == "ks":
+            statistics = np.abs(
+                np.cumsum(self.reference_hist - current_hist, axis=1)[:, :-1]
+            ).max(axis=1)
+            return statistics, _ks_asymptotic_p_values(statistics, self.reference_count, n)
+        if self.method == "psi":
+            return population_stability_index(self.reference_hist, current_hist), None
+        if self.method == "js":
+            return jensen_shannon_distance(self.reference_hist, current_hist), None
+        statistics = binned_wasserstein(
+            self.reference_hist, current_hist, self.bin_edges, self.reference_bounds
+        ) / np.where(self.reference_scale > 0, self.reference_scale, 1.0)
+        return statistics, None
+
+    def _build_results(
+        self,
+        statistics: np.ndarray,
+        p_values: Optional[np.ndarray] = None
+    ) -> Tuple[bool, List[DriftResult]]:
+        """특성별 통계량/p-value로 드리프트 결과 생성 (p-value가 없으면 지표 임계값 사용)"""
         results = []
         overall_drift = False
 
         for i, feature_name in enumerate(self.feature_names):
-            ref_feature = self.reference_data[:, i]
-            cur_feature = current_data[:, i]
+            statistic = float(statistics[i])
 
-            # KS Test
-            statistic, p_value = stats.ks_2samp(ref_feature, cur_feature)
-
-            drift_detected = p_value < self.significance_level
-            drift_level = self._get_drift_level(p_value)
+            if p_values is None:
+                p_value = None
+                drift_level = self._get_statistic_level(statistic)
+                drift_detected = statistic >= STATISTIC_LEVELS[self.method][1]
+            else:
+                p_value = float(p_values[i])
+                drift_detected = p_value < self.significance_level
+                drift_level = self._get_drift_level(p_value)
 
             if drift_detected:
                 overall_drift = True
@@ -151,12 +563,6 @@ class DriftDetector:
                 drift_level=drift_level
             ))
 
-        logger.info(
-            f"Drift detection completed: "
-            f"{sum(1 for r in results if r.drift_detected)}/{len(results)} "
-            f"features drifted"
-        )
-
         return overall_drift, results
 
     def _get_drift_level(self, p_value: float) -> DriftLevel:
@@ -172,6 +578,20 @@ class DriftDetector:
         else:
             return DriftLevel.CRITICAL
 
+    def _get_statistic_level(self, statistic: float) -> DriftLevel:
+        """거리 지표 값에 따른 드리프트 수준 결정 (STATISTIC_LEVELS)"""
+        low, medium, high, critical = STATISTIC_LEVELS[self.method]
+        if statistic >= critical:
+            return DriftLevel.CRITICAL
+        elif statistic >= high:
+            return DriftLevel.HIGH
+        elif statistic >= medium:
+            return DriftLevel.MEDIUM
+        elif statistic >= low:
+            return DriftLevel.LOW
+        else:
+            return DriftLevel.NONE
+
     def get_drift_summary(
         self,
         results: List[DriftResult]
@@ -207,7 +627,8 @@ class ModelMonitor:
     def __init__(
         self,
         mae_threshold: float = 0.45,
-        r2_threshold: float = 0.75
+        r2_threshold: float = 0.75,
+        history_capacity: int = DEFAULT_HISTORY_CAPACITY
     ):
         """
         모델 모니터 초기화
@@ -215,10 +636,11 @@ class ModelMonitor:
         Args:
             mae_threshold: MAE 임계값 (초과 시 경고)
             r2_threshold: R² 임계값 (미만 시 경고)
+            history_capacity: 보관할 최대 메트릭 수 (초과 시 오래된 것부터 덮어씀)
         """
         self.mae_threshold = mae_threshold
         self.r2_threshold = r2_threshold
-        self.metrics_history: List[ModelMetrics] = []
+        self.metrics_history = MetricsHistory(history_capacity)
 
     def record_metrics(self, metrics: ModelMetrics) -> None:
         """메트릭 기록"""
@@ -268,49 +690,427 @@ class ModelMonitor:
         is_healthy, _ = self.check_performance(metrics)
         return not is_healthy
 
-    def get_statistics(self) -> Dict:
-        """기록된 메트릭 통계"""
-        if not self.metrics_history:
-            return {"message": "No metrics recorded"}
+    def get_statistics(self, window: Optional[int] = None) -> Dict:
+        """
+        기록된 메트릭 통계 (윈도우별 증분 유지, 반복 조회 O(1))
 
-        mae_values = [m.mae for m in self.metrics_history]
-        r2_values = [m.r2 for m in self.metrics_history]
+        Args:
+            window: 최근 window개 메트릭만 집계 (None이면 보관 중인 전체)
 
+        Returns:
+            개수와 MAE/R² 평균·표준편차·최소·최대
+        """
+        if not len(self.metrics_history):
+            return {"message": "No metrics recorded"}
+
+        statistics = self.metrics_history.statistics(window)
         return {
-            "count": len(self.metrics_history),
-            "mae": {
-                "mean": round(np.mean(mae_values), 4),
-                "std": round(np.std(mae_values), 4),
-                "min": round(min(mae_values), 4),
-                "max": round(max(mae_values), 4)
-            },
-            "r2": {
-                "mean": round(np.mean(r2_values), 4),
-                "std": round(np.std(r2_values), 4),
-                "min": round(min(r2_values), 4),
-                "max": round(max(r2_values), 4)
-            }
+            "count": statistics["mae"].count,
+            "mae": statistics["mae"].to_dict(),
+            "r2": statistics["r2"].to_dict()
         }
 
 
+def ks_2samp_sorted(
+    reference_sorted: np.ndarray,
+    current: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 특성의 2-표본 KS 검정을 한 번에 수행
+
+    scipy.stats.ks_2samp(기본 설정: two-sided, method="auto")을 특성마다 호출한 것과
+    동일한 통계량과 p-value를 반환한다. 기준 데이터는 미리 정렬되어 있어야 하며,
+    현재 데이터는 특성별 정렬 1회 후 두 정렬 구간을 병합해 ECDF 차이를 계산한다.
+
+    Args:
+        reference_sorted: 특성별로 정렬된 기준 데이터 (n_features, n_reference)
+        current: 현재 데이터 (n_samples, n_features)
+
+    Returns:
+        (특성별 통계량 배열, 특성별 p-value 배열)
+    """
+    n_features, n1 = reference_sorted.shape
+    n2 = current.shape[0]
+    if min(n1, n2) == 0:
+        raise ValueError("Data passed to ks_2samp must not be empty")
+
+    statistics = np.empty(n_features)
+    positions = np.arange(1, n1 + n2 + 1)
+    # 병합 단계 임시 배열(특성당 약 4 × (n1 + n2) × 8바이트)을 예산 안으로 제한
+    block = max(1, KS_BLOCK_BYTES // ((n1 + n2) * 8 * 4))
+
+    for start in range(0, n_features, block):
+        stop = min(start + block, n_features)
+        current_sorted = np.array(current[:, start:stop].T, dtype=np.float64, order="C")
+        current_sorted.sort(axis=1)
+        statistics[start:stop] = _ks_statistics(
+            reference_sorted[start:stop], current_sorted, positions
+        )
+
+    if max(n1, n2) > KS_EXACT_MAX_N:
+        return statistics, _ks_asymptotic_p_values(statistics, n1, n2)
+
+    if _attempt_exact_2kssamp is not None:
+        try:
+            return _ks_exact_p_values(statistics, n1, n2)
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                f"scipy exact KS helper failed ({e!r}), using stats.ks_2samp per feature"
+            )
+
+    # 정확 p-value 내부 함수를 쓸 수 없는 scipy 버전: 특성별 scipy 호출
+    results = [
+        stats.ks_2samp(reference_sorted[i], current[:, i]) for i in range(n_features)
+    ]
+    return (
+        np.array([r.statistic for r in results]),
+        np.array([r.pvalue for r in results])
+    )
+
+
+def ks_2samp_sketch(
+    sketch: QuantileSketch,
+    current: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    기준 스케치와 현재 데이터의 특성별 2-표본 KS 검정 (근사)
+
+    기준 분포는 스케치의 추정 누적 분포를, 현재 분포는 정확한 ECDF를 사용하며
+    두 표본의 모든 점에서 차이의 최댓값을 통계량으로 한다. p-value는 점근
+    Kolmogorov 분포로 계산하므로 통계량에 스케치 오차(약 1.7/k)가 더해진다.
+
+    Args:
+        sketch: 기준 데이터 스케치
+        current: 현재 데이터 (n_samples, n_features)
+
+    Returns:
+        (특성별 통계량 배열, 특성별 p-value 배열)
+    """
+    n2 = current.shape[0]
+    if sketch.count == 0 or n2 == 0:
+        raise ValueError("Data passed to ks_2samp must not be empty")
+
+    items, cumulative = sketch.sorted_view()
+    cumulative = np.vstack([np.zeros(sketch.n_features), cumulative])
+    current_sorted = np.sort(np.asarray(current, dtype=np.float64), axis=0)
+
+    statistics = np.empty(sketch.n_features)
+    for j in range(sketch.n_features):
+        points = np.concatenate([items[:, j], current_sorted[:, j]])
+        cdf_reference = cumulative[np.searchsorted(items[:, j], points, side="right"), j]
+        cdf_current = np.searchsorted(current_sorted[:, j], points, side="right") / n2
+        statistics[j] = np.abs(cdf_reference - cdf_current).max()
+
+    return statistics, _ks_asymptotic_p_values(statistics, sketch.count, n2)
+
+
+def _ks_statistics(
+    reference_sorted: np.ndarray,
+    current_sorted: np.ndarray,
+    positions: np.ndarray
+) -> np.ndarray:
+    """정렬된 두 표본 블록의 KS 통계량 (특성 행 단위)"""
+    n1 = reference_sorted.shape[1]
+    n2 = current_sorted.shape[1]
+
+    # 정렬된 두 구간의 병합 (stable 정렬은 timsort: 이미 정렬된 구간은 선형 시간에 병합)
+    merged = np.concatenate([reference_sorted, current_sorted], axis=1)
+    order = np.argsort(merged, axis=1, kind="stable")
+    reference_counts = np.cumsum(order < n1, axis=1)
+    cddiffs = reference_counts / n1 - (positions - reference_counts) / n2
+
+    # 동일 값은 마지막 위치에서만 평가 (searchsorted(side="right")와 동일)
+    # 마지막 위치의 차이는 항상 0이므로 나머지를 0으로 두어도 최대/최소는 변하지 않음
+    merged_sorted = np.take_along_axis(merged, order, axis=1)
+    np.putmask(cddiffs[:, :-1], merged_sorted[:, 1:] == merged_sorted[:, :-1], 0.0)
+
+    max_s = cddiffs.max(axis=1)
+    min_s = np.clip(-cddiffs.min(axis=1), 0, 1)
+    return np.where(min_s > max_s, min_s, max_s)
+
+
+def _ks_asymptotic_p_values(statistics: np.ndarray, n1: int, n2: int) -> np.ndarray:
+    """Smirnov 점근 분포 p-value (scipy method="asymp"와 동일, 같은 통계량은 한 번만 계산)"""
+    m, n = sorted([float(n1), float(n2)], reverse=True)
+    en = m * n / (m + n)
+    unique, inverse = np.unique(statistics, return_inverse=True)
+    return np.clip(stats.kstwo.sf(unique, np.round(en)), 0, 1)[inverse.reshape(-1)]
+
+
+def _ks_exact_p_values(
+    statistics: np.ndarray,
+    n1: int,
+    n2: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """정확 p-value (scipy method="exact"와 동일, 같은 통계량은 한 번만 계산)"""
+    g = math.gcd(n1, n2)
+    exact_statistics = np.empty_like(statistics)
+    p_values = np.empty_like(statistics)
+    cache = {}
+
+    for i, d in enumerate(statistics):
+        if d not in cache:
+            success, d_exact, prob = _attempt_exact_2kssamp(n1, n2, g, d, "two-sided")
+            if not success:
+                warnings.warn(
+                    "ks_2samp: Exact calculation unsuccessful. Switching to method=asymp.",
+                    RuntimeWarning
+                )
+                d_exact = d
+                prob = _ks_asymptotic_p_values(np.array([d]), n1, n2)[0]
+            cache[d] = (d_exact, np.clip(prob, 0, 1))
+        exact_statistics[i], p_values[i] = cache[d]
+
+    return exact_statistics, p_values
+
+
+def edge_quantiles(n_bins: int) -> np.ndarray:
+    """구간 경계 분위 (양 끝 제외, n_bins - 1개)"""
+    return np.linspace(0, 1, n_bins + 1)[1:-1]
+
+
+def quantile_edges(reference_sorted: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    기준 분포 분위수로 특성별 구간 경계 계산
+
+    Args:
+        reference_sorted: 특성별로 정렬된 기준 데이터 (n_features, n_reference)
+        n_bins: 구간 수
+
+    Returns:
+        구간 경계 (n_features, n_bins - 1)
+    """
+    return np.quantile(reference_sorted, edge_quantiles(n_bins), axis=1).T
+
+
+def bin_indices(X: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    특성별 구간 번호 계산 (특성당 searchsorted 1회)
+
+    값 x의 구간 번호는 x보다 작은 경계 수이므로, 구간 0..i의 합이 곧 x <= e_i 비율이다.
+
+    Args:
+        X: 입력 데이터 (n_samples, n_features)
+        edges: 구간 경계 (n_features, n_bins - 1)
+
+    Returns:
+        구간 번호 (n_samples, n_features), uint16
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != len(edges):
+        raise ValueError(
+            f"Feature count mismatch: reference={len(edges)}, "
+            f"current shape={X.shape}"
+        )
+
+    bins = np.empty(X.shape, dtype=np.uint16)
+    for j, column_edges in enumerate(edges):
+        bins[:, j] = np.searchsorted(column_edges, X[:, j], side="left")
+    return bins
+
+
+def bin_counts(bins: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    구간 번호를 특성별 구간 카운트로 집계 (전체 특성 bincount 1회)
+
+    Args:
+        bins: 구간 번호 (n_samples, n_features)
+        n_bins: 구간 수
+
+    Returns:
+        구간 카운트 (n_features, n_bins)
+    """
+    n_features = bins.shape[1]
+    offsets = np.arange(n_features) * n_bins
+    counts = np.bincount((bins + offsets).ravel(), minlength=n_features * n_bins)
+    return counts.reshape(n_features, n_bins)
+
+
+def population_stability_index(
+    reference_hist: np.ndarray,
+    current_hist: np.ndarray
+) -> np.ndarray:
+    """
+    특성별 PSI = Σ (q - p) ln(q / p)
+
+    Args:
+        reference_hist: 기준 구간 비율 (n_features, n_bins)
+        current_hist: 현재 구간 비율 (n_features, n_bins)
+
+    Returns:
+        특성별 PSI
+    """
+    p = np.maximum(reference_hist, PSI_EPSILON)
+    q = np.maximum(current_hist, PSI_EPSILON)
+    return ((q - p) * np.log(q / p)).sum(axis=1)
+
+
+def jensen_shannon_distance(
+    reference_hist: np.ndarray,
+    current_hist: np.ndarray
+) -> np.ndarray:
+    """
+    특성별 Jensen-Shannon 거리 (log base 2, scipy.spatial.distance.jensenshannon과 동일)
+
+    Args:
+        reference_hist: 기준 구간 비율 (n_features, n_bins)
+        current_hist: 현재 구간 비율 (n_features, n_bins)
+
+    Returns:
+        특성별 거리 (0~1)
+    """
+    p = reference_hist / reference_hist.sum(axis=1, keepdims=True)
+    q = current_hist / current_hist.sum(axis=1, keepdims=True)
+    m = (p + q) / 2
+    divergence = (special.rel_entr(p, m).sum(axis=1) + special.rel_entr(q, m).sum(axis=1)) / 2
+    return np.sqrt(np.maximum(divergence, 0) / np.log(2))
+
+
+def binned_wasserstein(
+    reference_hist: np.ndarray,
+    current_hist: np.ndarray,
+    edges: np.ndarray,
+    bounds: np.ndarray
+) -> np.ndarray:
+    """
+    구간 누적 분포로 근사한 특성별 1-D Wasserstein 거리 ∫|F_ref - F_cur| dx
+
+    구간 경계에서의 누적 분포 차이를 사다리꼴로 적분하며, 양 끝 구간은
+    기준 데이터의 최솟값/최댓값까지로 제한한다.
+
+    Args:
+        reference_hist: 기준 구간 비율 (n_features, n_bins)
+        current_hist: 현재 구간 비율 (n_features, n_bins)
+        edges: 구간 경계 (n_features, n_bins - 1)
+        bounds: 기준 데이터 [최솟값, 최댓값] (n_features, 2)
+
+    Returns:
+        특성별 거리 (원 단위)
+    """
+    points = np.hstack([bounds[:, :1], edges, bounds[:, 1:]])
+    cdf_diff = np.abs(
+        np.cumsum(reference_hist - current_hist, axis=1)[:, :-1]
+    )
+    # 최솟값에서는 누적 분포 차이 0, 최댓값에서는 1 - 1 = 0 으로 간주
+    cdf_diff = np.hstack([np.zeros((len(edges), 1)), cdf_diff, np.zeros((len(edges), 1))])
+    widths = np.diff(points, axis=1)
+    return (widths * (cdf_diff[:, 1:] + cdf_diff[:, :-1]) / 2).sum(axis=1)
+
+
 def calculate_drift_score(
-    reference: np.ndarray,
+    reference: Union[np.ndarray, str],
     current: np.ndarray
 ) -> float:
     """
     간단한 드리프트 점수 계산
 
     Args:
-        reference: 기준 데이터
+        reference: 기준 데이터 또는 save_baseline()으로 저장한 기준 분포 파일 경로
         current: 현재 데이터
 
     Returns:
         드리프트 점수 (0-1)
     """
-    detector = DriftDetector()
-    detector.set_reference(reference)
+    if isinstance(reference, str):
+        detector = DriftDetector.load_baseline(reference)
+    else:
+        detector = DriftDetector()
+        detector.set_reference(reference)
 
     _, results = detector.detect_drift(current)
     summary = detector.get_drift_summary(results)
 
     return summary["drift_score"]
+
+
+def calculate_drift_scores(
+    reference: Union[np.ndarray, str],
+    windows,
+    method: str = "ks",
+    significance_level: float = 0.05,
+    n_bins: int = DEFAULT_BINS,
+    n_jobs: Optional[int] = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 윈도우의 드리프트 점수를 하나의 기준 분포로 일괄 계산
+
+    기준 분포 전처리(정렬/구간 계산)는 한 번만 수행하고, 윈도우별 INFO 로그는
+    남기지 않는다. n_jobs > 1이면 기준 분포를 공유 파일로 한 번 저장하고
+    워커 프로세스가 memory-map으로 읽어 윈도우를 병렬 평가한다.
+
+    Args:
+        reference: 기준 데이터 또는 save_baseline()으로 저장한 기준 분포 파일 경로
+        windows: (n_windows, n_samples, n_features) 배열 또는 윈도우 배열의 이터러블
+        method: 검정 방법 (DriftDetector와 동일, 경로를 주면 파일의 설정 사용)
+        significance_level: 유의 수준
+        n_bins: 구간 기반 지표의 특성별 구간 수
+        n_jobs: 윈도우 병렬 평가 프로세스 수 (-1이면 CPU 코어 수)
+
+    Returns:
+        (윈도우별 드리프트 점수 (n_windows,), 윈도우·특성별 통계량 (n_windows, n_features))
+    """
+    if isinstance(reference, str):
+        detector = DriftDetector.load_baseline(reference)
+    else:
+        detector = DriftDetector(
+            significance_level=significance_level, method=method, n_bins=n_bins
+        )
+        detector.set_reference(reference)
+
+    n_jobs = resolve_n_jobs(n_jobs)
+    if n_jobs > 1:
+        outputs = score_windows_parallel(detector, windows, n_jobs)
+    else:
+        outputs = map(detector.compute_statistics, windows)
+
+    statistics, drifted = [], []
+    for window_statistics, p_values in outputs:
+        statistics.append(window_statistics)
+        drifted.append(detector.drift_flags(window_statistics, p_values))
+
+    n_features = len(detector.feature_names)
+    if not statistics:
+        return np.empty(0), np.empty((0, n_features))
+
+    logger.info(f"Drift scores computed for {len(statistics)} windows")
+    return np.mean(drifted, axis=1), np.array(statistics)
+
+
+def load_or_build_baseline(
+    baseline_path: str,
+    reference: Union[np.ndarray, QuantileSketch],
+    feature_names: Optional[List[str]] = None,
+    model_version: Optional[str] = None,
+    **detector_options
+) -> Tuple[DriftDetector, str]:
+    """
+    저장된 기준 분포를 로드하고, 없거나 모델 버전이 다르거나 파일이 손상됐을 때만 새로 계산해 저장
+
+    Args:
+        baseline_path: 기준 분포 파일 경로
+        reference: 새로 계산할 때 사용할 기준 데이터 또는 학습 데이터 스케치
+        feature_names: 특성 이름 리스트
+        model_version: 기준 분포를 만든 모델 버전
+        **detector_options: 새로 계산할 때 DriftDetector 옵션
+
+    Returns:
+        (감지기, 출처 - "baseline" 또는 "built")
+    """
+    if os.path.exists(baseline_path):
+        try:
+            detector = DriftDetector.load_baseline(baseline_path, model_version=model_version)
+            return detector, "baseline"
+        except BASELINE_LOAD_ERRORS as e:
+            logger.warning(f"Ignoring drift baseline {baseline_path}: {e!r}")
+
+    detector = DriftDetector(**detector_options)
+    if isinstance(reference, QuantileSketch):
+        detector.set_reference_sketch(reference, feature_names)
+    else:
+        detector.set_reference(reference, feature_names)
+    detector.model_version = model_version
+    try:
+        detector.save_baseline(baseline_path)
+    except OSError as e:
+        logger.warning(f"Could not persist drift baseline to {baseline_path}: {e}")
+    return detector, "built"
@@ -0,0 +1,277 @@
+"""
+Metrics History Module
+
+고정 용량 NumPy 링 버퍼에 메트릭 이력을 보관하고 윈도우 통계를 증분 유지
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+# 기본 보관 개수 (5초 간격 기록 기준 약 6일, 레코드당 64바이트)
+DEFAULT_HISTORY_CAPACITY = 100_000
+
+# 타임스탬프 최대 길이 (UTF-8 바이트, ISO 8601 마이크로초 + 시간대 오프셋은 32바이트)
+MAX_TIMESTAMP_BYTES = 32
+
+# 링 버퍼 레코드 형식 (타임스탬프는 UTF-8 인코딩 문자열)
+METRICS_DTYPE = np.dtype([
+    ("mae", np.float64),
+    ("mse", np.float64),
+    ("rmse", np.float64),
+    ("r2", np.float64),
+    ("timestamp", f"S{MAX_TIMESTAMP_BYTES}")
+])
+
+# 윈도우 통계를 유지할 필드
+STAT_FIELDS = ("mae", "r2")
+
+
+class RollingStatistics:
+    """
+    최근 window개 값의 평균/분산/최소/최대 (갱신·조회 모두 상각 O(1))
+
+    평균과 분산은 Welford 방식으로 값 추가/제거 시 증분 갱신하고, 최소/최대는
+    단조 deque(인덱스, 값)로 유지한다. 제거를 반복하면 부동소수 오차가 쌓이므로
+    윈도우가 한 바퀴 돌 때마다 버퍼에서 평균/분산을 다시 계산한다.
+    """
+
+    def __init__(self, window: int):
+        """
+        윈도우 통계 초기화
+
+        Args:
+            window: 윈도우 크기 (최근 값 개수)
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._evicted = 0
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+
+    @property
+    def std(self) -> float:
+        """모표준편차 (np.std와 동일한 ddof=0)"""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    @property
+    def min(self) -> float:
+        """윈도우 최소값"""
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        """윈도우 최대값"""
+        return self._max[0][1]
+
+    def push(self, index: int, value: float) -> None:
+        """
+        값 추가 (윈도우가 가득 찬 경우 먼저 remove() 호출 필요)
+
+        Args:
+            index: 값의 전역 순번 (단조 증가)
+            value: 추가할 값
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((index, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((index, value))
+
+    def remove(self, index: int, value: float) -> bool:
+        """
+        윈도우에서 가장 오래된 값 제거
+
+        Args:
+            index: 제거할 값의 전역 순번
+            value: 제거할 값
+
+        Returns:
+            평균/분산 재계산이 필요한지 여부 (윈도우 한 바퀴마다 True)
+        """
+        self.count -= 1
+        if self.count == 0:
+            self.mean = self._m2 = 0.0
+        else:
+            delta = value - self.mean
+            self.mean -= delta / self.count
+            self._m2 = max(0.0, self._m2 - delta * (value - self.mean))
+
+        if self._min[0][0] == index:
+            self._min.popleft()
+        if self._max[0][0] == index:
+            self._max.popleft()
+
+        self._evicted += 1
+        return self._evicted % self.window == 0
+
+    def resync(self, values: np.ndarray) -> None:
+        """
+        윈도우 값 전체로 평균/분산 재계산 (누적 오차 제거)
+
+        Args:
+            values: 현재 윈도우의 값 (count개)
+        """
+        self.mean = float(values.mean())
+        self._m2 = float(((values - self.mean) ** 2).sum())
+
+    def to_dict(self) -> Dict:
+        """통계 딕셔너리 (get_statistics 형식)"""
+        return {
+            "mean": round(self.mean, 4),
+            "std": round(self.std, 4),
+            "min": round(self.min, 4),
+            "max": round(self.max, 4)
+        }
+
+
+class MetricsHistory:
+    """
+    고정 용량 메트릭 링 버퍼
+
+    레코드는 구조화 배열(METRICS_DTYPE)에 순환 기록되어 메모리가 용량에 고정되고,
+    가장 오래된 레코드부터 덮어쓴다. 조회한 윈도우 크기마다 RollingStatistics를
+    두어 이후 기록 시 함께 갱신하므로 같은 윈도우의 반복 조회는 O(1)이다.
+    리스트처럼 len(), 인덱싱(0이 가장 오래된 레코드), 슬라이싱(ModelMetrics 리스트),
+    반복을 지원한다.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY):
+        """
+        메트릭 이력 초기화
+
+        Args:
+            capacity: 보관할 최대 레코드 수
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+
+        self.capacity = capacity
+        self.total = 0
+        self._buffer = np.zeros(capacity, dtype=METRICS_DTYPE)
+        self._rolling: Dict[int, Dict[str, RollingStatistics]] = {}
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def __getitem__(self, index: Union[int, slice]):
+        from .drift import ModelMetrics
+
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("metrics history index out of range")
+
+        record = self._buffer[(self.total - size + index) % self.capacity]
+        return ModelMetrics(
+            mae=float(record["mae"]),
+            mse=float(record["mse"]),
+            rmse=float(record["rmse"]),
+            r2=float(record["r2"]),
+            timestamp=record["timestamp"].decode("utf-8") or None
+        )
+
+    def __iter__(self) -> Iterator:
+        return (self[i] for i in range(len(self)))
+
+    def append(self, metrics) -> None:
+        """
+        메트릭 기록 (용량 초과 시 가장 오래된 레코드 덮어쓰기)
+
+        Args:
+            metrics: ModelMetrics
+
+        Raises:
+            ValueError: 타임스탬프가 MAX_TIMESTAMP_BYTES를 넘는 경우 (잘리지 않도록 거부)
+        """
+        timestamp = (metrics.timestamp or "").encode("utf-8")
+        if len(timestamp) > MAX_TIMESTAMP_BYTES:
+            raise ValueError(
+                f"timestamp exceeds {MAX_TIMESTAMP_BYTES} bytes: {metrics.timestamp!r}"
+            )
+
+        index = self.total
+        stale = []
+        for window, fields in self._rolling.items():
+            # 윈도우를 벗어나는 값은 덮어쓰기 전에 제거 (window <= capacity)
+            old = self._buffer[(index - window) % self.capacity] if index >= window else None
+            for name, rolling in fields.items():
+                if old is not None and rolling.remove(index - window, float(old[name])):
+                    stale.append((window, name, rolling))
+                rolling.push(index, float(getattr(metrics, name)))
+
+        self._buffer[index % self.capacity] = (
+            metrics.mae, metrics.mse, metrics.rmse, metrics.r2, timestamp
+        )
+        self.total += 1
+
+        for window, name, rolling in stale:
+            rolling.resync(self.window_values(name, window))
+
+    def window_values(self, name: str, window: int) -> np.ndarray:
+        """
+        최근 window개 레코드의 필드 값 (시간순)
+
+        Args:
+            name: 필드 이름
+            window: 값 개수
+
+        Returns:
+            필드 값 배열
+        """
+        start = max(0, self.total - window)
+        return self._buffer[name][np.arange(start, self.total) % self.capacity]
+
+    def statistics(self, window: Optional[int] = None) -> Dict[str, RollingStatistics]:
+        """
+        최근 window개 레코드의 필드별 통계
+
+        처음 조회하는 윈도우 크기는 버퍼에서 한 번 O(window)로 채운 뒤 등록하고,
+        이후에는 기록 시 증분 갱신된 값을 그대로 반환한다.
+
+        Args:
+            window: 윈도우 크기 (None이면 보관 중인 전체, 최대 capacity)
+
+        Returns:
+            필드 이름 → RollingStatistics
+        """
+        window = self.capacity if window is None else window
+        if not 1 <= window <= self.capacity:
+            raise ValueError(f"window must be between 1 and {self.capacity}, got {window}")
+
+        fields = self._rolling.get(window)
+        if fields is None:
+            fields = {name: RollingStatistics(window) for name in STAT_FIELDS}
+            start = max(0, self.total - window)
+            for name, rolling in fields.items():
+                for index, value in zip(range(start, self.total), self.window_values(name, window)):
+                    rolling.push(index, float(value))
+            self._rolling[window] = fields
+        return fields
+
+    def to_array(self) -> np.ndarray:
+        """보관 중인 레코드 (시간순 구조화 배열 복사본)"""
+        size = len(self)
+        return self._buffer[np.arange(self.total - size, self.total) % self.capacity]
+
+    def clear(self) -> None:
+        """이력과 윈도우 통계 초기화"""
+        self.total = 0
+        self._rolling.clear()
@@ -0,0 +1,180 @@
+"""
+Parallel Drift Testing Module
+
+특성을 여러 프로세스에 나눠 KS 검정 (기준 데이터는 메모리 매핑 .npy로 공유)
+"""
+
+import os
+import shutil
+import weakref
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from ..shared import load_shared_array, make_shared_dir, worker_cached
+
+logger = logging.getLogger(__name__)
+
+# 윈도우 병렬 평가 시 워커당 대기 작업 수 (이터러블 입력을 미리 모두 읽지 않도록 제한)
+WINDOWS_IN_FLIGHT_PER_JOB = 2
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    작업 프로세스 수 결정
+
+    Args:
+        n_jobs: 프로세스 수 (-1 또는 None이면 CPU 코어 수)
+
+    Returns:
+        1 이상의 프로세스 수
+    """
+    if n_jobs is None or n_jobs < 0:
+        return os.cpu_count() or 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0")
+    return n_jobs
+
+
+class ParallelKS:
+    """
+    특성 샤드 단위 병렬 KS 검정
+
+    정렬된 기준 데이터 (n_features, n_reference)를 .npy 파일로 한 번 기록하고
+    워커는 np.load(mmap_mode="r")로 연결하므로 작업마다 기준 데이터를 피클링하지
+    않는다. 현재 윈도우도 호출마다 같은 방식으로 공유하며, 각 워커는 연속된
+    특성 구간에 대해 ks_2samp_sorted를 수행하므로 결과는 단일 프로세스와 동일하다.
+    """
+
+    def __init__(self, reference_sorted: np.ndarray, n_jobs: int):
+        """
+        병렬 KS 엔진 초기화
+
+        Args:
+            reference_sorted: 특성별로 정렬된 기준 데이터 (n_features, n_reference)
+            n_jobs: 워커 프로세스 수
+        """
+        self.n_jobs = n_jobs
+        self.n_features = reference_sorted.shape[0]
+        self._dir = make_shared_dir("drift-")
+        self._reference_path = os.path.join(self._dir, "reference.npy")
+        np.save(self._reference_path, reference_sorted)
+
+        self._pool = ProcessPoolExecutor(max_workers=n_jobs)
+        self._finalizer = weakref.finalize(self, _cleanup, self._pool, self._dir)
+        self._calls = 0
+
+        logger.info(
+            f"Parallel KS ready: {self.n_features} features, {n_jobs} workers, "
+            f"shared reference {reference_sorted.nbytes} bytes"
+        )
+
+    def run(self, current: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        현재 데이터에 대한 특성별 KS 검정
+
+        Args:
+            current: 현재 데이터 (n_samples, n_features)
+
+        Returns:
+            (특성별 통계량 배열, 특성별 p-value 배열)
+        """
+        self._calls += 1
+        current_path = os.path.join(self._dir, f"current-{self._calls}.npy")
+        np.save(current_path, np.ascontiguousarray(np.asarray(current, dtype=np.float64).T))
+
+        try:
+            bounds = np.linspace(0, self.n_features, min(self.n_jobs, self.n_features) + 1)
+            futures = [
+                self._pool.submit(
+                    _ks_shard, self._reference_path, current_path, int(start), int(stop)
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            shards = [future.result() for future in futures]
+        finally:
+            os.remove(current_path)
+
+        return (
+            np.concatenate([statistics for statistics, _ in shards]),
+            np.concatenate([p_values for _, p_values in shards])
+        )
+
+    def close(self) -> None:
+        """워커 종료 및 공유 파일 삭제"""
+        self._finalizer()
+
+
+def _cleanup(pool: ProcessPoolExecutor, directory: str) -> None:
+    """풀 종료, 공유 디렉토리 삭제"""
+    pool.shutdown(wait=True, cancel_futures=True)
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _ks_shard(
+    reference_path: str,
+    current_path: str,
+    start: int,
+    stop: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """워커: 특성 구간 [start, stop)의 KS 검정"""
+    from .drift import ks_2samp_sorted
+
+    # 기준 데이터는 워커당 한 번만 매핑
+    reference = load_shared_array(reference_path)
+    current = np.load(current_path, mmap_mode="r")
+
+    return ks_2samp_sorted(reference[start:stop], current[start:stop].T)
+
+
+def score_windows_parallel(
+    detector,
+    windows: Iterable[np.ndarray],
+    n_jobs: int
+) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """
+    윈도우별 통계량을 여러 프로세스에서 계산 (입력 순서 유지)
+
+    기준 분포는 save_baseline()으로 공유 디렉토리에 한 번 저장하고 워커는
+    load_baseline(mmap_mode="r")로 한 번만 연결한다. 대기 작업 수를 제한하므로
+    이터러블 윈도우는 순서대로 조금씩 읽힌다.
+
+    Args:
+        detector: 기준 분포가 설정된 DriftDetector
+        windows: 윈도우 배열 (n_samples, n_features)의 이터러블
+        n_jobs: 워커 프로세스 수
+
+    Returns:
+        (통계량, p-value) 이터레이터
+    """
+    directory = make_shared_dir("drift-")
+    baseline_path = os.path.join(directory, "baseline.joblib")
+    detector.save_baseline(baseline_path)
+
+    pending = deque()
+    limit = n_jobs * WINDOWS_IN_FLIGHT_PER_JOB
+    pool = ProcessPoolExecutor(max_workers=n_jobs)
+    try:
+        for window in windows:
+            pending.append(pool.submit(_score_window, baseline_path, np.asarray(window)))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        _cleanup(pool, directory)
+
+
+def _score_window(
+    baseline_path: str,
+    window: np.ndarray
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """워커: 공유 기준 분포로 윈도우 하나의 통계량 계산"""
+    from .drift import DriftDetector
+
+    # 기준 분포는 워커당 한 번만 로드
+    detector = worker_cached(baseline_path, DriftDetector.load_baseline)
+    return detector.compute_statistics(window)
@@ -0,0 +1,233 @@
+"""
+Parquet Drift Detection Module
+
+Parquet 데이터셋(로컬 디렉토리 또는 s3:// 경로)을 메모리에 모두 올리지 않고
+필요한 열만 배치 단위로 읽어 드리프트 감지
+"""
+
+import re
+import logging
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .drift import DEFAULT_BINS, DriftDetector, DriftResult, bin_counts, bin_indices
+from .sketch import DEFAULT_SKETCH_K, QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 읽을 최대 행 수 (배치당 메모리 ≈ batch_rows × 열 수 × 8 바이트)
+DEFAULT_BATCH_ROWS = 65_536
+
+# 자동 열 선택에서 제외할 식별자 형태의 정수 열 이름 (id, customer_id, customerId,
+# pandas 인덱스 __index_level_0__ 등) - 분포 비교 의미가 없고 항상 드리프트로 보임
+ID_COLUMN_PATTERN = re.compile(r"(^|[_\-\s])[iI][dD]$|[a-z]Id$|^__")
+
+
+def iter_parquet_batches(
+    path: str,
+    columns: List[str],
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    filesystem=None
+) -> Iterator[np.ndarray]:
+    """
+    Parquet 데이터셋을 열 선택 후 배치 단위로 읽기
+
+    결측(null/NaN/inf)은 NaN으로 반환하며 행은 제외하지 않는다 (열별로 따로 제외).
+
+    Args:
+        path: Parquet 파일/디렉토리 경로 (예: data/processed/, s3://bucket/processed/)
+        columns: 읽을 열 이름 (이 순서로 반환)
+        batch_rows: 배치당 최대 행 수
+        filesystem: pyarrow 파일시스템 (None이면 경로에서 추론)
+
+    Returns:
+        (n_rows, n_columns) float64 배열의 이터레이터
+    """
+    dataset = _open_dataset(path, filesystem)
+
+    for batch in dataset.to_batches(columns=columns, batch_size=batch_rows):
+        if batch.num_rows == 0:
+            continue
+        X = np.column_stack([
+            batch.column(name).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+            for name in columns
+        ])
+        X[np.isinf(X)] = np.nan
+        yield X
+
+
+def _present(X: np.ndarray, j: int) -> np.ndarray:
+    """배치의 j번째 열에서 결측을 뺀 값 (n_values, 1)"""
+    column = X[:, j]
+    return column[~np.isnan(column)].reshape(-1, 1)
+
+
+def parquet_numeric_columns(path: str, filesystem=None) -> List[str]:
+    """
+    데이터셋 스키마의 숫자형 열 이름 (식별자 형태의 정수 열 제외)
+
+    Args:
+        path: Parquet 파일/디렉토리 경로
+        filesystem: pyarrow 파일시스템 (None이면 경로에서 추론)
+
+    Returns:
+        숫자형 열 이름 리스트 (스키마 순서)
+    """
+    import pyarrow as pa
+
+    schema = _open_dataset(path, filesystem).schema
+    return [
+        field.name for field in schema
+        if pa.types.is_floating(field.type) or (
+            pa.types.is_integer(field.type) and not ID_COLUMN_PATTERN.search(field.name)
+        )
+    ]
+
+
+def sketch_parquet(
+    path: str,
+    columns: List[str],
+    k: int = DEFAULT_SKETCH_K,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    seed: Optional[int] = None,
+    filesystem=None
+) -> List[QuantileSketch]:
+    """
+    Parquet 데이터셋을 한 번 훑어 열별 분위수 스케치 생성
+
+    결측은 열마다 따로 제외하므로 한 열의 결측이 다른 열의 분포에 영향을 주지 않는다.
+
+    Args:
+        path: Parquet 파일/디렉토리 경로
+        columns: 스케치할 열 이름
+        k: 스케치 정확도 파라미터
+        batch_rows: 배치당 최대 행 수
+        seed: compaction 난수 시드
+        filesystem: pyarrow 파일시스템 (None이면 경로에서 추론)
+
+    Returns:
+        열별 단일 특성 분위수 스케치 리스트 (count는 열별 결측 제외 값 수)
+    """
+    sketches = [QuantileSketch(1, k=k, seed=seed) for _ in columns]
+    for X in iter_parquet_batches(path, columns, batch_rows, filesystem):
+        for j, sketch in enumerate(sketches):
+            sketch.update(_present(X, j))
+    return sketches
+
+
+def histogram_parquet(
+    path: str,
+    columns: List[str],
+    edges: np.ndarray,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    filesystem=None
+) -> np.ndarray:
+    """
+    Parquet 데이터셋을 한 번 훑어 고정 구간 히스토그램 집계 (결측은 열별로 제외)
+
+    Args:
+        path: Parquet 파일/디렉토리 경로
+        columns: 집계할 열 이름
+        edges: 열별 내부 구간 경계 (n_columns, n_bins - 1)
+        batch_rows: 배치당 최대 행 수
+        filesystem: pyarrow 파일시스템 (None이면 경로에서 추론)
+
+    Returns:
+        열별 구간 카운트 (n_columns, n_bins, 열마다 합계가 다를 수 있음)
+    """
+    n_bins = edges.shape[1] + 1
+    counts = np.zeros((len(columns), n_bins), dtype=np.int64)
+    for X in iter_parquet_batches(path, columns, batch_rows, filesystem):
+        for j in range(len(columns)):
+            counts[j] += bin_counts(bin_indices(_present(X, j), edges[j:j + 1]), n_bins)[0]
+    return counts
+
+
+def detect_drift_parquet(
+    reference_path: str,
+    current_path: str,
+    columns: Optional[List[str]] = None,
+    method: str = "ks",
+    significance_level: float = 0.05,
+    n_bins: int = DEFAULT_BINS,
+    sketch_k: int = DEFAULT_SKETCH_K,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    filesystem=None
+) -> Tuple[bool, List[DriftResult]]:
+    """
+    두 Parquet 데이터셋 간 드리프트 감지
+
+    기준 데이터는 스케치로, 현재 데이터는 기준 분위수 구간의 히스토그램으로
+    요약하므로 데이터셋 크기와 무관하게 메모리는 배치 하나와 스케치/카운트로
+    제한된다. 'ks'는 구간 경계에서 평가한 KS 통계량을 사용한다.
+    결측은 열별로 제외해 열마다 자신의 값 수로 비교하며, 한쪽 데이터셋에서 값이
+    하나도 없는 열은 경고 후 결과에서 뺀다.
+
+    Args:
+        reference_path: 기준 데이터셋 경로 (예: s3://mlops-training-user01/processed/customers_cleaned/)
+        current_path: 현재 데이터셋 경로
+        columns: 비교할 열 (None이면 두 데이터셋 공통 숫자형 열, ID 형태 정수 열 제외)
+        method: 드리프트 지표 ("ks", "psi", "js", "wasserstein")
+        significance_level: 유의 수준
+        n_bins: 열별 히스토그램 구간 수
+        sketch_k: 기준 스케치 정확도 파라미터
+        batch_rows: 배치당 최대 행 수
+        filesystem: pyarrow 파일시스템 (None이면 경로에서 추론)
+
+    Returns:
+        (전체 드리프트 여부, 열별 결과 리스트)
+    """
+    if columns is None:
+        current_columns = set(parquet_numeric_columns(current_path, filesystem))
+        columns = [
+            name for name in parquet_numeric_columns(reference_path, filesystem)
+            if name in current_columns
+        ]
+        if not columns:
+            raise ValueError("Datasets have no numeric columns in common")
+
+    sketches = sketch_parquet(
+        reference_path, columns, sketch_k, batch_rows, filesystem=filesystem
+    )
+    detectors = {}
+    for name, sketch in zip(columns, sketches):
+        if sketch.count == 0:
+            logger.warning(f"Column {name} has no values in {reference_path}, skipped")
+            continue
+        detector = DriftDetector(
+            significance_level=significance_level, method=method, n_bins=n_bins
+        )
+        detector.set_reference_sketch(sketch, [name])
+        detectors[name] = detector
+    if not detectors:
+        raise ValueError(f"Reference dataset is empty: {reference_path}")
+
+    names = list(detectors)
+    edges = np.vstack([detectors[name].bin_edges for name in names])
+    counts = histogram_parquet(current_path, names, edges, batch_rows, filesystem)
+
+    results: List[DriftResult] = []
+    for name, column_counts in zip(names, counts):
+        if column_counts.sum() == 0:
+            logger.warning(f"Column {name} has no values in {current_path}, skipped")
+            continue
+        results += detectors[name].detect_drift_histogram(column_counts[np.newaxis])[1]
+    if not results:
+        raise ValueError(f"Current dataset is empty: {current_path}")
+
+    logger.info(
+        f"Parquet drift: {len(results)} columns, reference up to "
+        f"{max(d.reference_count for d in detectors.values())} rows, "
+        f"current up to {int(counts.sum(axis=1).max())} rows"
+    )
+    return any(r.drift_detected for r in results), results
+
+
+def _open_dataset(path: str, filesystem=None):
+    """pyarrow 데이터셋 열기 (pyarrow 지연 import)"""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError:
+        raise RuntimeError("Parquet drift detection requires pyarrow to be installed")
+    return ds.dataset(path, format="parquet", filesystem=filesystem)
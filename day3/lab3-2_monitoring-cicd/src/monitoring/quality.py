@@ -0,0 +1,276 @@
+"""
+Online Model Quality Module
+
+늦게 도착하는 정답 레이블로 MAE/RMSE/R²를 증분 계산 (시간 버킷별 충분통계량)
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Hashable, Optional, Tuple
+
+import numpy as np
+
+from .drift import ModelMetrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKET_SECONDS = 60.0
+DEFAULT_MAX_BUCKETS = 10_080  # 1분 버킷 기준 7일
+
+# 레이블을 기다리는 예측 최대 보관 개수/시간
+DEFAULT_MAX_PENDING = 100_000
+DEFAULT_PENDING_TTL_SECONDS = 86_400.0
+
+# 버킷 충분통계량: 개수, Σ|e|, Σe², Σy, Σy² (y는 첫 레이블 기준 이동값)
+_COUNT, _ABS, _SQ, _Y, _Y2 = range(5)
+
+
+class OnlineQualityEstimator:
+    """
+    온라인 회귀 품질 추정기
+
+    (예측, 정답) 쌍을 받을 때마다 도착 시각의 버킷에 충분통계량을 더한다.
+    버킷은 시작 이후 누적합으로 보관하므로 임의 윈도우의 통계량은 두 버킷
+    누적합의 차이(O(1))이고, 메모리는 max_buckets개 버킷으로 고정된다.
+    R²의 총제곱합은 첫 레이블만큼 이동한 값으로 누적해 상쇄 오차를 줄인다.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        pending_ttl_seconds: float = DEFAULT_PENDING_TTL_SECONDS
+    ):
+        """
+        품질 추정기 초기화
+
+        Args:
+            bucket_seconds: 시간 버킷 크기 (초, 윈도우 해상도)
+            max_buckets: 보관할 최대 버킷 수 (최대 윈도우 = bucket_seconds × max_buckets)
+            max_pending: 레이블을 기다리는 예측 최대 개수 (초과 시 오래된 것부터 폐기)
+            pending_ttl_seconds: 레이블을 기다리는 최대 시간 (초)
+        """
+        if bucket_seconds <= 0:
+            raise ValueError(f"bucket_seconds must be positive, got {bucket_seconds}")
+        if max_buckets < 1:
+            raise ValueError(f"max_buckets must be >= 1, got {max_buckets}")
+
+        self.bucket_seconds = bucket_seconds
+        self.max_buckets = max_buckets
+        self.max_pending = max_pending
+        self.pending_ttl_seconds = pending_ttl_seconds
+
+        # 슬롯 b % (max_buckets + 1)에 버킷 b까지의 누적 통계량 보관
+        self._cumulative = np.zeros((max_buckets + 1, 5))
+        self._head: Optional[int] = None
+        self._shift: Optional[float] = None
+        self._pending: "OrderedDict[Hashable, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """레이블을 기다리는 예측 수"""
+        return len(self._pending)
+
+    def record_prediction(
+        self,
+        request_id: Hashable,
+        prediction: float,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """
+        레이블 도착 전 예측 보관 (요청 ID로 이후 레이블과 결합)
+
+        Args:
+            request_id: 요청 ID
+            prediction: 예측값
+            timestamp: 예측 시각 (초, 기본 time.time())
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._pending[request_id] = (now, float(prediction))
+            self._pending.move_to_end(request_id)
+            self._expire_pending(now)
+
+    def record_label(
+        self,
+        request_id: Hashable,
+        label: float,
+        timestamp: Optional[float] = None
+    ) -> bool:
+        """
+        요청 ID로 보관된 예측과 정답 레이블 결합
+
+        Args:
+            request_id: 요청 ID
+            label: 정답값
+            timestamp: 레이블 도착 시각 (초, 기본 time.time())
+
+        Returns:
+            결합 성공 여부 (예측이 없거나 만료되었으면 False)
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._expire_pending(now)
+            entry = self._pending.pop(request_id, None)
+        if entry is None:
+            logger.debug(f"No pending prediction for request {request_id!r}")
+            return False
+
+        self.update(entry[1], label, timestamp=now)
+        return True
+
+    def update(
+        self,
+        predictions,
+        labels,
+        timestamp: Optional[float] = None
+    ) -> None:
+        """
+        (예측, 정답) 쌍 추가
+
+        Args:
+            predictions: 예측값 (스칼라 또는 배열)
+            labels: 정답값 (predictions와 같은 길이)
+            timestamp: 도착 시각 (초, 기본 time.time())
+        """
+        predictions = np.atleast_1d(np.asarray(predictions, dtype=np.float64))
+        labels = np.atleast_1d(np.asarray(labels, dtype=np.float64))
+        if predictions.shape != labels.shape:
+            raise ValueError(
+                f"Shape mismatch: predictions={predictions.shape}, labels={labels.shape}"
+            )
+        if len(labels) == 0:
+            return
+
+        now = time.time() if timestamp is None else timestamp
+        bucket = self._bucket(now)
+
+        with self._lock:
+            if self._shift is None:
+                self._shift = float(labels[0])
+            errors = predictions - labels
+            y = labels - self._shift
+            delta = np.array([
+                len(labels),
+                np.abs(errors).sum(),
+                (errors ** 2).sum(),
+                y.sum(),
+                (y ** 2).sum()
+            ])
+
+            self._advance(bucket)
+            if bucket <= self._head - self.max_buckets:
+                logger.warning(f"Dropped {len(labels)} labels older than the retained window")
+                return
+            # 과거 버킷에 도착한 경우 이후 버킷 누적합도 갱신 (순서대로면 1개)
+            for b in range(bucket, self._head + 1):
+                self._cumulative[b % len(self._cumulative)] += delta
+
+    def metrics(
+        self,
+        window_seconds: Optional[float] = None,
+        timestamp: Optional[float] = None
+    ) -> ModelMetrics:
+        """
+        윈도우 내 레이블로 성능 메트릭 계산 (O(1))
+
+        Args:
+            window_seconds: 집계 기간 (초, 버킷 단위로 올림, None이면 보관 중인 전체)
+            timestamp: 기준 시각 (초, 기본 time.time())
+
+        Returns:
+            ModelMetrics
+
+        Raises:
+            RuntimeError: 윈도우에 레이블이 없을 때
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            totals = self._window_totals(now, window_seconds)
+
+        n = totals[_COUNT]
+        if n < 1:
+            raise RuntimeError("No labelled feedback in window")
+
+        mse = max(0.0, totals[_SQ] / n)
+        total_ss = max(0.0, totals[_Y2] - totals[_Y] ** 2 / n)
+        if total_ss > 0:
+            r2 = 1.0 - totals[_SQ] / total_ss
+        else:
+            # 정답이 상수인 윈도우 (sklearn r2_score와 동일한 처리)
+            r2 = 1.0 if totals[_SQ] == 0 else 0.0
+
+        return ModelMetrics(
+            mae=float(totals[_ABS] / n),
+            mse=float(mse),
+            rmse=math.sqrt(mse),
+            r2=float(r2),
+            timestamp=datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        )
+
+    def count(
+        self,
+        window_seconds: Optional[float] = None,
+        timestamp: Optional[float] = None
+    ) -> int:
+        """
+        윈도우 내 레이블 수
+
+        Args:
+            window_seconds: 집계 기간 (초, None이면 보관 중인 전체)
+            timestamp: 기준 시각 (초, 기본 time.time())
+
+        Returns:
+            레이블 수
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            return int(round(self._window_totals(now, window_seconds)[_COUNT]))
+
+    def _bucket(self, timestamp: float) -> int:
+        """시각의 버킷 번호"""
+        return int(timestamp // self.bucket_seconds)
+
+    def _advance(self, bucket: int) -> None:
+        """최신 버킷을 bucket까지 전진 (새 버킷은 직전 누적합으로 채움, 락 보유 상태)"""
+        if self._head is None:
+            self._head = bucket
+            return
+        if bucket <= self._head:
+            return
+
+        slots = len(self._cumulative)
+        latest = self._cumulative[self._head % slots].copy()
+        for b in range(self._head + 1, min(bucket, self._head + slots) + 1):
+            self._cumulative[b % slots] = latest
+        if bucket - self._head >= slots:
+            self._cumulative[:] = latest
+        self._head = bucket
+
+    def _window_totals(self, now: float, window_seconds: Optional[float]) -> np.ndarray:
+        """최근 window_seconds 동안의 충분통계량 합 (락 보유 상태)"""
+        if self._head is None:
+            return np.zeros(5)
+
+        self._advance(self._bucket(now))
+        slots = len(self._cumulative)
+        n_buckets = self.max_buckets if window_seconds is None else min(
+            self.max_buckets, max(1, math.ceil(window_seconds / self.bucket_seconds))
+        )
+        latest = self._cumulative[self._head % slots]
+        return latest - self._cumulative[(self._head - n_buckets) % slots]
+
+    def _expire_pending(self, now: float) -> None:
+        """만료/초과 예측 제거 (락 보유 상태)"""
+        cutoff = now - self.pending_ttl_seconds
+        while self._pending:
+            _, (timestamp, _) = next(iter(self._pending.items()))
+            if timestamp >= cutoff and len(self._pending) <= self.max_pending:
+                break
+            self._pending.popitem(last=False)
@@ -0,0 +1,202 @@
+"""
+Quantile Sketch Module
+
+기준 분포를 고정 크기 KLL 분위수 스케치로 요약 (병합 가능, 메모리 상한)
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 최상위 레벨 용량 (클수록 정확, 메모리 약 3k개 값/특성)
+DEFAULT_SKETCH_K = 200
+
+# 하위 레벨 용량 감소 비율과 최소 용량 (KLL 논문 기본값)
+CAPACITY_DECAY = 2 / 3
+MIN_LEVEL_CAPACITY = 8
+
+
+class QuantileSketch:
+    """
+    특성별 KLL 분위수 스케치
+
+    레벨 h의 값은 가중치 2^h를 가지며, 레벨이 용량을 넘으면 정렬 후 하나 걸러
+    하나씩 다음 레벨로 올린다(compaction). 모든 특성이 같은 행을 받으므로
+    레벨 크기가 특성 간에 동일하고, 각 레벨을 (n_items, n_features) 배열로 두어
+    전체 특성을 한 번에 압축한다. 순위 오차는 약 1.7/k 수준이다.
+    """
+
+    def __init__(
+        self,
+        n_features: int,
+        k: int = DEFAULT_SKETCH_K,
+        seed: Optional[int] = None
+    ):
+        """
+        스케치 초기화
+
+        Args:
+            n_features: 특성 수
+            k: 최상위 레벨 용량 (정확도/메모리 조절)
+            seed: compaction 오프셋 난수 시드
+        """
+        if k < MIN_LEVEL_CAPACITY:
+            raise ValueError(f"k must be >= {MIN_LEVEL_CAPACITY}, got {k}")
+
+        self.n_features = n_features
+        self.k = k
+        self.count = 0
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+        self.levels: List[np.ndarray] = [np.empty((0, n_features))]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def n_retained(self) -> int:
+        """특성당 보관 중인 값 개수"""
+        return sum(len(level) for level in self.levels)
+
+    @property
+    def size_bytes(self) -> int:
+        """보관 중인 값의 메모리 사용량 (바이트)"""
+        return sum(level.nbytes for level in self.levels)
+
+    def update(self, X: np.ndarray) -> "QuantileSketch":
+        """
+        데이터 배치 추가
+
+        Args:
+            X: 추가할 데이터 (n_samples, n_features)
+
+        Returns:
+            self
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Feature count mismatch: sketch={self.n_features}, "
+                f"data shape={X.shape}"
+            )
+        if len(X) == 0:
+            return self
+
+        self.count += len(X)
+        self.min = np.minimum(self.min, X.min(axis=0))
+        self.max = np.maximum(self.max, X.max(axis=0))
+        self.levels[0] = np.concatenate([self.levels[0], X])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        다른 스케치 병합 (샤드/일자별 스케치 합치기)
+
+        Args:
+            other: 같은 특성 수의 스케치
+
+        Returns:
+            self
+        """
+        if other.n_features != self.n_features:
+            raise ValueError(
+                f"Feature count mismatch: sketch={self.n_features}, "
+                f"other={other.n_features}"
+            )
+
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty((0, self.n_features)))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], level])
+
+        self.count += other.count
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self._compress()
+        return self
+
+    def sorted_view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        특성별로 정렬된 보관 값과 누적 분포
+
+        Returns:
+            (정렬된 값 (n_retained, n_features),
+             각 값 이하의 누적 비율 (n_retained, n_features))
+        """
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, axis=0, kind="stable")
+        items = np.take_along_axis(items, order, axis=0)
+        cumulative = np.cumsum(weights[order], axis=0) / self.count
+        return items, cumulative
+
+    def cdf(self, values: np.ndarray) -> np.ndarray:
+        """
+        추정 누적 분포 F(x) = P(X <= x)
+
+        Args:
+            values: 평가할 값 (n_values, n_features)
+
+        Returns:
+            특성별 누적 비율 (n_values, n_features)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        items, cumulative = self.sorted_view()
+        # 첫 값 이전은 0
+        cumulative = np.vstack([np.zeros(self.n_features), cumulative])
+
+        result = np.empty(values.shape)
+        for j in range(self.n_features):
+            index = np.searchsorted(items[:, j], values[:, j], side="right")
+            result[:, j] = cumulative[index, j]
+        return result
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        특성별 분위수 추정
+
+        Args:
+            q: 분위 (0~1)
+
+        Returns:
+            특성별 추정값 (n_features,)
+        """
+        if self.count == 0:
+            raise RuntimeError("Sketch is empty")
+        if q <= 0:
+            return self.min.copy()
+        if q >= 1:
+            return self.max.copy()
+
+        items, cumulative = self.sorted_view()
+        return np.array([
+            items[min(np.searchsorted(cumulative[:, j], q), len(items) - 1), j]
+            for j in range(self.n_features)
+        ])
+
+    def _capacity(self, level: int) -> int:
+        """레벨 용량 (최상위 레벨이 k, 아래로 갈수록 2/3씩 감소)"""
+        depth = len(self.levels) - level - 1
+        return max(MIN_LEVEL_CAPACITY, int(np.ceil(self.k * CAPACITY_DECAY ** depth)))
+
+    def _compress(self) -> None:
+        """용량을 넘은 레벨을 아래부터 차례로 압축"""
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self._capacity(h):
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty((0, self.n_features)))
+                self._compact(h)
+            h += 1
+
+    def _compact(self, h: int) -> None:
+        """레벨 h를 정렬해 짝수 개 값의 절반을 가중치 2배로 다음 레벨로 이동"""
+        level = np.sort(self.levels[h], axis=0)
+        n_pairs = len(level) // 2
+        offset = int(self._rng.integers(2))
+
+        promoted = level[offset:2 * n_pairs:2]
+        self.levels[h] = level[2 * n_pairs:]
+        self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+
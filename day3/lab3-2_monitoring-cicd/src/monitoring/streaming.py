@@ -0,0 +1,307 @@
+"""
+Streaming Drift Detection Module
+
+예측 스트림을 행/미니배치 단위로 받아 슬라이딩 윈도우 드리프트를 증분 계산
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+import numpy as np
+
+from .drift import (
+    DEFAULT_BINS,
+    DriftDetector,
+    DriftResult,
+    _ks_asymptotic_p_values,
+    bin_counts,
+    bin_indices,
+    edge_quantiles,
+    quantile_edges
+)
+from .sketch import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_ROWS = 10_000
+DEFAULT_EMIT_EVERY_ROWS = 1_000
+
+# 결과를 내기 위한 최소 윈도우 행 수 (너무 작은 윈도우의 검정은 무의미)
+DEFAULT_MIN_WINDOW_ROWS = 100
+
+
+class StreamingDriftDetector(DriftDetector):
+    """
+    슬라이딩 윈도우 드리프트 감지기
+
+    기준 분포의 분위수로 특성별 구간 경계를 고정하고, 윈도우는 행별 구간 번호와
+    특성별 구간 카운트로만 유지한다. 유입 시 카운트를 더하고 만료(행 수/시간) 시
+    빼므로 갱신은 행당 O(n_features) 상각 비용이며, 결과 계산은 윈도우를 다시
+    훑지 않고 카운트의 누적합만 사용한다(구간 경계에서 평가한 KS 통계량).
+    """
+
+    def __init__(
+        self,
+        significance_level: float = 0.05,
+        n_bins: int = DEFAULT_BINS,
+        window_rows: Optional[int] = DEFAULT_WINDOW_ROWS,
+        window_seconds: Optional[float] = None,
+        emit_every_rows: Optional[int] = DEFAULT_EMIT_EVERY_ROWS,
+        emit_every_seconds: Optional[float] = None,
+        min_window_rows: int = DEFAULT_MIN_WINDOW_ROWS,
+        on_result: Optional[Callable[[bool, List[DriftResult]], None]] = None
+    ):
+        """
+        스트리밍 드리프트 감지기 초기화
+
+        Args:
+            significance_level: 유의 수준 (기본 0.05)
+            n_bins: 특성별 히스토그램 구간 수
+            window_rows: 윈도우 최대 행 수 (None이면 행 수 제한 없음)
+            window_seconds: 윈도우 최대 보존 시간 (초, None이면 시간 제한 없음)
+            emit_every_rows: 결과를 낼 유입 행 간격 (None이면 행 기준 비활성)
+            emit_every_seconds: 결과를 낼 시간 간격 (초, None이면 시간 기준 비활성)
+            min_window_rows: 결과를 내기 위한 최소 윈도우 행 수
+            on_result: 결과 발생 시 호출할 콜백 (overall_drift, results)
+        """
+        super().__init__(significance_level=significance_level, n_bins=n_bins)
+        if window_rows is None and window_seconds is None:
+            raise ValueError("window_rows or window_seconds must be set")
+
+        self.window_rows = window_rows
+        self.window_seconds = window_seconds
+        self.emit_every_rows = emit_every_rows
+        self.emit_every_seconds = emit_every_seconds
+        self.min_window_rows = min_window_rows
+        self.on_result = on_result
+
+        self.edges: Optional[np.ndarray] = None
+        self.reference_cdf: Optional[np.ndarray] = None
+        self.reference_count = 0
+        self.latest: Optional[Tuple[bool, List[DriftResult]]] = None
+
+        self._window: Deque[Tuple[float, np.ndarray]] = deque()
+        self._counts: Optional[np.ndarray] = None
+        self._size = 0
+        self._rows_since_emit = 0
+        self._last_emit: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def window_size(self) -> int:
+        """현재 윈도우 행 수"""
+        return self._size
+
+    def set_reference(
+        self,
+        data: np.ndarray,
+        feature_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        기준 데이터로 구간 경계와 기준 누적 분포 설정 (원본은 보관하지 않음)
+
+        Args:
+            data: 기준 데이터 (n_samples, n_features)
+            feature_names: 특성 이름 리스트
+        """
+        reference_sorted = np.array(np.asarray(data).T, dtype=np.float64, order="C")
+        reference_sorted.sort(axis=1)
+        edges = quantile_edges(reference_sorted, self.n_bins)
+        reference_cdf = np.stack([
+            np.searchsorted(column, column_edges, side="right")
+            for column, column_edges in zip(reference_sorted, edges)
+        ]) / reference_sorted.shape[1]
+        self._set_reference_bins(edges, reference_cdf, reference_sorted.shape[1], feature_names)
+
+    def set_reference_sketch(
+        self,
+        sketch: QuantileSketch,
+        feature_names: Optional[List[str]] = None
+    ) -> None:
+        """
+        기준 스케치로 구간 경계와 기준 누적 분포 설정
+
+        Args:
+            sketch: 기준 데이터 스케치
+            feature_names: 특성 이름 리스트
+        """
+        edges = np.stack([sketch.quantile(q) for q in edge_quantiles(self.n_bins)], axis=1)
+        reference_cdf = sketch.cdf(edges.T).T
+        self._set_reference_bins(edges, reference_cdf, sketch.count, feature_names)
+
+    def set_reference_baseline(self, baseline: DriftDetector) -> None:
+        """
+        저장된 기준 분포(DriftDetector.load_baseline)의 구간 경계/누적 분포 사용
+
+        구간 수는 기준 분포 파일의 값을 따른다.
+
+        Args:
+            baseline: 기준 분포가 설정된 감지기
+        """
+        if baseline.bin_edges is None:
+            raise RuntimeError("Baseline has no reference bins")
+
+        self.n_bins = baseline.n_bins
+        reference_cdf = np.cumsum(baseline.reference_hist, axis=1)[:, :-1]
+        self._set_reference_bins(
+            np.asarray(baseline.bin_edges),
+            reference_cdf,
+            baseline.reference_count,
+            baseline.feature_names
+        )
+
+    def detect_drift(
+        self,
+        current_data: np.ndarray
+    ) -> Tuple[bool, List[DriftResult]]:
+        """
+        주어진 배치만으로 드리프트 감지 (윈도우는 변경하지 않음)
+
+        Args:
+            current_data: 현재 데이터
+
+        Returns:
+            (전체 드리프트 여부, 특성별 결과 리스트)
+        """
+        bins = self._bin(current_data)
+        return self._evaluate(bin_counts(bins, self.n_bins), len(bins))
+
+    def ingest(
+        self,
+        X: np.ndarray,
+        timestamp: Optional[float] = None
+    ) -> Optional[Tuple[bool, List[DriftResult]]]:
+        """
+        행 또는 미니배치 유입
+
+        Args:
+            X: 입력 행 (n_features,) 또는 미니배치 (n_samples, n_features)
+            timestamp: 유입 시각 (초, 기본 time.time())
+
+        Returns:
+            결과 주기에 도달하면 (전체 드리프트 여부, 특성별 결과), 아니면 None
+        """
+        bins = self._bin(np.atleast_2d(X))
+        now = time.time() if timestamp is None else timestamp
+        histogram = bin_counts(bins, self.n_bins)
+
+        with self._lock:
+            self._window.append((now, bins))
+            self._counts += histogram
+            self._size += len(bins)
+            self._rows_since_emit += len(bins)
+            if self._last_emit is None:
+                self._last_emit = now
+            self._expire(now)
+
+            if not self._due(now):
+                return None
+            result = self._evaluate(self._counts, self._size)
+            self._rows_since_emit = 0
+            self._last_emit = now
+            self.latest = result
+
+        if self.on_result is not None:
+            self.on_result(*result)
+        return result
+
+    def check(self, timestamp: Optional[float] = None) -> Tuple[bool, List[DriftResult]]:
+        """
+        주기와 무관하게 현재 윈도우 드리프트 계산 (시간 만료 반영)
+
+        Args:
+            timestamp: 기준 시각 (초, 기본 time.time())
+
+        Returns:
+            (전체 드리프트 여부, 특성별 결과 리스트)
+        """
+        now = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._expire(now)
+            if self._size == 0:
+                raise RuntimeError("Drift window is empty")
+            self.latest = self._evaluate(self._counts, self._size)
+            return self.latest
+
+    def reset_window(self) -> None:
+        """윈도우 비우기 (기준 분포는 유지)"""
+        with self._lock:
+            self._window.clear()
+            self._counts[:] = 0
+            self._size = 0
+            self._rows_since_emit = 0
+            self._last_emit = None
+            self.latest = None
+
+    def _set_reference_bins(
+        self,
+        edges: np.ndarray,
+        reference_cdf: np.ndarray,
+        reference_count: int,
+        feature_names: Optional[List[str]]
+    ) -> None:
+        """구간 경계/기준 분포 설정 후 윈도우 초기화"""
+        n_features = edges.shape[0]
+        with self._lock:
+            self.edges = edges
+            self.reference_cdf = reference_cdf
+            self.reference_count = reference_count
+            self.feature_names = feature_names or [
+                f"feature_{i}" for i in range(n_features)
+            ]
+            self._counts = np.zeros((n_features, self.n_bins), dtype=np.int64)
+        self.reset_window()
+
+        logger.info(
+            f"Streaming drift reference set: {reference_count} samples, "
+            f"{n_features} features, {self.n_bins} bins"
+        )
+
+    def _bin(self, X: np.ndarray) -> np.ndarray:
+        """특성별 구간 번호 (n_samples, n_features)"""
+        if self.edges is None:
+            raise RuntimeError("Reference data not set. Call set_reference() first.")
+        return bin_indices(X, self.edges)
+
+    def _expire(self, now: float) -> None:
+        """행 수/시간 한도를 넘은 가장 오래된 행 제거 (락 보유 상태)"""
+        if self.window_seconds is not None:
+            cutoff = now - self.window_seconds
+            while self._window and self._window[0][0] < cutoff:
+                _, bins = self._window.popleft()
+                self._counts -= bin_counts(bins, self.n_bins)
+                self._size -= len(bins)
+
+        if self.window_rows is not None:
+            while self._size > self.window_rows:
+                timestamp, bins = self._window[0]
+                excess = self._size - self.window_rows
+                if len(bins) <= excess:
+                    self._window.popleft()
+                else:
+                    # 미니배치 일부만 만료
+                    self._window[0] = (timestamp, bins[excess:])
+                    bins = bins[:excess]
+                self._counts -= bin_counts(bins, self.n_bins)
+                self._size -= len(bins)
+
+    def _due(self, now: float) -> bool:
+        """결과 주기 도달 여부 (락 보유 상태)"""
+        if self._size < self.min_window_rows:
+            return False
+        if self.emit_every_rows is not None and self._rows_since_emit >= self.emit_every_rows:
+            return True
+        return (
+            self.emit_every_seconds is not None
+            and now - self._last_emit >= self.emit_every_seconds
+        )
+
+    def _evaluate(self, counts: np.ndarray, n: int) -> Tuple[bool, List[DriftResult]]:
+        """구간 카운트로 KS 통계량/p-value 계산"""
+        window_cdf = np.cumsum(counts[:, :-1], axis=1) / n
+        statistics = np.abs(window_cdf - self.reference_cdf).max(axis=1)
+        p_values = _ks_asymptotic_p_values(statistics, self.reference_count, n)
+        return self._build_results(statistics, p_values)
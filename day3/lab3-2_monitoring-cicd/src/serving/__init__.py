@@ -8,6 +8,10 @@ from .api import (
     validate_input,
     create_app
 )
+from .batching import MicroBatcher
+from .backends import OnnxBackend, load_backend
+from .registry import ModelRegistry, ModelNotFoundError
+from .validation import InputValidationError, validate_array
 
 __all__ = [
     "ModelServer",
@@ -15,5 +19,12 @@ __all__ = [
     "PredictionResponse",
     "HealthResponse",
     "validate_input",
-    "create_app"
+    "create_app",
+    "MicroBatcher",
+    "OnnxBackend",
+    "load_backend",
+    "ModelRegistry",
+    "ModelNotFoundError",
+    "InputValidationError",
+    "validate_array"
 ]
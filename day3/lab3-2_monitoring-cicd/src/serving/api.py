@@ -5,16 +5,36 @@ FastAPI 기반 모델 서빙 엔드포인트
 """
 
 import os
+import re
 import time
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from datetime import datetime
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+
+from ..monitoring.streaming import StreamingDriftDetector
+from . import codecs
+from .backends import load_backend
+from .batching import MicroBatcher
+from .metrics import (
+    DEFAULT_LATENCY_BUCKETS,
+    PROMETHEUS_CONTENT_TYPE,
+    ServingMetrics,
+    format_labels,
+    render_histogram
+)
+from .registry import ModelEntry, ModelNotFoundError, ModelRegistry
+from . import streaming
+from .validation import InputValidationError, validate_array
 
 logger = logging.getLogger(__name__)
 
+# /models/{version}/load 에 허용하는 버전 문자열 (아티팩트 파일명에 사용)
+VERSION_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
 
 class PredictionRequest(BaseModel):
     """예측 요청 스키마"""
@@ -61,59 +81,301 @@ class HealthResponse(BaseModel):
 class ModelServer:
     """모델 서버 클래스"""
 
-    def __init__(self, model=None, model_version: str = "v1.0"):
+    def __init__(
+        self,
+        model=None,
+        model_version: str = "v1.0",
+        startup_seconds: Optional[float] = None,
+        metrics_labels: Optional[Dict[str, str]] = None,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        model_name: str = "california-housing",
+        registry: Optional[ModelRegistry] = None,
+        drift_detector: Optional[StreamingDriftDetector] = None
+    ):
         """
         모델 서버 초기화
 
         Args:
             model: 학습된 모델 인스턴스
             model_version: 모델 버전
+            startup_seconds: 모델 준비(로드 또는 학습)에 걸린 시간 (초)
+            metrics_labels: Prometheus 메트릭 고정 레이블 (version은 요청을 처리한 버전으로 대체)
+            latency_buckets: 지연시간 히스토그램 버킷 (초)
+            model_name: 레지스트리에 등록할 모델 이름
+            registry: 모델 레지스트리 (없으면 새로 생성)
+            drift_detector: 예측 입력을 받을 스트리밍 드리프트 감지기 (선택)
         """
-        self.model = model
-        self.model_version = model_version
-        self.request_count = 0
-        self.error_count = 0
-        self.total_latency = 0.0
+        self.model_name = model_name
+        self.startup_seconds = startup_seconds
+        self.drift_detector = drift_detector
+        self.metrics = ServingMetrics(
+            labels=metrics_labels or {"version": model_version},
+            latency_buckets=latency_buckets
+        )
+        self.registry = registry or ModelRegistry()
+        self.registry.on_evict = self._on_evict
+        self._initial_version = model_version
+        self._batching: Optional[Tuple[int, int]] = None
+        # 교체/제거된 버전의 배처를 drain 중인 태스크
+        self._retiring: Set[asyncio.Task] = set()
+
+        if model is not None:
+            self.registry.register(model_name, model_version, model)
+
+    @property
+    def model(self):
+        """기본 버전 모델 (없으면 None)"""
+        entry = self.registry.default()
+        return entry.model if entry is not None else None
+
+    @property
+    def model_version(self) -> str:
+        """기본 버전"""
+        entry = self.registry.default()
+        return entry.version if entry is not None else self._initial_version
+
+    @property
+    def batcher(self) -> Optional[MicroBatcher]:
+        """기본 버전의 마이크로 배처 (배칭 비활성 시 None)"""
+        entry = self.registry.default()
+        if entry is None or self._batching is None:
+            return None
+        return self._batcher_for(entry)
 
     @property
     def is_ready(self) -> bool:
         """모델 로드 상태 확인"""
-        return self.model is not None
+        return self.registry.default() is not None
+
+    @property
+    def request_count(self) -> int:
+        """성공한 예측 요청 수"""
+        return int(self.metrics.predictions["success"].value)
+
+    @property
+    def error_count(self) -> int:
+        """실패한 예측 요청 수"""
+        return int(self.metrics.predictions["error"].value)
+
+    @property
+    def total_latency(self) -> float:
+        """누적 추론 지연시간 (ms)"""
+        return self.metrics.phase_latency["predict"].sum * 1000
+
+    def resolve(self, version: Optional[str] = None) -> ModelEntry:
+        """
+        요청을 처리할 모델 버전 조회
+
+        Args:
+            version: 고정할 버전 (None이면 기본 버전)
+
+        Returns:
+            모델 엔트리
+        """
+        if not self.is_ready:
+            raise RuntimeError("Model is not loaded")
+        return self.registry.get(self.model_name, version)
+
+    def _record_success(self, entry: ModelEntry, start_ns: int) -> float:
+        """예측 성공 기록 후 추론 지연시간(ms) 반환"""
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.metrics.observe_phase("predict", elapsed_ns / 1e9, version=entry.version)
+        self.metrics.observe_prediction("success", version=entry.version)
+        entry.request_count.inc()
+        return elapsed_ns / 1e6
+
+    def _record_error(self, entry: ModelEntry, error: Exception) -> None:
+        """예측 실패 기록"""
+        self.metrics.observe_prediction("error", version=entry.version)
+        logger.error(f"Prediction error: {error}")
+
+    def _observe_drift(self, X: np.ndarray) -> None:
+        """예측에 성공한 입력을 드리프트 감지기에 전달 (실패해도 예측에는 영향 없음)"""
+        if self.drift_detector is None:
+            return
+        try:
+            self.drift_detector.ingest(X)
+        except Exception as e:
+            logger.warning(f"Drift detector ingest failed: {e}")
+
+    def _predict_entry(self, entry: ModelEntry, X: np.ndarray) -> Tuple[np.ndarray, float]:
+        """지정한 버전으로 예측 수행"""
+        start_ns = time.perf_counter_ns()
 
-    def predict(self, instances: List[List[float]]) -> PredictionResponse:
+        try:
+            predictions = entry.model.predict(X)
+        except Exception as e:
+            self._record_error(entry, e)
+            raise
+
+        latency_ms = self._record_success(entry, start_ns)
+        self._observe_drift(X)
+        return np.asarray(predictions), latency_ms
+
+    def predict_array(
+        self,
+        X: np.ndarray,
+        version: Optional[str] = None
+    ) -> Tuple[np.ndarray, float]:
+        """
+        배열 입력 예측 수행
+
+        Args:
+            X: 입력 특성 (n_samples, n_features)
+            version: 고정할 모델 버전 (None이면 기본 버전)
+
+        Returns:
+            (예측값 배열, 지연시간 ms)
+        """
+        return self._predict_entry(self.resolve(version), X)
+
+    def predict(
+        self,
+        instances: List[List[float]],
+        version: Optional[str] = None
+    ) -> PredictionResponse:
         """
         예측 수행
 
         Args:
             instances: 입력 특성 리스트
+            version: 고정할 모델 버전 (None이면 기본 버전)
 
         Returns:
             예측 응답
         """
+        entry = self.resolve(version)
+        predictions, latency_ms = self._predict_entry(entry, np.asarray(instances))
+
+        return PredictionResponse(
+            predictions=predictions.tolist(),
+            model_version=entry.version,
+            latency_ms=round(latency_ms, 3)
+        )
+
+    def enable_batching(
+        self,
+        max_batch_size: int = 64,
+        max_wait_us: int = 2000
+    ) -> MicroBatcher:
+        """
+        동시 요청을 묶어 추론하는 마이크로 배칭 활성화 (버전별 배처)
+
+        Args:
+            max_batch_size: 한 번에 추론할 최대 행 수
+            max_wait_us: 배치를 채우기 위해 기다리는 최대 시간 (마이크로초)
+
+        Returns:
+            기본 버전의 MicroBatcher
+        """
         if not self.is_ready:
             raise RuntimeError("Model is not loaded")
 
-        start_time = time.time()
+        self._batching = (max_batch_size, max_wait_us)
+        logger.info(
+            f"Micro-batching enabled: max_batch_size={max_batch_size}, "
+            f"max_wait_us={max_wait_us}"
+        )
+        return self.batcher
+
+    def _batcher_for(self, entry: ModelEntry) -> MicroBatcher:
+        """버전별 마이크로 배처 (최초 사용 시 생성)"""
+        if entry.batcher is None:
+            max_batch_size, max_wait_us = self._batching
+            entry.batcher = MicroBatcher(
+                entry.model.predict,
+                max_batch_size=max_batch_size,
+                max_wait_us=max_wait_us
+            )
+        return entry.batcher
 
+    def _on_evict(self, entry: ModelEntry) -> None:
+        """
+        레지스트리에서 교체/제거된 버전의 배처 퇴역
+
+        이미 이 버전으로 해석되어 큐에 들어간 요청이 있으므로 바로 취소하지 않고
+        새 요청만 거부한 뒤 남은 배치를 모두 처리하고 종료한다.
+        """
+        if entry.batcher is None:
+            return
         try:
-            X = np.array(instances)
-            predictions = self.model.predict(X)
-            latency_ms = (time.time() - start_time) * 1000
+            task = asyncio.get_running_loop().create_task(entry.batcher.stop(drain=True))
+        except RuntimeError:
+            # 이벤트 루프 밖 (워커가 시작되지 않은 상태)
+            return
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def predict_array_async(
+        self,
+        X: np.ndarray,
+        version: Optional[str] = None
+    ) -> Tuple[np.ndarray, float]:
+        """
+        배열 입력 예측 수행 (마이크로 배칭 사용, 비활성 시 스레드풀에서 predict_array())
 
-            self.request_count += 1
-            self.total_latency += latency_ms
+        Args:
+            X: 입력 특성 (n_samples, n_features)
+            version: 고정할 모델 버전 (None이면 기본 버전)
 
-            return PredictionResponse(
-                predictions=predictions.tolist(),
-                model_version=self.model_version,
-                latency_ms=round(latency_ms, 3)
-            )
+        Returns:
+            (예측값 배열, 지연시간 ms)
+        """
+        entry = self.resolve(version)
+
+        if self._batching is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._predict_entry, entry, X)
 
+        start_ns = time.perf_counter_ns()
+
+        try:
+            predictions = await self._batcher_for(entry).submit(X)
         except Exception as e:
-            self.error_count += 1
-            logger.error(f"Prediction error: {e}")
+            self._record_error(entry, e)
             raise
 
+        latency_ms = self._record_success(entry, start_ns)
+        self._observe_drift(X)
+        return predictions, latency_ms
+
+    async def predict_async(
+        self,
+        instances: List[List[float]],
+        version: Optional[str] = None
+    ) -> PredictionResponse:
+        """
+        예측 수행 (마이크로 배칭 사용, 비활성 시 predict()와 동일)
+
+        Args:
+            instances: 입력 특성 리스트
+            version: 고정할 모델 버전 (None이면 기본 버전)
+
+        Returns:
+            예측 응답
+        """
+        if self._batching is None:
+            return self.predict(instances, version=version)
+
+        entry = self.resolve(version)
+        predictions, latency_ms = await self.predict_array_async(
+            np.asarray(instances), version=entry.version
+        )
+
+        return PredictionResponse(
+            predictions=predictions.tolist(),
+            model_version=entry.version,
+            latency_ms=round(latency_ms, 3)
+        )
+
+    async def stop(self) -> None:
+        """모든 버전의 마이크로 배처 종료 (남은 요청 처리 후)"""
+        for entry in self.registry.entries():
+            if entry.batcher is not None:
+                await entry.batcher.stop()
+        if self._retiring:
+            await asyncio.gather(*self._retiring)
+
     def health_check(self) -> HealthResponse:
         """헬스 체크"""
         return HealthResponse(
@@ -133,14 +395,109 @@ class ModelServer:
             if (self.request_count + self.error_count) > 0 else 0
         )
 
-        return {
+        metrics = {
             "request_count": self.request_count,
             "error_count": self.error_count,
             "error_rate": round(error_rate, 4),
             "avg_latency_ms": round(avg_latency, 3),
             "model_version": self.model_version,
-            "model_loaded": self.is_ready
+            "model_loaded": self.is_ready,
+            "backend": getattr(self.model, "name", "sklearn"),
+            "startup_seconds": (
+                round(self.startup_seconds, 3)
+                if self.startup_seconds is not None else None
+            )
+        }
+
+        metrics["phase_latency_ms"] = {
+            phase: {
+                "count": histogram.count,
+                "p50": _quantile_ms(histogram, 0.50),
+                "p99": _quantile_ms(histogram, 0.99)
+            }
+            for phase, histogram in self.metrics.phase_latency.items()
+        }
+
+        if self.batcher is not None:
+            metrics["batching"] = self.batcher.get_metrics()
+
+        metrics["registry"] = self.registry.describe()
+
+        if self.drift_detector is not None:
+            metrics["drift"] = self.drift_status()
+
+        return metrics
+
+    def drift_status(self) -> Optional[dict]:
+        """스트리밍 드리프트 상태 (감지기 미설정 시 None)"""
+        detector = self.drift_detector
+        if detector is None:
+            return None
+
+        status = {
+            "window_rows": detector.window_size,
+            "reference_rows": detector.reference_count,
+            "drift_detected": None
         }
+        if detector.latest is not None:
+            has_drift, results = detector.latest
+            status["drift_detected"] = has_drift
+            status.update(detector.get_drift_summary(results))
+            status["features"] = [r.to_dict() for r in results]
+        return status
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 포맷 메트릭 (/metrics/prometheus)"""
+        extra = []
+        batchers = [
+            (self.metrics.labels_for(entry.version), entry.batcher)
+            for entry in self.registry.entries() if entry.batcher is not None
+        ]
+        if batchers:
+            extra += render_histogram(
+                "model_batch_size",
+                "Rows per micro-batch",
+                [(labels, batcher.batch_size_histogram) for labels, batcher in batchers]
+            )
+            extra += render_histogram(
+                "model_batch_queue_wait_microseconds",
+                "Time a request waited in the micro-batch queue",
+                [(labels, batcher.queue_wait_histogram) for labels, batcher in batchers]
+            )
+        if self.drift_detector is not None and self.drift_detector.latest is not None:
+            extra += render_drift(
+                self.metrics.labels_for(self.model_version), self.drift_detector.latest[1]
+            )
+        return self.metrics.render_prometheus(extra=extra)
+
+
+def render_drift(labels: Dict[str, str], results: list) -> List[str]:
+    """
+    최근 스트리밍 드리프트 결과를 Prometheus 게이지 라인으로 변환
+
+    Args:
+        labels: 고정 레이블
+        results: 특성별 DriftResult 목록
+
+    Returns:
+        텍스트 라인 목록
+    """
+    lines = []
+    for name, help_text, attr in (
+        ("model_feature_drift_statistic", "KS statistic of the live window per feature", "statistic"),
+        ("model_feature_drift_p_value", "KS p-value of the live window per feature", "p_value")
+    ):
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        for result in results:
+            feature_labels = format_labels({**labels, "feature": result.feature_name})
+            lines.append(f"{name}{feature_labels} {getattr(result, attr):.9g}")
+    return lines
+
+
+def _quantile_ms(histogram, q: float) -> Optional[float]:
+    """히스토그램 분위수 (초 → ms)"""
+    value = histogram.quantile(q)
+    return round(value * 1000, 3) if value is not None else None
 
 
 def validate_input(instances: List[List[float]]) -> bool:
@@ -153,39 +510,73 @@ def validate_input(instances: List[List[float]]) -> bool:
     Returns:
         유효성 여부
     """
-    if not instances:
+    try:
+        validate_array(instances)
+    except InputValidationError as e:
+        logger.warning(str(e))
         return False
 
-    expected_features = 8  # California Housing 특성 수
-
-    for instance in instances:
-        if len(instance) != expected_features:
-            logger.warning(
-                f"Invalid feature count: expected {expected_features}, "
-                f"got {len(instance)}"
-            )
-            return False
-
-        if not all(isinstance(x, (int, float)) for x in instance):
-            logger.warning("Non-numeric values in input")
-            return False
-
     return True
 
 
-def create_app(model=None, model_version: str = "v1.0"):
+def create_app(
+    model=None,
+    model_version: str = "v1.0",
+    startup_seconds: Optional[float] = None,
+    batch_max_size: int = 0,
+    batch_max_wait_us: int = 2000,
+    backend: str = "sklearn",
+    backend_options: Optional[dict] = None,
+    validate_ranges: bool = False,
+    metrics_labels: Optional[Dict[str, str]] = None,
+    latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    model_name: str = "california-housing",
+    model_dir: Optional[str] = None,
+    memory_budget_bytes: Optional[int] = None,
+    stream_chunk_rows: int = streaming.DEFAULT_CHUNK_ROWS,
+    drift_detector: Optional[StreamingDriftDetector] = None
+):
     """
     FastAPI 앱 생성 (FastAPI가 설치된 환경에서 사용)
 
     Args:
         model: 학습된 모델
         model_version: 모델 버전
+        startup_seconds: 모델 준비에 걸린 시간 (초, /metrics에 노출)
+        batch_max_size: 마이크로 배치 최대 행 수 (0이면 배칭 비활성)
+        batch_max_wait_us: 마이크로 배치 최대 대기 시간 (마이크로초)
+        backend: 추론 백엔드 (sklearn, onnx, onnx_quantized - 선형 모델만)
+        backend_options: load_backend()에 전달할 추가 옵션
+        validate_ranges: 학습 데이터 특성 범위를 벗어난 입력 거부 여부
+        metrics_labels: Prometheus 메트릭 고정 레이블
+        latency_buckets: 지연시간 히스토그램 버킷 (초)
+        model_name: 모델 이름 (레지스트리 키, 아티팩트 파일명)
+        model_dir: 새 버전 아티팩트 디렉토리 ({model_name}-{version}.joblib, 없으면 로드 비활성)
+        memory_budget_bytes: 레지스트리 메모리 예산 (None이면 무제한)
+        stream_chunk_rows: /predict/stream 기본 청크 행 수
+        drift_detector: 예측 입력으로 갱신할 스트리밍 드리프트 감지기 (선택, /drift)
 
     Returns:
         FastAPI 앱 인스턴스
     """
+    # 백엔드 로드 실패(패리티 검사 실패 포함)는 서빙을 시작하지 않도록 그대로 전파
+    if model is not None:
+        model = load_backend(model, backend=backend, **(backend_options or {}))
+
     try:
-        from fastapi import FastAPI, HTTPException
+        from fastapi import FastAPI, HTTPException, Request, Response
+        from fastapi.responses import StreamingResponse
+        from fastapi.exceptions import RequestValidationError
+
+        class BodyReaderStreamingResponse(StreamingResponse):
+            """요청 본문 리더와 함께 보내는 스트리밍 응답 (receive를 직접 호출하지 않음)"""
+
+            def __init__(self, content, reader: streaming.BodyReader, **kwargs):
+                super().__init__(content, **kwargs)
+                self.reader = reader
+
+            async def __call__(self, scope, receive, send):
+                await self.reader.run_until_disconnect(self.stream_response(send))
 
         app = FastAPI(
             title="California Housing Model API",
@@ -193,7 +584,29 @@ def create_app(model=None, model_version: str = "v1.0"):
             version=model_version
         )
 
-        server = ModelServer(model=model, model_version=model_version)
+        server = ModelServer(
+            model=model,
+            model_version=model_version,
+            startup_seconds=startup_seconds,
+            metrics_labels=metrics_labels,
+            latency_buckets=latency_buckets,
+            model_name=model_name,
+            registry=ModelRegistry(
+                memory_budget_bytes=memory_budget_bytes,
+                warmup_X=getattr(model, "reference_sample", None)
+            ),
+            drift_detector=drift_detector
+        )
+        loading_tasks = set()
+        if batch_max_size > 0 and server.is_ready:
+            server.enable_batching(
+                max_batch_size=batch_max_size,
+                max_wait_us=batch_max_wait_us
+            )
+
+        @app.on_event("shutdown")
+        async def shutdown():
+            await server.stop()
 
         @app.get("/health", response_model=HealthResponse)
         def health():
@@ -203,17 +616,231 @@ def create_app(model=None, model_version: str = "v1.0"):
         def metrics():
             return server.get_metrics()
 
-        @app.post("/predict", response_model=PredictionResponse)
-        def predict(request: PredictionRequest):
-            if not validate_input(request.instances):
+        @app.get("/metrics/prometheus")
+        def metrics_prometheus():
+            return Response(
+                content=server.render_prometheus(),
+                media_type=PROMETHEUS_CONTENT_TYPE
+            )
+
+        @app.get("/drift")
+        def drift():
+            status = server.drift_status()
+            if status is None:
+                raise HTTPException(status_code=404, detail="Drift detection is disabled")
+            return status
+
+        @app.get("/models")
+        def models():
+            return server.registry.describe()
+
+        @app.post("/models/{version}/load", status_code=202)
+        async def load_model(version: str, make_default: bool = True):
+            if model_dir is None:
+                raise HTTPException(status_code=404, detail="Model loading is disabled")
+            if not VERSION_PATTERN.match(version):
+                raise HTTPException(status_code=400, detail=f"Invalid version: {version}")
+
+            path = os.path.join(model_dir, f"{model_name}-{version}.joblib")
+            if not os.path.exists(path):
+                raise HTTPException(status_code=404, detail=f"Artifact not found: {path}")
+
+            # 로드/워밍업은 백그라운드에서 진행, 완료 시 기본 포인터 교체
+            task = asyncio.get_running_loop().create_task(server.registry.load_async(
+                model_name, version, lambda: load_artifact(path), make_default=make_default
+            ))
+            loading_tasks.add(task)
+            task.add_done_callback(finish_loading)
+            return {"name": model_name, "version": version, "status": "loading"}
+
+        @app.post("/models/{version}/default")
+        def set_default_model(version: str):
+            try:
+                entry = server.registry.set_default(model_name, version)
+            except ModelNotFoundError as e:
+                raise HTTPException(status_code=404, detail=str(e))
+            return entry.to_dict()
+
+        def load_artifact(path: str):
+            """아티팩트 로드 후 서빙 백엔드 적용 (스레드풀에서 실행)"""
+            from ..model.trainer import CaliforniaHousingModel
+
+            loaded = CaliforniaHousingModel.load(path, mmap_mode="r")
+            options = dict(backend_options or {})
+            if backend != "sklearn":
+                options["onnx_path"] = os.path.splitext(path)[0] + f".{backend}.onnx"
+            return load_backend(loaded, backend=backend, **options)
+
+        def finish_loading(task: asyncio.Task) -> None:
+            """백그라운드 로드 태스크 정리 (실패는 /models에 기록됨)"""
+            loading_tasks.discard(task)
+            if not task.cancelled():
+                task.exception()
+
+        binary_body = {"schema": {"type": "string", "format": "binary"}}
+        request_body = {
+            "required": True,
+            "content": {
+                codecs.JSON: {"schema": PredictionRequest.model_json_schema()},
+                **{ct: binary_body for ct in codecs.BINARY_CONTENT_TYPES}
+            }
+        }
+
+        @app.post(
+            "/predict",
+            response_model=PredictionResponse,
+            openapi_extra={"requestBody": request_body}
+        )
+        async def predict(request: Request):
+            start_ns = time.perf_counter_ns()
+            content_type = codecs.media_type(request.headers.get("content-type"))
+            if content_type != codecs.JSON and content_type not in codecs.BINARY_CONTENT_TYPES:
                 raise HTTPException(
-                    status_code=400,
-                    detail="Invalid input: expected 8 features per instance"
+                    status_code=415,
+                    detail=f"Unsupported content type: {content_type}"
                 )
+
+            entry = resolve_entry(request)
+
+            body = await request.body()
+            instances = parse_body(body, content_type)
+            mark_ns = server.metrics.lap("parse", start_ns, version=entry.version)
+
+            X = check_input(instances, entry)
+            server.metrics.lap("validate", mark_ns, version=entry.version)
+
             try:
-                return server.predict(request.instances)
+                predictions, latency_ms = await server.predict_array_async(
+                    X, version=entry.version
+                )
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
+            mark_ns = time.perf_counter_ns()
+
+            if content_type == codecs.JSON:
+                content = PredictionResponse(
+                    predictions=predictions.tolist(),
+                    model_version=entry.version,
+                    latency_ms=round(latency_ms, 3)
+                ).model_dump_json()
+            else:
+                content = codecs.encode_response(
+                    predictions, content_type, codecs.response_dtype(X)
+                )
+            end_ns = server.metrics.lap("serialize", mark_ns, version=entry.version)
+            server.metrics.observe_request((end_ns - start_ns) / 1e9, version=entry.version)
+
+            return Response(
+                content=content,
+                media_type=content_type,
+                headers={
+                    "X-Model-Version": entry.version,
+                    "X-Latency-Ms": f"{latency_ms:.3f}"
+                }
+            )
+
+        def parse_body(body: bytes, content_type: str):
+            """요청 본문 파싱 (JSON 스키마 또는 바이너리 포맷)"""
+            if content_type == codecs.JSON:
+                try:
+                    return PredictionRequest.model_validate_json(body).instances
+                except ValidationError as e:
+                    raise RequestValidationError(e.errors())
+
+            # 바이너리 포맷은 복사 없이 디코딩
+            try:
+                return codecs.decode_request(body, content_type)
+            except codecs.UnsupportedFormatError as e:
+                raise HTTPException(status_code=415, detail=str(e))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid input: {e}")
+
+        @app.post("/predict/stream")
+        async def predict_stream(request: Request, chunk_rows: int = stream_chunk_rows):
+            content_type = codecs.media_type(request.headers.get("content-type"))
+            if content_type not in streaming.STREAM_CONTENT_TYPES:
+                raise HTTPException(
+                    status_code=415,
+                    detail=f"Unsupported content type: {content_type} "
+                           f"(expected one of {list(streaming.STREAM_CONTENT_TYPES)})"
+                )
+            if not 1 <= chunk_rows <= streaming.MAX_CHUNK_ROWS:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"chunk_rows must be between 1 and {streaming.MAX_CHUNK_ROWS}"
+                )
+
+            entry = resolve_entry(request)
+            codec = streaming.stream_codec(content_type)
+            feature_ranges = feature_ranges_for(entry)
+
+            async def predict_chunk(X: np.ndarray) -> np.ndarray:
+                predictions, _ = await server.predict_array_async(X, version=entry.version)
+                return predictions
+
+            # receive는 리더만 호출하고, 응답은 리더의 연결 종료 신호로 중단
+            reader = streaming.BodyReader(request.receive)
+            chunks = streaming.stream_predictions(
+                reader.chunks(),
+                codec,
+                predict=predict_chunk,
+                validate=lambda X: validate_array(X, feature_ranges=feature_ranges),
+                chunk_rows=chunk_rows
+            )
+
+            # 첫 청크는 응답 전에 처리해 입력 형식 오류를 상태 코드로 반환
+            try:
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                error = HTTPException(status_code=400, detail="Invalid input: empty body")
+            except InputValidationError as e:
+                error = HTTPException(status_code=400, detail=e.to_dict())
+            except ValueError as e:
+                error = HTTPException(status_code=400, detail=f"Invalid input: {e}")
+            except Exception as e:
+                error = HTTPException(status_code=500, detail=str(e))
+            else:
+                error = None
+            if error is not None:
+                reader.close()
+                raise error
+
+            async def body():
+                yield first
+                try:
+                    async for chunk in chunks:
+                        yield chunk
+                except Exception as e:
+                    # 상태 코드가 이미 전송됨: 오류를 마지막 레코드로 기록하고 종료
+                    logger.error(f"Streaming prediction error: {e}")
+                    yield codec.encode_error(e)
+
+            return BodyReaderStreamingResponse(
+                body(),
+                reader,
+                media_type=content_type,
+                headers={"X-Model-Version": entry.version}
+            )
+
+        def resolve_entry(request: Request) -> ModelEntry:
+            """X-Model-Version 헤더로 처리할 모델 버전 선택"""
+            try:
+                return server.resolve(request.headers.get("x-model-version"))
+            except (RuntimeError, ModelNotFoundError) as e:
+                raise HTTPException(status_code=404, detail=str(e))
+
+        def feature_ranges_for(entry: ModelEntry) -> Optional[np.ndarray]:
+            """범위 검증에 사용할 특성 범위 (비활성 시 None)"""
+            if not validate_ranges:
+                return None
+            return getattr(entry.model, "feature_ranges", None)
+
+        def check_input(X, entry: ModelEntry) -> np.ndarray:
+            """입력 검증 (실패 시 문제 행/열을 담은 400 응답)"""
+            try:
+                return validate_array(X, feature_ranges=feature_ranges_for(entry))
+            except InputValidationError as e:
+                raise HTTPException(status_code=400, detail=e.to_dict())
 
         return app
 
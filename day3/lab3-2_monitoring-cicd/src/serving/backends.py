@@ -0,0 +1,282 @@
+"""
+Inference Backend Module
+
+ModelServer에서 사용할 추론 백엔드 (sklearn, ONNX Runtime, 양자화 ONNX)
+"""
+
+import os
+import logging
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_BACKENDS = ("sklearn", "onnx", "onnx_quantized")
+
+
+class OnnxBackend:
+    """ONNX Runtime 추론 백엔드 (단일 warm InferenceSession 재사용)"""
+
+    def __init__(
+        self,
+        model_bytes: bytes,
+        name: str = "onnx",
+        n_features: int = 8,
+        intra_op_threads: int = 1,
+        inter_op_threads: int = 1
+    ):
+        """
+        ONNX 백엔드 초기화
+
+        Args:
+            model_bytes: 직렬화된 ONNX 모델
+            name: 백엔드 이름 (메트릭/로그 표시용)
+            n_features: 입력 특성 수
+            intra_op_threads: 연산자 내부 병렬 스레드 수
+            inter_op_threads: 연산자 간 병렬 스레드 수
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        self.name = name
+        self.n_features = n_features
+        self.size_bytes = len(model_bytes)
+        self.reference_sample = None
+        self.feature_ranges = None
+        self.session = ort.InferenceSession(
+            model_bytes,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_name = self.session.get_outputs()[0].name
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        예측 수행
+
+        Args:
+            X: 입력 특성 (n_samples, n_features)
+
+        Returns:
+            예측값 배열 (float32)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        if X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected {self.n_features} features, got {X.shape[1]}"
+            )
+
+        return self.session.run([self.output_name], {self.input_name: X})[0].ravel()
+
+
+def check_quantizable(model) -> None:
+    """
+    동적 양자화가 효과가 있는 모델인지 확인
+
+    onnxruntime quantize_dynamic은 MatMul/Gemm 등 가중치 연산만 양자화한다.
+    트리 앙상블은 TreeEnsembleRegressor 연산자 하나로 변환되어 양자화할 연산이
+    없으므로 결과가 'onnx'와 같다 (더 작거나 빠르지 않음).
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+
+    Raises:
+        ValueError: 트리 앙상블 모델인 경우
+    """
+    if hasattr(model.model, "estimators_"):
+        raise ValueError(
+            f"Dynamic quantization has no effect on {model.model_type} "
+            f"(tree ensembles have no MatMul/Gemm weights); use backend 'onnx'"
+        )
+
+
+def convert_to_onnx(model, quantize: bool = False) -> bytes:
+    """
+    CaliforniaHousingModel을 ONNX로 변환
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+        quantize: 동적 양자화(UINT8 가중치) 적용 여부 (선형 모델만, check_quantizable 참고)
+
+    Returns:
+        직렬화된 ONNX 모델
+
+    Raises:
+        ValueError: 트리 앙상블을 양자화하려는 경우
+    """
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    if not model.is_fitted:
+        raise RuntimeError("Model is not fitted. Cannot convert to ONNX.")
+    if quantize:
+        check_quantizable(model)
+
+    initial_type = [("float_input", FloatTensorType([None, len(model.FEATURE_NAMES)]))]
+    onnx_model = convert_sklearn(model.model, initial_types=initial_type)
+
+    # 일부 skl2onnx 버전은 같은 도메인의 opset을 중복 기록함 (양자화 도구가 거부)
+    opsets = {}
+    for opset in onnx_model.opset_import:
+        opsets[opset.domain] = max(opset.version, opsets.get(opset.domain, 0))
+    del onnx_model.opset_import[:]
+    for domain, version in opsets.items():
+        opset = onnx_model.opset_import.add()
+        opset.domain = domain
+        opset.version = version
+
+    onnx_bytes = onnx_model.SerializeToString()
+    if not quantize:
+        return onnx_bytes
+
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    # quantize_dynamic은 파일 경로만 받음
+    with tempfile.TemporaryDirectory() as tmpdir:
+        src_path = os.path.join(tmpdir, "model.onnx")
+        dst_path = os.path.join(tmpdir, "model_quantized.onnx")
+        with open(src_path, "wb") as f:
+            f.write(onnx_bytes)
+        quantize_dynamic(
+            model_input=src_path,
+            model_output=dst_path,
+            weight_type=QuantType.QUInt8
+        )
+        with open(dst_path, "rb") as f:
+            return f.read()
+
+
+def check_parity(
+    reference,
+    candidate,
+    X: np.ndarray,
+    tolerance: float = 1e-3
+) -> float:
+    """
+    기준 모델과 후보 백엔드의 예측 일치 여부 확인
+
+    Args:
+        reference: 기준 모델 (sklearn)
+        candidate: 검증할 백엔드
+        X: 기준 샘플
+        tolerance: 허용 최대 절대 오차
+
+    Returns:
+        최대 절대 오차
+
+    Raises:
+        RuntimeError: 오차가 허용치를 넘는 경우
+    """
+    expected = np.asarray(reference.predict(X), dtype=np.float64)
+    actual = np.asarray(candidate.predict(X), dtype=np.float64)
+    max_abs_diff = float(np.max(np.abs(expected - actual)))
+
+    if max_abs_diff > tolerance:
+        raise RuntimeError(
+            f"Parity check failed for backend '{getattr(candidate, 'name', candidate)}': "
+            f"max abs diff {max_abs_diff:.6g} > tolerance {tolerance:g} "
+            f"on {len(X)} reference samples"
+        )
+
+    logger.info(
+        f"Parity check passed: max abs diff {max_abs_diff:.6g} "
+        f"(tolerance {tolerance:g}, {len(X)} samples)"
+    )
+    return max_abs_diff
+
+
+def load_backend(
+    model,
+    backend: str = "sklearn",
+    onnx_path: Optional[str] = None,
+    intra_op_threads: int = 1,
+    inter_op_threads: int = 1,
+    parity_tolerance: float = 1e-3,
+    reference_X: Optional[np.ndarray] = None
+):
+    """
+    설정에 따른 추론 백엔드 로드
+
+    ONNX 계열 백엔드는 기준 샘플로 원본 모델과 예측을 비교하고,
+    오차가 허용치를 넘으면 서빙을 거부한다.
+
+    Args:
+        model: 학습된 CaliforniaHousingModel
+        backend: 백엔드 이름 (sklearn, onnx, onnx_quantized)
+        onnx_path: 변환된 ONNX 캐시 경로 (일치하면 재사용, 아니면 변환 후 저장)
+        intra_op_threads: ONNX Runtime intra-op 스레드 수
+        inter_op_threads: ONNX Runtime inter-op 스레드 수
+        parity_tolerance: 허용 최대 절대 오차
+        reference_X: 패리티 검사용 샘플 (없으면 모델의 reference_sample 사용)
+
+    Returns:
+        predict(X)를 제공하는 백엔드 인스턴스
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드이거나 트리 앙상블에 'onnx_quantized'를 지정한 경우
+    """
+    if backend not in SUPPORTED_BACKENDS:
+        raise ValueError(
+            f"Unsupported backend: {backend}. Supported: {list(SUPPORTED_BACKENDS)}"
+        )
+
+    if backend == "sklearn":
+        return model
+    if backend == "onnx_quantized":
+        # 캐시된 ONNX 파일을 쓰기 전에 확인 (트리 모델은 'onnx'와 같은 결과)
+        check_quantizable(model)
+
+    if reference_X is None:
+        reference_X = getattr(model, "reference_sample", None)
+    if reference_X is None:
+        raise ValueError(
+            f"No reference sample available for the '{backend}' parity check"
+        )
+    reference_X = np.asarray(reference_X)
+
+    session_options = {
+        "name": backend,
+        "n_features": len(model.FEATURE_NAMES),
+        "intra_op_threads": intra_op_threads,
+        "inter_op_threads": inter_op_threads
+    }
+
+    # 캐시된 ONNX 파일이 현재 모델과 일치하면 변환을 건너뜀
+    if onnx_path and os.path.exists(onnx_path):
+        with open(onnx_path, "rb") as f:
+            instance = OnnxBackend(f.read(), **session_options)
+        try:
+            check_parity(model, instance, reference_X, tolerance=parity_tolerance)
+            logger.info(f"ONNX model loaded from {onnx_path}")
+            return _attach_metadata(instance, model, reference_X)
+        except RuntimeError as e:
+            logger.warning(f"Stale ONNX model at {onnx_path}, reconverting: {e}")
+
+    onnx_bytes = convert_to_onnx(model, quantize=(backend == "onnx_quantized"))
+    instance = OnnxBackend(onnx_bytes, **session_options)
+    check_parity(model, instance, reference_X, tolerance=parity_tolerance)
+
+    if onnx_path:
+        os.makedirs(os.path.dirname(onnx_path) or ".", exist_ok=True)
+        with open(onnx_path, "wb") as f:
+            f.write(onnx_bytes)
+        logger.info(f"ONNX model saved to {onnx_path}")
+
+    return _attach_metadata(instance, model, reference_X)
+
+
+def _attach_metadata(instance: OnnxBackend, model, reference_X: np.ndarray) -> OnnxBackend:
+    """레지스트리 워밍업과 입력 범위 검증에 쓰이는 원본 모델 메타데이터 복사"""
+    instance.reference_sample = reference_X
+    instance.feature_ranges = getattr(model, "feature_ranges", None)
+    return instance
@@ -0,0 +1,221 @@
+"""
+Micro-Batching Module
+
+동시에 들어온 예측 요청을 하나의 행렬로 묶어 한 번에 추론
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+from .metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+QUEUE_WAIT_US_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+class MicroBatcher:
+    """비동기 마이크로 배치 큐"""
+
+    def __init__(
+        self,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        max_batch_size: int = 64,
+        max_wait_us: int = 2000
+    ):
+        """
+        마이크로 배처 초기화
+
+        Args:
+            predict_fn: (n_samples, n_features) 행렬을 받아 예측값을 반환하는 함수
+            max_batch_size: 한 번에 추론할 최대 행 수
+            max_wait_us: 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간 (마이크로초)
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait_us < 0:
+            raise ValueError("max_wait_us must be >= 0")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_us = max_wait_us
+
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_histogram = Histogram(QUEUE_WAIT_US_BUCKETS)
+        self.batch_count = 0
+
+        self._pending: Deque[Tuple[np.ndarray, asyncio.Future, float]] = deque()
+        self._pending_rows = 0
+        self._arrival: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 큐에서 꺼내 추론 중인 배치 (stop() 시 결과를 받지 못한 요청 처리용)
+        self._inflight: Optional[list] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """stop() 호출 여부 (이후 submit()은 거부됨)"""
+        return self._closed
+
+    async def submit(self, X: np.ndarray) -> np.ndarray:
+        """
+        요청을 큐에 넣고 해당 요청의 예측값을 기다림
+
+        Args:
+            X: 입력 특성 (n_samples, n_features)
+
+        Returns:
+            입력 행 순서와 같은 예측값 배열
+
+        Raises:
+            RuntimeError: stop() 이후 호출된 경우
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is stopped")
+        self._ensure_started()
+
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((X, future, time.perf_counter()))
+        self._pending_rows += len(X)
+        self._arrival.set()
+
+        return await future
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        배처 종료 (이후 submit()은 RuntimeError)
+
+        Args:
+            drain: True면 큐에 남은 요청과 추론 중인 배치를 모두 처리한 뒤 종료,
+                False면 워커를 즉시 중단하고 결과를 받지 못한 요청을 취소
+        """
+        self._closed = True
+        if self._worker is not None:
+            if drain and not self._worker.done():
+                # 대기 중인 워커를 깨우면 남은 요청을 처리한 뒤 스스로 종료
+                self._arrival.set()
+                await self._worker
+            else:
+                self._worker.cancel()
+                try:
+                    await self._worker
+                except asyncio.CancelledError:
+                    pass
+            self._worker = None
+
+        unresolved = list(self._inflight or []) + list(self._pending)
+        for _, future, _ in unresolved:
+            if not future.done():
+                future.cancel()
+        self._inflight = None
+        self._pending.clear()
+        self._pending_rows = 0
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_metrics(self) -> Dict:
+        """배치 메트릭 조회"""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_us": self.max_wait_us,
+            "batch_count": self.batch_count,
+            "queue_depth": self._pending_rows,
+            "batch_size": self.batch_size_histogram.to_dict(),
+            "queue_wait_us": self.queue_wait_histogram.to_dict()
+        }
+
+    def _ensure_started(self) -> None:
+        """실행 중인 이벤트 루프에서 워커 태스크 시작"""
+        if self._executor is None:
+            # 단일 스레드: 이전 배치를 추론하는 동안 이벤트 루프가 다음 배치를 모음
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="micro-batcher"
+            )
+        if self._worker is None or self._worker.done():
+            self._arrival = asyncio.Event()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """배치 수집 및 추론 루프"""
+        loop = asyncio.get_running_loop()
+        max_wait_s = self.max_wait_us / 1_000_000
+
+        while True:
+            if not self._pending:
+                if self._closed:
+                    return
+                self._arrival.clear()
+                await self._arrival.wait()
+                continue
+
+            # 첫 요청 도착 시점부터 max_wait 동안 배치를 채움 (종료 중이면 바로 처리)
+            deadline = self._pending[0][2] + max_wait_s
+            while not self._closed and self._pending_rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._arrival.clear()
+                try:
+                    await asyncio.wait_for(self._arrival.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            batch = self._take_batch()
+            await self._execute(loop, batch)
+
+    def _take_batch(self) -> list:
+        """최대 배치 크기까지 대기 중인 요청을 꺼냄 (첫 요청은 항상 포함)"""
+        batch = []
+        rows = 0
+        while self._pending:
+            n = len(self._pending[0][0])
+            if batch and rows + n > self.max_batch_size:
+                break
+            batch.append(self._pending.popleft())
+            rows += n
+        self._pending_rows -= rows
+        return batch
+
+    async def _execute(self, loop: asyncio.AbstractEventLoop, batch: list) -> None:
+        """배치 추론 후 결과를 각 요청의 future로 분배"""
+        now = time.perf_counter()
+        for _, _, enqueued_at in batch:
+            self.queue_wait_histogram.observe((now - enqueued_at) * 1_000_000)
+
+        rows = sum(len(x) for x, _, _ in batch)
+        self.batch_size_histogram.observe(rows)
+        self.batch_count += 1
+
+        self._inflight = batch
+        try:
+            X = batch[0][0] if len(batch) == 1 else np.concatenate([x for x, _, _ in batch])
+            predictions = await loop.run_in_executor(self._executor, self.predict_fn, X)
+        except Exception as e:
+            self._inflight = None
+            logger.error(f"Batch prediction error: {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self._inflight = None
+
+        offset = 0
+        for x, future, _ in batch:
+            n = len(x)
+            if not future.done():
+                future.set_result(predictions[offset:offset + n])
+            offset += n
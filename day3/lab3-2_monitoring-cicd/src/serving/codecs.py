@@ -0,0 +1,176 @@
+"""
+Binary Request Codec Module
+
+/predict 바이너리 요청/응답 포맷 (packed float, NumPy .npy, Arrow IPC)
+
+Packed float 포맷 (application/octet-stream, little-endian):
+
+    offset  size  field
+    0       8     rows      (uint64)
+    8       4     cols      (uint32)
+    12      4     itemsize  (uint32, 4=float32 / 8=float64)
+    16      ...   rows × cols 값 (row-major)
+"""
+
+import io
+import struct
+
+import numpy as np
+
+JSON = "application/json"
+OCTET_STREAM = "application/octet-stream"
+NPY = "application/x-npy"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+BINARY_CONTENT_TYPES = (OCTET_STREAM, NPY, ARROW_STREAM)
+
+PACKED_HEADER = struct.Struct("<QII")
+PACKED_DTYPES = {4: np.dtype("<f4"), 8: np.dtype("<f8")}
+
+
+class UnsupportedFormatError(ValueError):
+    """지원하지 않는 요청 포맷"""
+
+
+def media_type(content_type: str) -> str:
+    """Content-Type 헤더에서 파라미터를 제외한 미디어 타입 추출"""
+    return (content_type or JSON).split(";")[0].strip().lower()
+
+
+def decode_request(body: bytes, content_type: str) -> np.ndarray:
+    """
+    바이너리 요청 본문을 ndarray로 디코딩
+
+    packed float, .npy 포맷은 np.frombuffer로 복사 없이 본문을 참조한다.
+
+    Args:
+        body: 요청 본문
+        content_type: 미디어 타입
+
+    Returns:
+        (n_samples, n_features) 배열 (읽기 전용일 수 있음)
+    """
+    if content_type == OCTET_STREAM:
+        return _decode_packed(body)
+    if content_type == NPY:
+        return _decode_npy(body)
+    if content_type == ARROW_STREAM:
+        return _decode_arrow(body)
+    raise UnsupportedFormatError(f"Unsupported content type: {content_type}")
+
+
+def encode_response(predictions: np.ndarray, content_type: str, dtype: np.dtype) -> bytes:
+    """
+    예측값을 요청과 같은 바이너리 포맷으로 인코딩
+
+    Args:
+        predictions: 예측값 (n_samples,)
+        content_type: 미디어 타입
+        dtype: 응답 값의 dtype (요청 dtype과 동일)
+
+    Returns:
+        응답 본문
+    """
+    if content_type == ARROW_STREAM:
+        pa = _import_pyarrow()
+        table = pa.table({"prediction": np.asarray(predictions, dtype=dtype)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    values = np.ascontiguousarray(predictions, dtype=np.dtype(dtype).newbyteorder("<"))
+
+    if content_type == OCTET_STREAM:
+        return PACKED_HEADER.pack(len(values), 1, values.itemsize) + values.tobytes()
+    if content_type == NPY:
+        buffer = io.BytesIO()
+        np.save(buffer, values, allow_pickle=False)
+        return buffer.getvalue()
+    raise UnsupportedFormatError(f"Unsupported content type: {content_type}")
+
+
+def encode_packed(X: np.ndarray) -> bytes:
+    """ndarray를 packed float 포맷으로 인코딩 (클라이언트용)"""
+    X = np.asarray(X)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    dtype = np.dtype(X.dtype).newbyteorder("<")
+    if dtype.itemsize not in PACKED_DTYPES or dtype.kind != "f":
+        dtype = PACKED_DTYPES[8]
+    X = np.ascontiguousarray(X, dtype=dtype)
+    return PACKED_HEADER.pack(X.shape[0], X.shape[1], X.itemsize) + X.tobytes()
+
+
+def _decode_packed(body: bytes) -> np.ndarray:
+    """packed float 포맷 디코딩"""
+    if len(body) < PACKED_HEADER.size:
+        raise ValueError("Body too short for packed header")
+
+    rows, cols, itemsize = PACKED_HEADER.unpack_from(body)
+    if itemsize not in PACKED_DTYPES:
+        raise ValueError(f"Unsupported itemsize: {itemsize} (expected 4 or 8)")
+
+    expected = PACKED_HEADER.size + rows * cols * itemsize
+    if len(body) != expected:
+        raise ValueError(
+            f"Body length mismatch: header declares {rows}x{cols}x{itemsize} "
+            f"({expected} bytes), got {len(body)} bytes"
+        )
+
+    return np.frombuffer(
+        body, dtype=PACKED_DTYPES[itemsize], count=rows * cols, offset=PACKED_HEADER.size
+    ).reshape(rows, cols)
+
+
+def _decode_npy(body: bytes) -> np.ndarray:
+    """NumPy .npy 포맷 디코딩 (헤더만 파싱하고 데이터는 참조)"""
+    stream = io.BytesIO(body)
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    else:
+        raise ValueError(f"Unsupported .npy version: {version}")
+
+    if dtype.kind != "f":
+        raise ValueError(f"Unsupported .npy dtype: {dtype} (expected float)")
+
+    count = int(np.prod(shape))
+    if len(body) - stream.tell() != count * dtype.itemsize:
+        raise ValueError("Body length does not match .npy header")
+
+    return np.frombuffer(body, dtype=dtype, count=count, offset=stream.tell()).reshape(
+        shape, order="F" if fortran_order else "C"
+    )
+
+
+def _decode_arrow(body: bytes) -> np.ndarray:
+    """Arrow IPC stream 디코딩 (열마다 하나의 float 컬럼)"""
+    pa = _import_pyarrow()
+    table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+
+    if table.num_columns == 0:
+        raise ValueError("Arrow table has no columns")
+    for field in table.schema:
+        if not pa.types.is_floating(field.type):
+            raise ValueError(f"Column '{field.name}' is {field.type}, expected float")
+
+    return np.column_stack([column.to_numpy() for column in table.columns])
+
+
+def _import_pyarrow():
+    """pyarrow 지연 import"""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise UnsupportedFormatError("Arrow IPC requires pyarrow to be installed")
+    return pa
+
+
+def response_dtype(X: np.ndarray) -> np.dtype:
+    """응답 dtype 결정 (float32 요청은 float32, 그 외 float64)"""
+    return np.dtype(np.float32) if X.dtype.itemsize == 4 else np.dtype(np.float64)
+
@@ -0,0 +1,372 @@
+"""
+Serving Metrics Module
+
+서빙 레이어에서 사용하는 경량 카운터/히스토그램과 Prometheus 텍스트 노출
+"""
+
+import bisect
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+# 예측 지연시간 버킷 (초) - scripts/3_simulate_drift.py exporter와 동일 범위 + 저지연 구간
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+
+PHASES = ("parse", "validate", "predict", "serialize")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Shard:
+    """스레드 하나가 단독으로 쓰는 카운트 묶음"""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, n_buckets: int):
+        self.counts = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Sharded:
+    """
+    스레드별 샤드 관리
+
+    기록은 호출 스레드 자신의 샤드에만 하므로 락이 필요 없고,
+    조회 시점에만 모든 샤드를 합산한다. 락은 스레드당 최초 1회 샤드 등록에만 사용.
+    """
+
+    def __init__(self, n_buckets: int):
+        self._n_buckets = n_buckets
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._register_lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        """현재 스레드의 샤드 (없으면 등록)"""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(self._n_buckets)
+            with self._register_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _combine(self, parts: Sequence["_Sharded"]) -> "_Sharded":
+        """여러 계열의 샤드를 합산하는 읽기 전용 뷰로 전환 (self 반환)"""
+        self._shards = [shard for part in parts for shard in list(part._shards)]
+        return self
+
+    def _snapshot(self) -> _Shard:
+        """모든 샤드 합산"""
+        total = _Shard(self._n_buckets)
+        for shard in list(self._shards):
+            for i, count in enumerate(shard.counts):
+                total.counts[i] += count
+            total.sum += shard.sum
+            total.count += shard.count
+        return total
+
+
+class Counter(_Sharded):
+    """단조 증가 카운터"""
+
+    def __init__(self):
+        super().__init__(n_buckets=0)
+
+    def inc(self, amount: float = 1) -> None:
+        """카운터 증가"""
+        shard = self._shard()
+        shard.sum += amount
+        shard.count += 1
+
+    @property
+    def value(self) -> float:
+        """현재 값"""
+        return self._snapshot().sum
+
+
+class Histogram(_Sharded):
+    """누적 버킷 히스토그램 (Prometheus `le` 의미 체계)"""
+
+    def __init__(self, buckets: Sequence[float]):
+        """
+        히스토그램 초기화
+
+        Args:
+            buckets: 버킷 상한값 목록 (+Inf 버킷은 자동 추가)
+        """
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        super().__init__(n_buckets=len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """값 기록"""
+        shard = self._shard()
+        shard.counts[bisect.bisect_left(self.buckets, value)] += 1
+        shard.sum += value
+        shard.count += 1
+
+    @property
+    def counts(self) -> List[int]:
+        """버킷별 (비누적) 카운트"""
+        return self._snapshot().counts
+
+    @property
+    def sum(self) -> float:
+        """관측값 합계"""
+        return self._snapshot().sum
+
+    @property
+    def count(self) -> int:
+        """관측 횟수"""
+        return self._snapshot().count
+
+    def cumulative(self) -> List[int]:
+        """버킷별 누적 카운트 (+Inf 포함)"""
+        running = 0
+        cumulative = []
+        for count in self._snapshot().counts:
+            running += count
+            cumulative.append(running)
+        return cumulative
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        버킷 내 선형 보간으로 분위수 추정 (PromQL histogram_quantile과 동일 방식)
+
+        Args:
+            q: 분위 (0~1)
+
+        Returns:
+            추정값 (관측값이 없으면 None)
+        """
+        cumulative = self.cumulative()
+        total = cumulative[-1]
+        if total == 0:
+            return None
+
+        rank = q * total
+        index = bisect.bisect_left(cumulative, rank)
+        if index >= len(self.buckets):
+            # +Inf 버킷: 가장 큰 유한 상한값 반환
+            return self.buckets[-1]
+
+        lower = self.buckets[index - 1] if index > 0 else 0.0
+        below = cumulative[index - 1] if index > 0 else 0
+        in_bucket = cumulative[index] - below
+        if in_bucket == 0:
+            return self.buckets[index]
+        return lower + (self.buckets[index] - lower) * (rank - below) / in_bucket
+
+    def to_dict(self) -> Dict:
+        """누적 버킷 카운트 딕셔너리"""
+        snapshot = self._snapshot()
+        cumulative = {}
+        running = 0
+        for upper, count in zip(self.buckets, snapshot.counts):
+            running += count
+            cumulative[f"{upper:g}"] = running
+        cumulative["+Inf"] = snapshot.count
+
+        return {
+            "buckets": cumulative,
+            "sum": round(snapshot.sum, 6),
+            "count": snapshot.count
+        }
+
+
+class _Series:
+    """모델 버전 하나의 요청 메트릭 묶음"""
+
+    def __init__(self, latency_buckets: Sequence[float]):
+        self.predictions = {"success": Counter(), "error": Counter()}
+        self.latency = Histogram(latency_buckets)
+        self.phase_latency = {phase: Histogram(latency_buckets) for phase in PHASES}
+
+
+class ServingMetrics:
+    """
+    ModelServer 요청 메트릭 (예측 결과 카운터, 전체/단계별 지연시간)
+
+    요청을 처리한 모델 버전별로 계열을 따로 두어 version 레이블이 기본 버전 전환이나
+    핫스왑 이후에도 실제로 응답한 버전을 가리키게 한다. predictions, latency,
+    phase_latency 속성은 모든 버전을 합산한 뷰다.
+    """
+
+    def __init__(
+        self,
+        labels: Optional[Dict[str, str]] = None,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        """
+        서빙 메트릭 초기화
+
+        Args:
+            labels: 모든 시계열에 붙일 고정 레이블 (model_name, version, user_id 등,
+                version은 버전을 지정하지 않은 기록의 기본값)
+            latency_buckets: 지연시간 히스토그램 버킷 (초)
+        """
+        self.labels = dict(labels or {})
+        self.latency_buckets = tuple(latency_buckets)
+        self._series: Dict[Optional[str], _Series] = {}
+        self._series_lock = threading.Lock()
+
+    def series(self, version: Optional[str] = None) -> _Series:
+        """
+        버전별 메트릭 계열 (최초 기록 시 생성)
+
+        Args:
+            version: 모델 버전 (None이면 labels의 version)
+
+        Returns:
+            해당 버전의 계열
+        """
+        if version is None:
+            version = self.labels.get("version")
+        series = self._series.get(version)
+        if series is None:
+            with self._series_lock:
+                series = self._series.setdefault(version, _Series(self.latency_buckets))
+        return series
+
+    def labels_for(self, version: Optional[str]) -> Dict[str, str]:
+        """버전 레이블을 포함한 시계열 레이블 (version이 None이면 고정 레이블 그대로)"""
+        if version is None:
+            return self.labels
+        return {**self.labels, "version": version}
+
+    @property
+    def predictions(self) -> Dict[str, Counter]:
+        """상태별 예측 수 (모든 버전 합산)"""
+        parts = list(self._series.values())
+        return {
+            status: Counter()._combine([series.predictions[status] for series in parts])
+            for status in ("success", "error")
+        }
+
+    @property
+    def latency(self) -> Histogram:
+        """요청 전체 지연시간 (모든 버전 합산)"""
+        parts = [series.latency for series in list(self._series.values())]
+        return Histogram(self.latency_buckets)._combine(parts)
+
+    @property
+    def phase_latency(self) -> Dict[str, Histogram]:
+        """단계별 지연시간 (모든 버전 합산)"""
+        parts = list(self._series.values())
+        return {
+            phase: Histogram(self.latency_buckets)._combine(
+                [series.phase_latency[phase] for series in parts]
+            )
+            for phase in PHASES
+        }
+
+    def observe_prediction(self, status: str, version: Optional[str] = None) -> None:
+        """예측 결과 기록 (success / error)"""
+        self.series(version).predictions[status].inc()
+
+    def observe_request(self, seconds: float, version: Optional[str] = None) -> None:
+        """요청 전체 지연시간 기록"""
+        self.series(version).latency.observe(seconds)
+
+    def observe_phase(self, phase: str, seconds: float, version: Optional[str] = None) -> None:
+        """단계별 지연시간 기록 (parse, validate, predict, serialize)"""
+        self.series(version).phase_latency[phase].observe(seconds)
+
+    def lap(self, phase: str, start_ns: int, version: Optional[str] = None) -> int:
+        """
+        start_ns 이후 경과 시간을 단계 지연시간으로 기록
+
+        Args:
+            phase: 단계 이름
+            start_ns: 단계 시작 시각 (time.perf_counter_ns())
+            version: 요청을 처리한 모델 버전 (None이면 labels의 version)
+
+        Returns:
+            현재 시각 (다음 단계의 시작 시각)
+        """
+        now = time.perf_counter_ns()
+        self.series(version).phase_latency[phase].observe((now - start_ns) / 1e9)
+        return now
+
+    def render_prometheus(self, extra: Optional[List[str]] = None) -> str:
+        """
+        Prometheus 텍스트 포맷(0.0.4)으로 직렬화
+
+        Args:
+            extra: 뒤에 덧붙일 추가 메트릭 라인
+
+        Returns:
+            /metrics/prometheus 응답 본문
+        """
+        series = [
+            (self.labels_for(version), entry)
+            for version, entry in list(self._series.items())
+        ] or [(self.labels, _Series(self.latency_buckets))]
+
+        lines = [
+            "# HELP model_prediction_total Total predictions by status",
+            "# TYPE model_prediction_total counter"
+        ]
+        for labels, entry in series:
+            for status, counter in entry.predictions.items():
+                lines.append(
+                    f"model_prediction_total{format_labels({**labels, 'status': status})} "
+                    f"{counter.value:g}"
+                )
+
+        lines += render_histogram(
+            "model_prediction_latency",
+            "End-to-end prediction request latency in seconds",
+            [(labels, entry.latency) for labels, entry in series]
+        )
+        lines += render_histogram(
+            "model_prediction_phase_latency",
+            "Prediction request latency by phase in seconds",
+            [({**labels, "phase": phase}, histogram)
+             for labels, entry in series
+             for phase, histogram in entry.phase_latency.items()]
+        )
+
+        lines += extra or []
+        return "\n".join(lines) + "\n"
+
+
+def render_histogram(name: str, help_text: str, series: List) -> List[str]:
+    """
+    히스토그램 계열을 Prometheus 텍스트 라인으로 변환
+
+    Args:
+        name: 메트릭 이름
+        help_text: HELP 설명
+        series: (레이블 딕셔너리, Histogram) 목록
+
+    Returns:
+        텍스트 라인 목록
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        snapshot = histogram._snapshot()
+        running = 0
+        for upper, count in zip(histogram.buckets + (float("inf"),), snapshot.counts):
+            running += count
+            le = "+Inf" if upper == float("inf") else f"{upper:g}"
+            lines.append(f"{name}_bucket{format_labels({**labels, 'le': le})} {running}")
+        lines.append(f"{name}_sum{format_labels(labels)} {snapshot.sum:.9g}")
+        lines.append(f"{name}_count{format_labels(labels)} {snapshot.count}")
+    return lines
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """Prometheus 레이블 문자열 ({k="v",...})"""
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value) -> str:
+    """레이블 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
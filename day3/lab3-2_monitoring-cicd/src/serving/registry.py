@@ -0,0 +1,314 @@
+"""
+Model Registry Module
+
+이름/버전별 모델을 메모리에 유지하고 기본 버전을 무중단으로 교체
+"""
+
+import asyncio
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+# 워밍업에 사용할 최대 행 수
+WARMUP_ROWS = 32
+
+
+class ModelNotFoundError(LookupError):
+    """요청한 이름/버전의 모델이 적재되어 있지 않음"""
+
+
+class ModelEntry:
+    """레지스트리에 적재된 모델 한 버전"""
+
+    def __init__(
+        self,
+        name: str,
+        version: str,
+        model,
+        size_bytes: Optional[int] = None
+    ):
+        """
+        모델 엔트리 초기화
+
+        Args:
+            name: 모델 이름
+            version: 모델 버전
+            model: predict(X)를 제공하는 모델 또는 백엔드
+            size_bytes: 추정 메모리 사용량 (바이트, 예산 미설정 시 None)
+        """
+        self.name = name
+        self.version = version
+        self.model = model
+        self.size_bytes = size_bytes
+        self.loaded_at = time.time()
+        self.request_count = Counter()
+        self.batcher = None
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """레지스트리 키 (name, version)"""
+        return self.name, self.version
+
+    def to_dict(self) -> Dict:
+        """엔트리 정보 딕셔너리"""
+        return {
+            "name": self.name,
+            "version": self.version,
+            "backend": getattr(self.model, "name", "sklearn"),
+            "size_bytes": self.size_bytes,
+            "loaded_at": self.loaded_at,
+            "request_count": int(self.request_count.value)
+        }
+
+
+class ModelRegistry:
+    """
+    인프로세스 모델 레지스트리
+
+    새 버전은 백그라운드에서 로드/워밍업한 뒤 기본 포인터를 한 번에 교체하므로
+    교체 중에도 요청은 이전 버전으로 계속 처리된다. 기본이 아닌 버전은
+    메모리 예산 안에서 LRU 순서로 유지된다.
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: Optional[int] = None,
+        warmup_X: Optional[np.ndarray] = None
+    ):
+        """
+        레지스트리 초기화
+
+        Args:
+            memory_budget_bytes: 적재 모델 전체 메모리 예산 (None이면 무제한)
+            warmup_X: 모델에 reference_sample이 없을 때 사용할 워밍업 입력
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.warmup_X = warmup_X
+        self.on_evict: Optional[Callable[[ModelEntry], None]] = None
+
+        self._entries: "OrderedDict[Tuple[str, str], ModelEntry]" = OrderedDict()
+        self._default: Optional[Tuple[str, str]] = None
+        self._loading: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        version: str,
+        model,
+        make_default: bool = True
+    ) -> ModelEntry:
+        """
+        모델을 워밍업한 뒤 등록
+
+        Args:
+            name: 모델 이름
+            version: 모델 버전
+            model: predict(X)를 제공하는 모델 또는 백엔드
+            make_default: 등록 후 기본 버전으로 전환할지 여부
+
+        Returns:
+            등록된 엔트리
+        """
+        size_bytes = self._prepare(model)
+        return self._insert(ModelEntry(name, version, model, size_bytes), make_default)
+
+    async def load_async(
+        self,
+        name: str,
+        version: str,
+        loader: Callable[[], Any],
+        make_default: bool = True
+    ) -> ModelEntry:
+        """
+        스레드풀에서 모델을 로드/워밍업한 뒤 등록 (이벤트 루프 비차단)
+
+        Args:
+            name: 모델 이름
+            version: 모델 버전
+            loader: 모델을 반환하는 함수 (아티팩트 로드, 백엔드 변환 등)
+            make_default: 등록 후 기본 버전으로 전환할지 여부
+
+        Returns:
+            등록된 엔트리
+        """
+        key = (name, version)
+        with self._lock:
+            if self._loading.get(key) == "loading":
+                raise RuntimeError(f"Model {name}:{version} is already loading")
+            self._loading[key] = "loading"
+
+        loop = asyncio.get_running_loop()
+        try:
+            model = await loop.run_in_executor(None, loader)
+            size_bytes = await loop.run_in_executor(None, self._prepare, model)
+        except Exception as e:
+            logger.error(f"Failed to load model {name}:{version}: {e}")
+            with self._lock:
+                self._loading[key] = f"failed: {e}"
+            raise
+
+        entry = self._insert(ModelEntry(name, version, model, size_bytes), make_default)
+        with self._lock:
+            self._loading.pop(key, None)
+        return entry
+
+    def get(self, name: Optional[str] = None, version: Optional[str] = None) -> ModelEntry:
+        """
+        모델 조회 (LRU 갱신)
+
+        Args:
+            name: 모델 이름 (None이면 기본 모델 이름)
+            version: 모델 버전 (None이면 기본 버전, 기본과 이름이 다르면 최근 적재 버전)
+
+        Returns:
+            모델 엔트리
+
+        Raises:
+            ModelNotFoundError: 적재되지 않은 모델
+        """
+        with self._lock:
+            key = self._resolve(name, version)
+            entry = self._entries.get(key) if key else None
+            if entry is None:
+                raise ModelNotFoundError(
+                    f"Model not loaded: {name or '<default>'}:{version or '<default>'}"
+                )
+            self._entries.move_to_end(key)
+            return entry
+
+    def default(self) -> Optional[ModelEntry]:
+        """기본 모델 엔트리 (없으면 None)"""
+        key = self._default
+        return self._entries.get(key) if key else None
+
+    def set_default(self, name: str, version: str) -> ModelEntry:
+        """
+        기본 버전 전환
+
+        Args:
+            name: 모델 이름
+            version: 모델 버전
+
+        Returns:
+            새 기본 엔트리
+        """
+        with self._lock:
+            entry = self._entries.get((name, version))
+            if entry is None:
+                raise ModelNotFoundError(f"Model not loaded: {name}:{version}")
+            previous, self._default = self._default, entry.key
+
+        logger.info(f"Default model switched: {previous} -> {entry.key}")
+        return entry
+
+    def entries(self) -> List[ModelEntry]:
+        """적재된 엔트리 목록 (LRU → MRU 순)"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def describe(self) -> Dict:
+        """레지스트리 상태 (/models 응답)"""
+        with self._lock:
+            return {
+                "default": dict(zip(("name", "version"), self._default))
+                if self._default else None,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "models": [entry.to_dict() for entry in self._entries.values()],
+                "loading": {
+                    f"{name}:{version}": status
+                    for (name, version), status in self._loading.items()
+                }
+            }
+
+    def _resolve(self, name: Optional[str], version: Optional[str]) -> Optional[Tuple[str, str]]:
+        """이름/버전을 레지스트리 키로 변환 (락 보유 상태에서 호출)"""
+        if self._default is None and name is None:
+            return None
+
+        name = name or self._default[0]
+        if version is not None:
+            return name, version
+        if self._default is not None and self._default[0] == name:
+            return self._default
+
+        candidates = [e for e in self._entries.values() if e.name == name]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda e: e.loaded_at).key
+
+    def _prepare(self, model) -> Optional[int]:
+        """워밍업 후 메모리 사용량 추정 (예산 미설정 시 추정 생략)"""
+        warmup_X = getattr(model, "reference_sample", None)
+        if warmup_X is None:
+            warmup_X = self.warmup_X
+        if warmup_X is not None:
+            model.predict(np.asarray(warmup_X)[:WARMUP_ROWS])
+
+        if self.memory_budget_bytes is None:
+            return None
+        return estimate_size(model)
+
+    def _insert(self, entry: ModelEntry, make_default: bool) -> ModelEntry:
+        """엔트리 등록, 기본 포인터 교체, 예산 초과 시 LRU 제거"""
+        with self._lock:
+            replaced = self._entries.pop(entry.key, None)
+            self._entries[entry.key] = entry
+            if make_default or self._default is None:
+                self._default = entry.key
+            evicted = self._evict(protect=entry.key)
+
+        logger.info(
+            f"Model registered: {entry.name}:{entry.version}"
+            f"{' (default)' if self._default == entry.key else ''}"
+        )
+        for old in ([replaced] if replaced is not None else []) + evicted:
+            logger.info(f"Model evicted: {old.name}:{old.version}")
+            if self.on_evict is not None:
+                self.on_evict(old)
+        return entry
+
+    def _evict(self, protect: Tuple[str, str]) -> List[ModelEntry]:
+        """메모리 예산을 넘으면 기본/신규가 아닌 엔트리를 LRU 순으로 제거 (락 보유 상태)"""
+        if self.memory_budget_bytes is None:
+            return []
+
+        evicted = []
+        while sum(e.size_bytes or 0 for e in self._entries.values()) > self.memory_budget_bytes:
+            victim = next(
+                (key for key in self._entries if key not in (self._default, protect)),
+                None
+            )
+            if victim is None:
+                logger.warning(
+                    f"Resident models exceed memory budget "
+                    f"({self.memory_budget_bytes} bytes) but none can be evicted"
+                )
+                break
+            evicted.append(self._entries.pop(victim))
+        return evicted
+
+
+def estimate_size(model) -> int:
+    """
+    모델 메모리 사용량 추정
+
+    Args:
+        model: 모델 또는 백엔드 (size_bytes 속성이 있으면 그대로 사용)
+
+    Returns:
+        추정 크기 (바이트, 직렬화 크기 기준)
+    """
+    size_bytes = getattr(model, "size_bytes", None)
+    if size_bytes is not None:
+        return int(size_bytes)
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
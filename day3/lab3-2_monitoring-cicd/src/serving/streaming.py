@@ -0,0 +1,283 @@
+"""
+Streaming Prediction Module
+
+/predict/stream: NDJSON/CSV 입력을 고정 크기 청크로 나눠 추론하고 결과를 즉시 스트리밍
+"""
+
+import json
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+import numpy as np
+
+from .validation import FEATURE_NAMES, InputValidationError
+
+logger = logging.getLogger(__name__)
+
+NDJSON = "application/x-ndjson"
+CSV = "text/csv"
+
+STREAM_CONTENT_TYPES = (NDJSON, CSV)
+
+DEFAULT_CHUNK_ROWS = 1024
+MAX_CHUNK_ROWS = 100_000
+
+# 줄바꿈 없이 이 크기를 넘는 입력은 거부 (한 줄이 메모리를 무제한 점유하지 않도록)
+MAX_LINE_BYTES = 1024 * 1024
+
+# 본문 리더가 추론보다 앞서 읽어 둘 수 있는 네트워크 청크 수 (넘치면 읽기를 멈춤)
+BODY_QUEUE_SIZE = 16
+
+_END_OF_BODY = object()
+
+
+class BodyReader:
+    """
+    요청 본문을 별도 태스크에서 읽어 bounded queue로 전달하는 ASGI receive의 단일 소비자
+
+    응답을 보내는 동안 다른 태스크가 receive를 호출하면 (ASGI spec < 2.4 서버에서
+    Starlette StreamingResponse의 연결 종료 감시 등) 아직 읽지 않은 본문 메시지를
+    가져가 입력이 잘린다. 본문을 다 읽은 뒤의 연결 종료 감시도 이 리더가 맡는다.
+    """
+
+    def __init__(self, receive: Callable[[], Awaitable[dict]], maxsize: int = BODY_QUEUE_SIZE):
+        self.disconnected = asyncio.Event()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._task = asyncio.get_running_loop().create_task(self._read(receive))
+
+    async def _read(self, receive: Callable[[], Awaitable[dict]]) -> None:
+        """본문 메시지를 큐로 옮기고, 본문이 끝나면 연결 종료까지 대기"""
+        more_body = True
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                self.disconnected.set()
+                if more_body:
+                    await self._queue.put(ConnectionError("Client disconnected"))
+                return
+            if message["type"] == "http.request" and more_body:
+                if message.get("body"):
+                    await self._queue.put(message["body"])
+                more_body = message.get("more_body", False)
+                if not more_body:
+                    await self._queue.put(_END_OF_BODY)
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """
+        본문 바이트 스트림
+
+        Raises:
+            ConnectionError: 본문을 다 받기 전에 연결이 끊긴 경우
+        """
+        while True:
+            item = await self._queue.get()
+            if item is _END_OF_BODY:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+    async def run_until_disconnect(self, coro: Awaitable[None]) -> None:
+        """
+        coro를 실행하되 클라이언트 연결이 끊기면 취소하고, 끝나면 리더 종료
+
+        Args:
+            coro: 응답 전송 코루틴
+        """
+        task = asyncio.ensure_future(coro)
+        disconnected = asyncio.ensure_future(self.disconnected.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {task, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            disconnected.cancel()
+            task.cancel()
+            self.close()
+
+        if task in done:
+            task.result()
+        else:
+            logger.info("Client disconnected, stopped streaming response")
+
+    def close(self) -> None:
+        """리더 태스크 종료"""
+        self._task.cancel()
+
+
+class NdjsonCodec:
+    """NDJSON 청크 코덱 (한 줄에 특성 배열 또는 특성 이름 객체)"""
+
+    content_type = NDJSON
+
+    def decode(self, lines: List[bytes]) -> np.ndarray:
+        """줄 목록을 (n, n_features) 배열로 변환 (json.loads 1회)"""
+        records = json.loads(b"[" + b",".join(lines) + b"]")
+        if records and isinstance(records[0], dict):
+            try:
+                records = [[record[name] for name in FEATURE_NAMES] for record in records]
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Missing feature in NDJSON object: {e}")
+        return np.asarray(records)
+
+    def header(self) -> bytes:
+        """응답 머리말 (없음)"""
+        return b""
+
+    def encode(self, predictions: np.ndarray) -> bytes:
+        """예측값을 NDJSON 줄로 직렬화"""
+        lines = map('{{"prediction":{!r}}}'.format, np.asarray(predictions).tolist())
+        return ("\n".join(lines) + "\n").encode()
+
+    def encode_error(self, error: Exception) -> bytes:
+        """스트림 도중 발생한 오류 레코드"""
+        record = {"error": str(error)}
+        if isinstance(error, InputValidationError):
+            record["rows"] = error.rows
+            record["columns"] = error.columns
+        return (json.dumps(record) + "\n").encode()
+
+
+class CsvCodec:
+    """CSV 청크 코덱 (선택적 헤더 행으로 열 순서 지정)"""
+
+    content_type = CSV
+
+    def __init__(self):
+        self._first_line = True
+        self._column_order: Optional[List[int]] = None
+
+    def decode(self, lines: List[bytes]) -> np.ndarray:
+        """줄 목록을 (n, n_features) 배열로 변환 (np.loadtxt 1회)"""
+        if self._first_line:
+            self._first_line = False
+            if not _is_numeric(lines[0].split(b",")[0]):
+                self._column_order = _column_order(lines[0])
+                lines = lines[1:]
+                if not lines:
+                    return np.empty((0, len(FEATURE_NAMES)))
+
+        X = np.loadtxt(lines, delimiter=",", ndmin=2, dtype=np.float64)
+        if self._column_order is not None:
+            X = X[:, self._column_order]
+        return X
+
+    def header(self) -> bytes:
+        """응답 헤더 행"""
+        return b"prediction\n"
+
+    def encode(self, predictions: np.ndarray) -> bytes:
+        """예측값을 CSV 행으로 직렬화"""
+        return ("\n".join(map(repr, np.asarray(predictions).tolist())) + "\n").encode()
+
+    def encode_error(self, error: Exception) -> bytes:
+        """스트림 도중 발생한 오류 (주석 행)"""
+        return f"# error: {error}\n".encode()
+
+
+def stream_codec(content_type: str):
+    """미디어 타입에 맞는 스트림 코덱 생성"""
+    if content_type == NDJSON:
+        return NdjsonCodec()
+    if content_type == CSV:
+        return CsvCodec()
+    raise ValueError(f"Unsupported stream content type: {content_type}")
+
+
+async def iter_row_chunks(
+    body: AsyncIterator[bytes],
+    chunk_rows: int
+) -> AsyncIterator[List[bytes]]:
+    """
+    요청 본문을 줄 단위로 나눠 chunk_rows 줄씩 반환
+
+    본문 전체를 읽지 않고, 최대 chunk_rows 줄과 네트워크 청크 하나만 메모리에 유지한다.
+
+    Args:
+        body: 요청 본문 바이트 스트림
+        chunk_rows: 청크당 행 수
+
+    Returns:
+        줄 목록의 비동기 이터레이터 (빈 줄 제외)
+    """
+    pending = b""
+    rows: List[bytes] = []
+
+    async for data in body:
+        if not data:
+            continue
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+        if len(pending) > MAX_LINE_BYTES:
+            raise ValueError(f"Line exceeds {MAX_LINE_BYTES} bytes")
+
+        rows.extend(line for line in lines if line.strip())
+        while len(rows) >= chunk_rows:
+            yield rows[:chunk_rows]
+            del rows[:chunk_rows]
+
+    if pending.strip():
+        rows.append(pending)
+    if rows:
+        yield rows
+
+
+async def stream_predictions(
+    body: AsyncIterator[bytes],
+    codec,
+    predict: Callable[[np.ndarray], Awaitable[np.ndarray]],
+    validate: Callable[[np.ndarray], np.ndarray],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> AsyncIterator[bytes]:
+    """
+    청크 단위 추론 결과 스트림
+
+    Args:
+        body: 요청 본문 바이트 스트림
+        codec: NdjsonCodec 또는 CsvCodec
+        predict: 입력 행렬의 예측값을 반환하는 코루틴 함수
+        validate: 입력 검증 함수 (InputValidationError 발생)
+        chunk_rows: 청크당 행 수
+
+    Returns:
+        직렬화된 예측 결과 청크의 비동기 이터레이터
+    """
+    offset = 0
+
+    async for lines in iter_row_chunks(body, chunk_rows):
+        X = codec.decode(lines)
+        if len(X) == 0:
+            continue
+
+        try:
+            X = validate(X)
+        except InputValidationError as e:
+            # 청크 내 행 번호를 전체 입력 기준으로 변환
+            raise InputValidationError(
+                f"{e.message} (chunk starting at row {offset})",
+                rows=[offset + row for row in e.rows],
+                columns=e.columns
+            )
+
+        content = codec.encode(await predict(X))
+        yield (codec.header() + content) if offset == 0 else content
+        offset += len(X)
+
+
+def _is_numeric(field: bytes) -> bool:
+    """CSV 필드가 숫자인지 확인 (헤더 행 판별용)"""
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _column_order(header: bytes) -> List[int]:
+    """CSV 헤더에서 FEATURE_NAMES 순서의 열 인덱스 계산"""
+    columns = [name.strip().strip('"') for name in header.decode().split(",")]
+    missing = [name for name in FEATURE_NAMES if name not in columns]
+    if missing:
+        raise ValueError(f"CSV header is missing features: {missing}")
+    return [columns.index(name) for name in FEATURE_NAMES]
@@ -0,0 +1,124 @@
+"""
+Input Validation Module
+
+예측 입력을 ndarray 단위로 한 번에 검증 (형상, dtype, 유한값, 특성 범위)
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..model.trainer import CaliforniaHousingModel
+
+FEATURE_NAMES = CaliforniaHousingModel.FEATURE_NAMES
+
+# 오류 메시지에 나열할 최대 위치 수
+MAX_REPORTED_CELLS = 10
+
+
+class InputValidationError(ValueError):
+    """입력 검증 실패 (문제가 된 행/열 정보 포함)"""
+
+    def __init__(
+        self,
+        message: str,
+        rows: Optional[List[int]] = None,
+        columns: Optional[List[str]] = None
+    ):
+        super().__init__(message)
+        self.message = message
+        self.rows = rows or []
+        self.columns = columns or []
+
+    def to_dict(self) -> Dict:
+        """HTTP 오류 응답용 딕셔너리"""
+        return {
+            "message": self.message,
+            "rows": self.rows,
+            "columns": self.columns
+        }
+
+
+def validate_array(
+    X,
+    feature_names: Sequence[str] = FEATURE_NAMES,
+    feature_ranges: Optional[np.ndarray] = None,
+    max_reported: int = MAX_REPORTED_CELLS
+) -> np.ndarray:
+    """
+    입력 행렬 검증
+
+    Python 루프 없이 변환된 ndarray 전체에 대해 형상, dtype,
+    np.isfinite, (선택) 특성별 범위를 한 번씩 검사한다.
+
+    Args:
+        X: 입력 특성 (n_samples, n_features) 배열 또는 중첩 리스트
+        feature_names: 기대하는 특성 이름 (개수로 열 수 검사)
+        feature_ranges: 특성별 허용 범위 (2, n_features) [최소; 최대] (선택)
+        max_reported: 오류 메시지에 나열할 최대 위치 수
+
+    Returns:
+        검증된 입력 배열
+
+    Raises:
+        InputValidationError: 검증 실패 시
+    """
+    n_features = len(feature_names)
+
+    try:
+        X = np.asarray(X)
+    except ValueError:
+        # 행마다 길이가 다른 중첩 리스트
+        raise InputValidationError(
+            f"Invalid feature count: expected {n_features} features per instance"
+        )
+
+    if X.dtype.kind not in "iuf":
+        raise InputValidationError(f"Non-numeric values in input (dtype {X.dtype})")
+
+    if X.ndim != 2 or X.shape[0] == 0:
+        raise InputValidationError(
+            f"Invalid input shape: expected (n, {n_features}), got {X.shape}"
+        )
+
+    if X.shape[1] != n_features:
+        raise InputValidationError(
+            f"Invalid feature count: expected {n_features}, got {X.shape[1]}"
+        )
+
+    if X.dtype.kind == "f":
+        invalid = ~np.isfinite(X)
+        if invalid.any():
+            raise _cell_error("Non-finite values", invalid, feature_names, max_reported)
+
+    if feature_ranges is not None:
+        low, high = np.asarray(feature_ranges, dtype=np.float64)
+        invalid = (X < low) | (X > high)
+        if invalid.any():
+            raise _cell_error(
+                "Values outside training range", invalid, feature_names, max_reported
+            )
+
+    return X
+
+
+def _cell_error(
+    reason: str,
+    invalid: np.ndarray,
+    feature_names: Sequence[str],
+    max_reported: int
+) -> InputValidationError:
+    """잘못된 셀 마스크로부터 행/열을 명시한 오류 생성"""
+    rows, cols = np.nonzero(invalid)
+    cells = ", ".join(
+        f"(row {r}, {feature_names[c]})"
+        for r, c in zip(rows[:max_reported], cols[:max_reported])
+    )
+    if len(rows) > max_reported:
+        cells += f", ... ({len(rows) - max_reported} more)"
+
+    return InputValidationError(
+        f"{reason} at {len(rows)} position(s): {cells}",
+        rows=np.unique(rows).tolist(),
+        columns=[feature_names[c] for c in np.unique(cols)]
+    )
@@ -0,0 +1,60 @@
+"""
+Shared Files Module
+
+프로세스 풀 워커가 공유 디렉토리의 배열/객체를 워커당 한 번만 연결하도록 돕는 공용 헬퍼
+"""
+
+import os
+import tempfile
+from typing import Callable, Dict
+
+import numpy as np
+
+# 공유 파일 위치 (RAM 기반 /dev/shm 우선, 없으면 시스템 임시 디렉토리)
+SHARED_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# 워커 프로세스별로 열어 둔 공유 객체 (경로 → 객체)
+_worker_cache: Dict[str, object] = {}
+
+
+def make_shared_dir(prefix: str) -> str:
+    """
+    워커와 파일을 공유할 임시 디렉토리 생성 (삭제는 호출자 책임)
+
+    Args:
+        prefix: 디렉토리 이름 접두사
+
+    Returns:
+        디렉토리 경로
+    """
+    return tempfile.mkdtemp(prefix=prefix, dir=SHARED_DIR)
+
+
+def worker_cached(path: str, loader: Callable[[str], object]) -> object:
+    """
+    워커 프로세스에서 공유 파일을 한 번만 로드 (이후 호출은 캐시된 객체 반환)
+
+    Args:
+        path: 공유 파일 경로
+        loader: 경로를 받아 객체를 반환하는 함수
+
+    Returns:
+        로드된 객체
+    """
+    value = _worker_cache.get(path)
+    if value is None:
+        value = _worker_cache[path] = loader(path)
+    return value
+
+
+def load_shared_array(path: str) -> np.ndarray:
+    """
+    공유 .npy 파일을 워커당 한 번만 memory-map
+
+    Args:
+        path: .npy 파일 경로
+
+    Returns:
+        읽기 전용 memory-map 배열
+    """
+    return worker_cached(path, lambda p: np.load(p, mmap_mode="r"))
@@ -32,3 +32,12 @@ def sample_batch_features():
         [5.6431, 52.0, 5.817352, 1.073059, 558.0, 2.547945, 37.85, -122.25],
         [3.8462, 35.0, 6.281853, 1.081081, 565.0, 2.181467, 37.85, -122.26]
     ]
+
+
+@pytest.fixture(scope="session")
+def synthetic_housing_data():
+    """네트워크 없이 사용할 수 있는 합성 학습 데이터 (8개 특성)"""
+    rng = np.random.RandomState(0)
+    X = rng.rand(400, 8) * [10, 50, 8, 2, 3000, 5, 10, 10] + [0, 1, 1, 0.5, 10, 1, 32, -124]
+    y = 0.4 * X[:, 0] + 0.01 * X[:, 1] + rng.rand(400) * 0.1 + 0.5
+    return X[:300], X[300:], y[:300], y[300:]
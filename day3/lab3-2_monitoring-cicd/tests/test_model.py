@@ -7,7 +7,19 @@ import numpy as np
 import os
 import tempfile
 
-from src.model.trainer import CaliforniaHousingModel, train_model
+import joblib
+
+from sklearn.model_selection import train_test_split
+from sklearn.utils import Bunch
+
+from src.model.dataset import load_dataset, split_indices
+from src.model.search import search_hyperparameters
+from src.model.trainer import (
+    CaliforniaHousingModel,
+    train_model,
+    load_or_train_model,
+    regression_metrics
+)
 
 
 class TestCaliforniaHousingModel:
@@ -170,6 +182,386 @@ class TestCaliforniaHousingModel:
         assert "not fitted" in str(exc_info.value)
 
 
+class TestTrainingMetrics:
+    """학습 메트릭 계산 테스트"""
+
+    @pytest.fixture
+    def data(self):
+        """합성 회귀 데이터 fixture"""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(600, 8))
+        y = X[:, 0] * 2 + rng.normal(0, 0.3, 600)
+        return X[:500], y[:500], X[500:], y[500:]
+
+    def test_regression_metrics_match_sklearn(self):
+        """단일 잔차 계산 결과가 sklearn.metrics와 일치"""
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+        rng = np.random.default_rng(1)
+        y_true = rng.normal(size=300)
+        y_pred = y_true + rng.normal(0, 0.5, 300)
+        metrics = regression_metrics(y_true, y_pred)
+
+        assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true, y_pred))
+        assert metrics["mse"] == pytest.approx(mean_squared_error(y_true, y_pred))
+        assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(y_true, y_pred)))
+        assert metrics["r2"] == pytest.approx(r2_score(y_true, y_pred))
+        assert regression_metrics([1.0, 1.0], [1.0, 1.0])["r2"] == 1.0
+
+    def test_oob_metrics_skip_train_prediction(self, data):
+        """OOB 예측이 있으면 학습 데이터 재예측 대신 OOB 메트릭 기록"""
+        X_train, y_train, X_val, y_val = data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 20, "oob_score": True, "random_state": 0}
+        )
+        metrics = model.train(X_train, y_train, X_val, y_val)
+
+        assert "train_mae" not in metrics
+        assert metrics["oob_r2"] == pytest.approx(model.model.oob_score_)
+        assert {"val_mae", "val_mse", "val_rmse", "val_r2"} <= set(metrics)
+
+    def test_train_metrics_none(self, data):
+        """학습 메트릭 생략"""
+        X_train, y_train, _, _ = data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+
+        assert model.train(X_train, y_train, train_metrics="none") == {}
+        with pytest.raises(ValueError):
+            model.train(X_train, y_train, train_metrics="oob")
+
+    def test_retrain_resets_metrics(self, data):
+        """재학습 시 이전 학습의 메트릭이 남지 않음"""
+        X_train, y_train, X_val, y_val = data
+        model = CaliforniaHousingModel(model_type="linear_regression")
+        model.train(X_train, y_train, X_val, y_val)
+
+        assert model.train(X_train, y_train, train_metrics="none") == {}
+        assert set(model.train(X_train, y_train)) == {
+            "train_mae", "train_mse", "train_rmse", "train_r2"
+        }
+
+
+class TestIncrementalUpdate:
+    """warm_start 증분 재학습 테스트"""
+
+    @pytest.fixture
+    def data(self):
+        """이력/최근 합성 데이터 fixture"""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(800, 8))
+        y = X[:, 0] * 2 + rng.normal(0, 0.3, 800)
+        return X[:600], y[:600], X[600:], y[600:]
+
+    @pytest.mark.parametrize("model_type", ["random_forest", "gradient_boosting"])
+    def test_update_adds_trees(self, data, model_type):
+        """기존 트리를 유지하고 새 트리만 추가"""
+        X_old, y_old, X_new, y_new = data
+        model = CaliforniaHousingModel(
+            model_type=model_type,
+            model_params={"n_estimators": 10, "max_depth": 3, "random_state": 0}
+        )
+        model.train(X_old, y_old)
+        # random_forest는 트리 리스트, gradient_boosting은 (단계, 1) 배열
+        first_tree = np.asarray(model.model.estimators_, dtype=object).ravel()[0]
+
+        metrics = model.update(X_new, y_new, n_new_estimators=5, X_val=X_old, y_val=y_old)
+
+        assert len(model.model.estimators_) == 15
+        assert np.asarray(model.model.estimators_, dtype=object).ravel()[0] is first_tree
+        assert model.model.warm_start is False
+        assert {"update_mae", "val_mae"} <= set(metrics)
+        assert "train_mae" not in metrics
+
+    def test_update_drops_oldest_trees(self, data):
+        """max_estimators 지정 시 가장 오래된 트리부터 제거"""
+        X_old, y_old, X_new, y_new = data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 10, "max_depth": 3, "random_state": 0}
+        )
+        model.train(X_old, y_old)
+        kept = model.model.estimators_[4:]
+
+        model.update(X_new, y_new, n_new_estimators=4, max_estimators=10)
+
+        assert len(model.model.estimators_) == 10
+        assert model.model.estimators_[:6] == kept
+        assert model.predict(X_new).shape == (len(X_new),)
+
+    def test_update_reseeds_new_trees(self, data, tmp_path):
+        """업데이트마다 새 시드를 써서 새 트리가 유지된 트리의 샘플링을 반복하지 않음"""
+        X_old, y_old, X_new, y_new = data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 10, "max_depth": 3, "random_state": 0}
+        )
+        model.train(X_old, y_old)
+        seeds = {tree.random_state for tree in model.model.estimators_}
+
+        model.update(X_new, y_new, n_new_estimators=4, max_estimators=10)
+        kept = {tree.random_state for tree in model.model.estimators_[:6]}
+        added = {tree.random_state for tree in model.model.estimators_[6:]}
+        assert len(added) == 4
+        assert not added & kept
+
+        # 저장/로드 후 다음 업데이트도 이전 시드와 겹치지 않음
+        filepath = str(tmp_path / "model.joblib")
+        model.save(filepath)
+        loaded = CaliforniaHousingModel.load(filepath)
+        loaded.update(X_new, y_new, n_new_estimators=4, max_estimators=10)
+        latest = {tree.random_state for tree in loaded.model.estimators_[6:]}
+        assert not latest & (seeds | added)
+        assert loaded.model_params["random_state"] == 0
+
+    def test_update_unsupported(self, data):
+        """warm_start 미지원 모델/옵션은 예외"""
+        X_old, y_old, X_new, y_new = data
+        with pytest.raises(RuntimeError):
+            CaliforniaHousingModel().update(X_new, y_new)
+
+        linear = CaliforniaHousingModel(model_type="linear_regression")
+        linear.train(X_old, y_old)
+        with pytest.raises(ValueError):
+            linear.update(X_new, y_new)
+
+        boosting = CaliforniaHousingModel(
+            model_type="gradient_boosting", model_params={"n_estimators": 5}
+        )
+        boosting.train(X_old, y_old)
+        with pytest.raises(ValueError):
+            boosting.update(X_new, y_new, max_estimators=5)
+
+
+class TestModelArtifact:
+    """모델 아티팩트 저장/로드 테스트"""
+
+    @pytest.fixture
+    def fitted_model(self, synthetic_housing_data):
+        X_train, _, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        return model
+
+    def test_load_with_mmap(self, fitted_model, synthetic_housing_data, tmp_path):
+        """memory-map 로드 시 예측 일치 테스트"""
+        _, X_test, _, _ = synthetic_housing_data
+        filepath = str(tmp_path / "model.joblib")
+        fitted_model.save(filepath, model_version="v2.0")
+
+        loaded = CaliforniaHousingModel.load(filepath, mmap_mode="r")
+
+        np.testing.assert_array_almost_equal(
+            fitted_model.predict(X_test), loaded.predict(X_test)
+        )
+        assert loaded.model_version == "v2.0"
+        np.testing.assert_array_equal(loaded.feature_ranges, fitted_model.feature_ranges)
+        X_train, _, _, _ = synthetic_housing_data
+        np.testing.assert_array_equal(loaded.feature_ranges[0], X_train.min(axis=0))
+
+    def test_reference_sketch_covers_training_split(
+        self, fitted_model, synthetic_housing_data, tmp_path
+    ):
+        """드리프트 기준 스케치는 학습 데이터 전체를 요약하고 아티팩트에 저장됨"""
+        from src.monitoring.drift import load_or_build_baseline
+
+        X_train, _, _, _ = synthetic_housing_data
+        filepath = str(tmp_path / "model.joblib")
+        fitted_model.save(filepath)
+        loaded = CaliforniaHousingModel.load(filepath, mmap_mode="r")
+
+        assert len(loaded.reference_sample) == CaliforniaHousingModel.REFERENCE_SAMPLE_SIZE
+        assert loaded.reference_sketch.count == len(X_train)
+        np.testing.assert_array_equal(loaded.reference_sketch.max, X_train.max(axis=0))
+
+        baseline, source = load_or_build_baseline(
+            str(tmp_path / "baseline.joblib"), loaded.reference_sketch,
+            CaliforniaHousingModel.FEATURE_NAMES
+        )
+        assert source == "built"
+        assert baseline.reference_count == len(X_train)
+
+    def test_load_newer_artifact_version(self, fitted_model, tmp_path):
+        """지원하지 않는 아티팩트 버전 로드 시 오류"""
+        filepath = str(tmp_path / "model.joblib")
+        fitted_model.save(filepath)
+        data = joblib.load(filepath)
+        data["artifact_version"] = CaliforniaHousingModel.ARTIFACT_VERSION + 1
+        joblib.dump(data, filepath)
+
+        with pytest.raises(ValueError) as exc_info:
+            CaliforniaHousingModel.load(filepath)
+
+        assert "Unsupported artifact version" in str(exc_info.value)
+
+    @pytest.mark.parametrize("model_type", ["random_forest", "gradient_boosting"])
+    @pytest.mark.parametrize("compress", [0, 3])
+    def test_compact_format(self, synthetic_housing_data, tmp_path, model_type, compress):
+        """compact 형식은 더 작고 예측이 float32 정밀도 내에서 일치"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type=model_type,
+            model_params={"n_estimators": 5, "max_depth": 6, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        full_path = str(tmp_path / "full.joblib")
+        compact_path = str(tmp_path / "compact.joblib")
+        model.save(full_path, compress=compress)
+        model.save(compact_path, artifact_format="compact", compress=compress)
+
+        loaded = CaliforniaHousingModel.load(compact_path, mmap_mode="r")
+
+        assert os.path.getsize(compact_path) < os.path.getsize(full_path)
+        np.testing.assert_allclose(loaded.predict(X_test), model.predict(X_test), rtol=1e-5)
+        np.testing.assert_allclose(
+            loaded.model.feature_importances_, model.model.feature_importances_, atol=1e-6
+        )
+        # 저장 시 원본 모델은 변경되지 않음
+        assert hasattr(np.asarray(model.model.estimators_, dtype=object).ravel()[0], "tree_")
+
+    def test_compact_format_keeps_split_decisions(self, fitted_model, tmp_path):
+        """임계값과 같은 입력도 원본과 같은 리프로 분기"""
+        filepath = str(tmp_path / "model.joblib")
+        fitted_model.save(filepath, artifact_format="compact")
+        loaded = CaliforniaHousingModel.load(filepath)
+
+        tree = fitted_model.model.estimators_[0].tree_
+        X = np.tile(fitted_model.reference_sample[:1], (tree.node_count, 1))
+        internal = tree.feature >= 0
+        X[internal, tree.feature[internal]] = tree.threshold[internal]
+
+        np.testing.assert_array_equal(
+            loaded.model.estimators_[0].apply(X), fitted_model.model.estimators_[0].apply(X)
+        )
+
+    def test_unknown_artifact_format(self, fitted_model, tmp_path):
+        """지원하지 않는 형식 저장 시 오류"""
+        with pytest.raises(ValueError):
+            fitted_model.save(str(tmp_path / "model.joblib"), artifact_format="onnx")
+
+    def test_load_or_train_uses_artifact(self, fitted_model, tmp_path):
+        """아티팩트가 있으면 학습하지 않고 로드"""
+        filepath = str(tmp_path / "model.joblib")
+        fitted_model.save(filepath)
+
+        model, source = load_or_train_model(filepath)
+
+        assert source == "artifact"
+        assert model.is_fitted is True
+
+
+class TestDatasetCache:
+    """데이터셋 캐시 테스트"""
+
+    @pytest.fixture
+    def fetch(self):
+        """호출 횟수를 기록하는 원본 로더 fixture"""
+        rng = np.random.default_rng(0)
+        dataset = Bunch(data=rng.normal(size=(500, 8)), target=rng.normal(size=500))
+
+        def fetch():
+            fetch.calls += 1
+            return dataset
+
+        fetch.calls = 0
+        fetch.dataset = dataset
+        return fetch
+
+    def test_cached_load_is_memory_mapped(self, tmp_path, fetch):
+        """두 번째 로드는 원본을 다시 읽지 않고 memory-map으로 연결"""
+        X, y, content_hash = load_dataset(str(tmp_path), fetch=fetch)
+        X_cached, y_cached, cached_hash = load_dataset(str(tmp_path), fetch=fetch)
+
+        assert fetch.calls == 1
+        assert cached_hash == content_hash
+        assert isinstance(X_cached, np.memmap)
+        np.testing.assert_array_equal(X_cached, fetch.dataset.data)
+        np.testing.assert_array_equal(y_cached, fetch.dataset.target)
+
+    def test_split_matches_train_test_split(self, tmp_path, fetch):
+        """캐시된 분할 인덱스가 train_test_split과 동일"""
+        X, y, content_hash = load_dataset(str(tmp_path), fetch=fetch)
+        expected = train_test_split(X, y, test_size=0.25, random_state=7)
+
+        for _ in range(2):
+            train_index, test_index = split_indices(
+                len(X), 0.25, 7, cache_dir=str(tmp_path), content_hash=content_hash
+            )
+            actual = (X[train_index], X[test_index], y[train_index], y[test_index])
+            for a, b in zip(actual, expected):
+                np.testing.assert_array_equal(a, b)
+        assert isinstance(train_index, np.memmap)
+
+    def test_split_without_random_state_is_not_cached(self, tmp_path, fetch):
+        """random_state=None 분할은 캐시하지 않음"""
+        X, _, content_hash = load_dataset(str(tmp_path), fetch=fetch)
+
+        splits = [
+            split_indices(len(X), 0.25, None, cache_dir=str(tmp_path), content_hash=content_hash)[1]
+            for _ in range(2)
+        ]
+
+        assert not np.array_equal(splits[0], splits[1])
+        assert not list(tmp_path.glob("*/split-*"))
+
+
+class TestHyperparameterSearch:
+    """하이퍼파라미터 탐색 테스트"""
+
+    @pytest.fixture
+    def data(self):
+        """비선형 회귀 합성 데이터 fixture"""
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-2, 2, size=(1500, 8))
+        y = np.sin(X[:, 0] * 2) + X[:, 1] ** 2 + rng.normal(0, 0.1, 1500)
+        return X[:1200], y[:1200], X[1200:], y[1200:]
+
+    PARAM_GRID = {"n_estimators": [5, 20], "max_depth": [1, 3, 8]}
+
+    def test_grid_search(self, data):
+        """모든 후보를 평가하고 최적 설정으로 재학습"""
+        model, table = search_hyperparameters(*data, param_grid=self.PARAM_GRID)
+
+        assert len(table) == 6
+        best = min(table, key=lambda row: row["val_mae"])
+        assert model.model_params["max_depth"] == best["params"]["max_depth"]
+        assert model.is_fitted
+        # 재학습 모델은 평가한 후보와 같은 데이터/파라미터로 학습됨
+        assert model.metrics["val_mae"] == pytest.approx(best["val_mae"])
+        assert all(row["fit_seconds"] > 0 for row in table)
+
+    def test_halving_prunes_on_partial_data(self, data):
+        """successive halving은 부분 데이터로 후보를 줄인 뒤 전체 데이터로 비교"""
+        model, table = search_hyperparameters(
+            *data, param_grid=self.PARAM_GRID, strategy="halving", min_resources=200
+        )
+
+        first = [row for row in table if row["rung"] == 0]
+        last = [row for row in table if row["rung"] == max(r["rung"] for r in table)]
+        assert len(first) == 6
+        assert len(last) < len(first)
+        assert first[0]["n_samples"] < 1200
+        assert all(row["n_samples"] == 1200 for row in last)
+        assert model.model_params["max_depth"] > 1
+
+    def test_parallel_matches_serial(self, data):
+        """공유 배열 프로세스 평가 결과가 순차 평가와 동일"""
+        kwargs = dict(param_grid=self.PARAM_GRID, strategy="random", n_iter=3)
+        _, serial = search_hyperparameters(*data, **kwargs)
+        _, parallel = search_hyperparameters(*data, n_jobs=2, **kwargs)
+
+        assert [row["params"] for row in parallel] == [row["params"] for row in serial]
+        assert [row["val_mae"] for row in parallel] == [row["val_mae"] for row in serial]
+
+    def test_unknown_strategy(self, data):
+        """알 수 없는 탐색 전략은 거부"""
+        with pytest.raises(ValueError):
+            search_hyperparameters(*data, param_grid=self.PARAM_GRID, strategy="bayes")
+
+
 class TestTrainModel:
     """train_model 함수 테스트"""
 
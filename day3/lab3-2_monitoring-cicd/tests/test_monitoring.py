@@ -2,8 +2,12 @@
 Test cases for monitoring module
 """
 
+import os
+
 import pytest
 import numpy as np
+from scipy import stats
+from scipy.spatial.distance import jensenshannon
 
 from src.monitoring.drift import (
     DriftDetector,
@@ -11,8 +15,15 @@ from src.monitoring.drift import (
     DriftLevel,
     ModelMetrics,
     ModelMonitor,
-    calculate_drift_score
+    calculate_drift_score,
+    calculate_drift_scores,
+    ks_2samp_sorted,
+    load_or_build_baseline
 )
+from src.monitoring.parquet import detect_drift_parquet, iter_parquet_batches
+from src.monitoring.quality import OnlineQualityEstimator
+from src.monitoring.sketch import QuantileSketch
+from src.monitoring.streaming import StreamingDriftDetector
 
 
 class TestDriftDetector:
@@ -112,6 +123,568 @@ class TestDriftDetector:
         assert "max_severity" in summary
         assert summary["total_features"] == 4
 
+    @pytest.mark.parametrize("n_reference,n_current,integer", [
+        (1000, 500, False),     # 정확 p-value 구간
+        (300, 300, True),       # 동일 값(tie)이 많은 경우
+        (12000, 400, False),    # 점근 p-value 구간
+        (11000, 2000, True)
+    ])
+    def test_detect_drift_matches_scipy(self, n_reference, n_current, integer):
+        """벡터화 KS 결과가 특성별 scipy.stats.ks_2samp와 동일"""
+        rng = np.random.RandomState(0)
+        reference = rng.randn(n_reference, 5)
+        current = rng.randn(n_current, 5) * 1.1 + 0.05
+        if integer:
+            reference, current = np.round(reference * 3), np.round(current * 3)
+
+        detector = DriftDetector()
+        detector.set_reference(reference)
+        _, results = detector.detect_drift(current)
+
+        for i, result in enumerate(results):
+            expected = stats.ks_2samp(reference[:, i], current[:, i])
+            assert result.statistic == expected.statistic
+            assert result.p_value == expected.pvalue
+
+    @pytest.mark.parametrize("method", ["psi", "js", "wasserstein"])
+    def test_binned_methods(self, reference_data, method):
+        """구간 기반 지표: 동일 분포는 드리프트 없음, 평균 이동은 드리프트"""
+        detector = DriftDetector(method=method)
+        detector.set_reference(reference_data)
+
+        np.random.seed(43)
+        has_drift, results = detector.detect_drift(np.random.randn(5000, 4))
+        assert has_drift is False
+        assert all(r.p_value is None for r in results)
+
+        has_drift, results = detector.detect_drift(np.random.randn(500, 4) + 1)
+        assert has_drift is True
+        assert detector.get_drift_summary(results)["drifted_features"] == 4
+        assert results[0].to_dict()["p_value"] is None
+
+    def test_binned_statistics_match_reference_implementations(self):
+        """JS는 scipy와 동일, Wasserstein은 정확값 근사"""
+        np.random.seed(0)
+        reference = np.random.randn(20000, 3)
+        current = np.random.randn(5000, 3) * 1.2 + 0.3
+
+        js = DriftDetector(method="js")
+        js.set_reference(reference)
+        _, results = js.detect_drift(current)
+        counts = np.stack([
+            np.histogram(current[:, j], np.r_[-np.inf, js.bin_edges[j], np.inf])[0]
+            for j in range(3)
+        ])
+        for j, result in enumerate(results):
+            expected = jensenshannon(js.reference_hist[j], counts[j], base=2)
+            assert result.statistic == pytest.approx(expected, abs=0.01)
+
+        wasserstein = DriftDetector(method="wasserstein")
+        wasserstein.set_reference(reference)
+        _, results = wasserstein.detect_drift(current)
+        for j, result in enumerate(results):
+            expected = stats.wasserstein_distance(reference[:, j], current[:, j])
+            assert result.statistic == pytest.approx(expected / reference[:, j].std(), rel=0.1)
+
+    def test_unknown_method(self):
+        """지원하지 않는 검정 방법은 오류"""
+        with pytest.raises(ValueError):
+            DriftDetector(method="chi2")
+
+    def test_parallel_matches_serial(self, reference_data):
+        """n_jobs > 1 결과가 단일 프로세스와 동일하고 종료 시 공유 파일 삭제"""
+        np.random.seed(43)
+        current = np.random.randn(500, 4) + 0.1
+
+        serial = DriftDetector()
+        serial.set_reference(reference_data)
+        parallel = DriftDetector(n_jobs=2)
+        parallel.set_reference(reference_data)
+
+        _, expected = serial.detect_drift(current)
+        _, results = parallel.detect_drift(current)
+        shared_dir = parallel._parallel._dir
+        parallel.close()
+
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+        assert not os.path.exists(shared_dir)
+
+    def test_single_feature_input_not_modified(self):
+        """정렬 캐시가 호출자 배열을 변경하지 않음"""
+        reference = np.random.randn(100, 1)
+        current = np.random.randn(50, 1)
+        originals = reference.copy(), current.copy()
+
+        detector = DriftDetector()
+        detector.set_reference(reference)
+        detector.detect_drift(current)
+
+        np.testing.assert_array_equal(reference, originals[0])
+        np.testing.assert_array_equal(current, originals[1])
+
+    def test_ks_2samp_sorted_empty(self):
+        """빈 입력은 오류"""
+        with pytest.raises(ValueError):
+            ks_2samp_sorted(np.zeros((3, 10)), np.empty((0, 3)))
+
+    @pytest.mark.parametrize("error", [TypeError, ValueError])
+    def test_ks_2samp_sorted_incompatible_scipy(self, monkeypatch, error):
+        """scipy 내부 정확 p-value 함수가 호환되지 않으면 특성별 ks_2samp로 대체"""
+        import src.monitoring.drift as drift
+
+        def incompatible(*args):
+            raise error("unexpected signature")
+
+        monkeypatch.setattr(drift, "_attempt_exact_2kssamp", incompatible)
+        reference = np.random.randn(300, 3)
+        current = np.random.randn(200, 3) + [0, 0.3, 0]
+
+        statistics, p_values = ks_2samp_sorted(np.sort(reference.T, axis=1), current)
+        for i in range(3):
+            expected = stats.ks_2samp(reference[:, i], current[:, i])
+            assert statistics[i] == pytest.approx(expected.statistic)
+            assert p_values[i] == pytest.approx(expected.pvalue)
+        # 대체는 호출 단위 (모듈 상태를 바꾸지 않음)
+        assert drift._attempt_exact_2kssamp is incompatible
+
+    def test_exact_ks_helper_probe(self, monkeypatch):
+        """scipy 내부 함수가 호환되면 사용하고, 오류/결과 불일치면 사용하지 않음"""
+        import scipy.stats._stats_py as stats_py
+        import src.monitoring.drift as drift
+
+        if hasattr(stats_py, "_attempt_exact_2kssamp"):
+            assert drift._probe_exact_2kssamp() is stats_py._attempt_exact_2kssamp
+
+        def incompatible(n1, n2, g, d):
+            return True, d, 0.5
+
+        monkeypatch.setattr(stats_py, "_attempt_exact_2kssamp", incompatible, raising=False)
+        assert drift._probe_exact_2kssamp() is None
+
+        monkeypatch.setattr(
+            stats_py, "_attempt_exact_2kssamp", lambda *args: (True, args[3], 0.5)
+        )
+        assert drift._probe_exact_2kssamp() is None
+
+    @pytest.mark.parametrize("method", ["ks", "psi"])
+    def test_baseline_roundtrip(self, tmp_path, method):
+        """저장한 기준 분포를 memory-map으로 로드해도 결과 동일"""
+        np.random.seed(42)
+        reference = np.random.randn(3000, 4)
+        current = np.random.randn(500, 4) + [0, 0.5, 0, 0]
+        detector = DriftDetector(method=method)
+        detector.set_reference(reference, ["a", "b", "c", "d"])
+        path = str(tmp_path / "baseline.joblib")
+        detector.save_baseline(path, model_version="v2")
+
+        loaded = DriftDetector.load_baseline(path, model_version="v2")
+        assert loaded.method == method
+        assert loaded.feature_names == ["a", "b", "c", "d"]
+        assert isinstance(loaded.bin_edges, np.memmap)
+
+        _, expected = detector.detect_drift(current)
+        _, results = loaded.detect_drift(current)
+        assert [r.to_dict() for r in results] == [r.to_dict() for r in expected]
+        assert calculate_drift_score(path, current) == (
+            detector.get_drift_summary(expected)["drift_score"]
+        )
+
+    def test_baseline_model_version_mismatch(self, tmp_path):
+        """다른 모델 버전의 기준 분포는 거부"""
+        detector = DriftDetector()
+        detector.set_reference(np.random.randn(100, 2))
+        path = str(tmp_path / "baseline.joblib")
+        detector.save_baseline(path, model_version="v1")
+
+        with pytest.raises(ValueError):
+            DriftDetector.load_baseline(path, model_version="v2")
+
+    @pytest.mark.parametrize("size", [0, 10, 100, 5000, -50])
+    def test_corrupt_baseline_is_rebuilt(self, tmp_path, size):
+        """잘린 기준 분포 파일은 무시하고 다시 계산해 원자적으로 저장"""
+        reference = np.random.randn(3000, 2)
+        detector = DriftDetector()
+        detector.set_reference(reference)
+        path = str(tmp_path / "baseline.joblib")
+        detector.save_baseline(path, model_version="v1")
+        with open(path, "rb") as f:
+            data = f.read()
+        with open(path, "wb") as f:
+            f.write(data[:size])
+
+        rebuilt, source = load_or_build_baseline(path, reference, model_version="v1")
+        assert source == "built"
+        assert os.listdir(tmp_path) == ["baseline.joblib"]
+
+        loaded, source = load_or_build_baseline(path, reference, model_version="v1")
+        assert source == "baseline"
+        np.testing.assert_array_equal(loaded.bin_edges, rebuilt.bin_edges)
+
+    def test_baseline_load_bug_is_not_rebuilt(self, tmp_path, monkeypatch):
+        """손상/버전 불일치가 아닌 오류는 기준 분포를 다시 계산하지 않고 전파"""
+        reference = np.random.randn(500, 2)
+        path = str(tmp_path / "baseline.joblib")
+        load_or_build_baseline(path, reference)
+
+        def broken(*args, **kwargs):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(DriftDetector, "load_baseline", broken)
+        with pytest.raises(TypeError):
+            load_or_build_baseline(path, reference)
+
+    def test_sketch_baseline_can_be_updated(self, tmp_path):
+        """스케치 기준 분포는 로드 후에도 증분 갱신 가능"""
+        detector = DriftDetector(sketch_k=64)
+        detector.set_reference(np.random.randn(2000, 3))
+        path = str(tmp_path / "baseline.joblib")
+        detector.save_baseline(path)
+
+        loaded = DriftDetector.load_baseline(path)
+        loaded.update_reference(np.random.randn(500, 3))
+        assert loaded.reference_sketch.count == 2500
+        _, results = loaded.detect_drift(np.random.randn(500, 3) + 2)
+        assert all(r.drift_detected for r in results)
+
+
+class TestQuantileSketch:
+    """QuantileSketch 테스트"""
+
+    @pytest.fixture
+    def data(self):
+        """스케치 입력 데이터 fixture"""
+        return np.random.RandomState(0).randn(50000, 3)
+
+    def test_bounded_memory(self, data):
+        """보관 값 개수는 입력 크기와 무관하게 제한"""
+        sketch = QuantileSketch(3, k=100, seed=0)
+        for batch in np.array_split(data, 50):
+            sketch.update(batch)
+
+        assert sketch.count == 50000
+        assert sketch.n_retained < 500
+        assert sketch.size_bytes == sketch.n_retained * 3 * 8
+
+    def test_rank_accuracy(self, data):
+        """추정 누적 분포와 분위수가 정확값에 근접"""
+        sketch = QuantileSketch(3, k=200, seed=0).update(data)
+        grid = np.tile(np.linspace(-2, 2, 41)[:, None], (1, 3))
+        exact = (data[None, :, :] <= grid[:, None, :]).mean(axis=1)
+
+        assert np.abs(sketch.cdf(grid) - exact).max() < 0.03
+        np.testing.assert_allclose(sketch.quantile(0.5), np.median(data, axis=0), atol=0.1)
+        np.testing.assert_array_equal(sketch.quantile(1.0), data.max(axis=0))
+
+    def test_merge(self, data):
+        """샤드별 스케치 병합"""
+        shards = [QuantileSketch(3, seed=i).update(part)
+                  for i, part in enumerate(np.array_split(data, 4))]
+        merged = shards[0]
+        for shard in shards[1:]:
+            merged.merge(shard)
+
+        assert merged.count == 50000
+        _, cumulative = merged.sorted_view()
+        np.testing.assert_allclose(cumulative[-1], 1.0)
+        np.testing.assert_allclose(merged.quantile(0.5), np.median(data, axis=0), atol=0.1)
+
+    def test_feature_count_mismatch(self):
+        """특성 수가 다른 입력/병합은 오류"""
+        sketch = QuantileSketch(3)
+        with pytest.raises(ValueError):
+            sketch.update(np.zeros((10, 2)))
+        with pytest.raises(ValueError):
+            sketch.merge(QuantileSketch(2))
+
+    def test_detector_with_sketch(self):
+        """스케치 기준 분포로 드리프트 감지 (원본 미보관)"""
+        np.random.seed(42)
+        reference = np.random.randn(10000, 4)
+        detector = DriftDetector(sketch_k=200)
+        detector.set_reference(reference[:5000])
+        detector.update_reference(reference[5000:])
+
+        assert detector.reference_data is None
+        assert detector.reference_sketch.count == 10000
+
+        has_drift, _ = detector.detect_drift(np.random.randn(500, 4) + 3)
+        assert has_drift is True
+
+        # 스케치 근사 통계량은 정확한 KS 통계량과 스케치 오차 범위 내에서 일치
+        exact = DriftDetector()
+        exact.set_reference(reference)
+        current = np.random.randn(500, 4)
+        _, approx_results = detector.detect_drift(current)
+        _, exact_results = exact.detect_drift(current)
+        for approx, expected in zip(approx_results, exact_results):
+            assert abs(approx.statistic - expected.statistic) < 0.03
+
+
+class TestStreamingDriftDetector:
+    """StreamingDriftDetector 테스트"""
+
+    @pytest.fixture
+    def detector(self):
+        """기준 분포가 설정된 감지기 fixture"""
+        np.random.seed(42)
+        detector = StreamingDriftDetector(window_rows=1000, emit_every_rows=500)
+        detector.set_reference(np.random.randn(5000, 4))
+        return detector
+
+    def test_emit_cadence(self, detector):
+        """emit_every_rows 간격으로만 결과 반환"""
+        emitted = [detector.ingest(row) for row in np.random.randn(1000, 4)]
+
+        assert sum(r is not None for r in emitted) == 2
+        assert emitted[499] is not None
+        assert len(emitted[499][1]) == 4
+
+    def test_count_expiry_keeps_histogram_consistent(self, detector):
+        """행 수 한도 초과 시 오래된 행 만료 (미니배치 일부 만료 포함)"""
+        for size in (300, 450, 600, 1, 333):
+            detector.ingest(np.random.randn(size, 4))
+
+        assert detector.window_size == 1000
+        np.testing.assert_array_equal(detector._counts.sum(axis=1), [1000] * 4)
+
+    def test_time_expiry(self):
+        """시간 한도를 넘은 미니배치 만료"""
+        detector = StreamingDriftDetector(
+            window_rows=None, window_seconds=10, emit_every_rows=None, emit_every_seconds=5
+        )
+        detector.set_reference(np.random.randn(1000, 2))
+        for t in range(30):
+            detector.ingest(np.random.randn(10, 2), timestamp=float(t))
+
+        assert detector.window_size == 110
+        # 모두 만료된 윈도우는 검정 불가
+        with pytest.raises(RuntimeError):
+            detector.check(timestamp=100.0)
+
+    def test_detects_shift(self, detector):
+        """윈도우가 이동된 분포로 채워지면 드리프트 감지"""
+        results = []
+        detector.on_result = lambda has_drift, _: results.append(has_drift)
+        for _ in range(4):
+            detector.ingest(np.random.randn(250, 4) + 1.0)
+
+        assert results == [True, True]
+        assert detector.latest[0] is True
+
+    def test_binned_statistic_close_to_exact(self):
+        """구간 경계 KS 통계량이 정확한 KS 통계량에 근접"""
+        np.random.seed(0)
+        reference = np.random.randn(5000, 3)
+        current = np.random.randn(2000, 3) * 1.2
+
+        streaming = StreamingDriftDetector(n_bins=128)
+        streaming.set_reference(reference)
+        exact = DriftDetector()
+        exact.set_reference(reference)
+
+        _, approx_results = streaming.detect_drift(current)
+        _, exact_results = exact.detect_drift(current)
+        for approx, expected in zip(approx_results, exact_results):
+            assert approx.statistic <= expected.statistic + 1e-12
+            assert expected.statistic - approx.statistic < 0.02
+
+    def test_reference_from_baseline(self, tmp_path):
+        """저장된 기준 분포의 구간으로 설정하면 set_reference와 동일"""
+        np.random.seed(0)
+        reference = np.random.randn(5000, 3)
+        current = np.random.randn(1000, 3) * 1.1
+        baseline = DriftDetector()
+        baseline.set_reference(reference)
+        path = str(tmp_path / "baseline.joblib")
+        baseline.save_baseline(path)
+
+        from_baseline = StreamingDriftDetector(n_bins=16)
+        from_baseline.set_reference_baseline(DriftDetector.load_baseline(path))
+        direct = StreamingDriftDetector()
+        direct.set_reference(reference)
+
+        assert from_baseline.n_bins == baseline.n_bins
+        _, expected = direct.detect_drift(current)
+        _, results = from_baseline.detect_drift(current)
+        for result, reference_result in zip(results, expected):
+            assert result.statistic == pytest.approx(reference_result.statistic)
+
+    def test_reference_from_sketch(self):
+        """스케치 기준 분포 사용"""
+        sketch = QuantileSketch(3, seed=0).update(np.random.randn(20000, 3))
+        detector = StreamingDriftDetector(window_rows=500, emit_every_rows=500)
+        detector.set_reference_sketch(sketch)
+
+        has_drift, _ = detector.ingest(np.random.randn(500, 3) + 2)
+        assert has_drift is True
+        assert detector.reference_count == 20000
+
+
+class TestParquetDrift:
+    """Parquet 데이터셋 드리프트 감지 테스트"""
+
+    @staticmethod
+    def write_dataset(directory, data, n_files=3, row_group_size=500):
+        """여러 파일/행 그룹으로 나눈 Parquet 데이터셋 작성"""
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        os.makedirs(directory, exist_ok=True)
+        for i, part in enumerate(np.array_split(np.arange(len(data["a"])), n_files)):
+            table = pa.table({name: values[part] for name, values in data.items()})
+            pq.write_table(
+                table, os.path.join(directory, f"part-{i}.parquet"),
+                row_group_size=row_group_size
+            )
+        return str(directory)
+
+    @pytest.fixture
+    def datasets(self, tmp_path):
+        """기준/현재 데이터셋 (b 열만 이동, 문자열 열 포함)"""
+        rng = np.random.default_rng(0)
+        reference = {
+            "a": rng.normal(size=6000),
+            "b": rng.normal(size=6000),
+            "id": np.arange(6000),
+            "name": np.array(["x"] * 6000)
+        }
+        current = {
+            "a": rng.normal(size=4000),
+            "b": rng.normal(size=4000) + 0.5,
+            "id": np.arange(4000),
+            "name": np.array(["y"] * 4000)
+        }
+        return (
+            self.write_dataset(tmp_path / "processed", reference),
+            self.write_dataset(tmp_path / "curated", current)
+        )
+
+    def test_batches_bounded_and_complete(self, datasets):
+        """배치 크기 상한 내에서 선택한 열만 전부 읽음"""
+        reference_path, _ = datasets
+        batches = list(iter_parquet_batches(reference_path, ["b", "a"], batch_rows=256))
+
+        assert max(len(X) for X in batches) <= 256
+        assert all(X.shape[1] == 2 for X in batches)
+        assert sum(len(X) for X in batches) == 6000
+
+    def test_detects_shifted_column(self, datasets):
+        """이동된 열만 드리프트, 공통 숫자형 열 자동 선택 (ID 열 제외)"""
+        reference_path, current_path = datasets
+        has_drift, results = detect_drift_parquet(reference_path, current_path, batch_rows=700)
+        by_name = {r.feature_name: r for r in results}
+
+        assert has_drift is True
+        assert set(by_name) == {"a", "b"}
+        assert by_name["b"].drift_detected is True
+        assert by_name["a"].drift_detected is False
+
+    def test_close_to_exact_ks(self, datasets):
+        """배치 집계 KS 통계량이 전체 데이터 정확 KS에 근접"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        reference_path, current_path = datasets
+        columns = ["a", "b"]
+        _, results = detect_drift_parquet(
+            reference_path, current_path, columns=columns, n_bins=128, batch_rows=333
+        )
+
+        reference = pq.read_table(reference_path, columns=columns)
+        current = pq.read_table(current_path, columns=columns)
+        for result, name in zip(results, columns):
+            expected = stats.ks_2samp(reference[name].to_numpy(), current[name].to_numpy())
+            assert result.statistic == pytest.approx(expected.statistic, abs=0.03)
+
+    def test_missing_values_kept_as_nan(self, tmp_path):
+        """결측은 NaN으로 두고 행은 제외하지 않음"""
+        values = np.random.randn(100)
+        values[::10] = np.nan
+        path = self.write_dataset(tmp_path / "raw", {"a": values}, n_files=1)
+
+        batches = list(iter_parquet_batches(path, ["a"]))
+        assert sum(len(X) for X in batches) == 100
+        assert sum(int(np.isnan(X).sum()) for X in batches) == 10
+
+    def test_sparse_column_masked_per_column(self, tmp_path):
+        """희소 열의 결측이 다른 열을 비우지 않고, 값이 없는 열은 건너뜀"""
+        rng = np.random.default_rng(1)
+        sparse = rng.normal(size=3000)
+        sparse[np.arange(3000) % 100 != 0] = np.nan
+        reference_path = self.write_dataset(tmp_path / "reference", {
+            "a": rng.normal(size=3000), "sparse": sparse, "empty": np.full(3000, np.nan)
+        })
+        current_path = self.write_dataset(tmp_path / "current", {
+            "a": rng.normal(size=3000) + 0.5, "sparse": rng.normal(size=3000),
+            "empty": rng.normal(size=3000)
+        })
+
+        has_drift, results = detect_drift_parquet(reference_path, current_path)
+        by_name = {r.feature_name: r for r in results}
+
+        assert has_drift is True
+        assert set(by_name) == {"a", "sparse"}
+        assert by_name["a"].drift_detected is True
+        assert by_name["sparse"].drift_detected is False
+
+
+class TestOnlineQualityEstimator:
+    """OnlineQualityEstimator 테스트"""
+
+    def test_matches_sklearn_metrics(self):
+        """누적 통계량 메트릭이 배치 계산과 일치"""
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+        rng = np.random.default_rng(0)
+        labels = rng.normal(200.0, 3.0, 1000)
+        predictions = labels + rng.normal(0, 1.0, 1000)
+        estimator = OnlineQualityEstimator(bucket_seconds=10)
+        for i in range(0, 1000, 100):
+            estimator.update(predictions[i:i + 100], labels[i:i + 100], timestamp=float(i))
+
+        metrics = estimator.metrics(timestamp=1000.0)
+        assert metrics.mae == pytest.approx(mean_absolute_error(labels, predictions))
+        assert metrics.mse == pytest.approx(mean_squared_error(labels, predictions))
+        assert metrics.r2 == pytest.approx(r2_score(labels, predictions))
+
+    def test_window_and_expiry(self):
+        """윈도우는 최근 버킷만 집계하고 보관 기간을 넘은 버킷은 제외"""
+        estimator = OnlineQualityEstimator(bucket_seconds=1, max_buckets=10)
+        estimator.update([1.0] * 5, [0.0] * 5, timestamp=0.5)
+        estimator.update([3.0] * 5, [0.0] * 5, timestamp=5.5)
+
+        assert estimator.metrics(window_seconds=2, timestamp=6.0).mae == pytest.approx(3.0)
+        assert estimator.metrics(timestamp=6.0).mae == pytest.approx(2.0)
+        assert estimator.count(timestamp=12.0) == 5
+        with pytest.raises(RuntimeError):
+            estimator.metrics(window_seconds=3, timestamp=20.0)
+
+    def test_late_label_in_older_bucket(self):
+        """과거 버킷에 도착한 레이블도 이후 윈도우에 반영"""
+        estimator = OnlineQualityEstimator(bucket_seconds=1, max_buckets=10)
+        estimator.update(1.0, 0.0, timestamp=5.0)
+        estimator.update(2.0, 0.0, timestamp=3.0)
+
+        assert estimator.count(window_seconds=3, timestamp=5.5) == 2
+        assert estimator.count(window_seconds=1, timestamp=5.5) == 1
+
+    def test_join_by_request_id(self):
+        """요청 ID로 예측과 늦은 레이블 결합"""
+        estimator = OnlineQualityEstimator(pending_ttl_seconds=60)
+        estimator.record_prediction("a", 1.0, timestamp=0.0)
+        estimator.record_prediction("b", 2.0, timestamp=50.0)
+
+        assert estimator.record_label("a", 0.5, timestamp=100.0) is False  # 만료
+        assert estimator.record_label("b", 1.5, timestamp=100.0) is True
+        assert estimator.record_label("b", 1.5, timestamp=100.0) is False
+        assert estimator.pending_count == 0
+        assert estimator.metrics(timestamp=100.0).mae == pytest.approx(0.5)
+
+    def test_feeds_should_retrain(self):
+        """온라인 메트릭으로 재학습 판단"""
+        estimator = OnlineQualityEstimator()
+        estimator.update(np.linspace(0, 1, 50) + 0.6, np.linspace(0, 1, 50), timestamp=0.0)
+
+        assert ModelMonitor().should_retrain(estimator.metrics(timestamp=0.0)) is True
+
 
 class TestDriftLevel:
     """DriftLevel 테스트"""
@@ -255,6 +828,71 @@ class TestModelMonitor:
 
         assert "message" in stats
 
+    def test_history_capacity(self):
+        """용량을 넘으면 가장 오래된 메트릭부터 덮어씀"""
+        monitor = ModelMonitor(history_capacity=3)
+        for i in range(5):
+            monitor.record_metrics(
+                ModelMetrics(mae=float(i), mse=0.0, rmse=0.0, r2=0.5, timestamp=f"t{i}")
+            )
+
+        assert len(monitor.metrics_history) == 3
+        assert [m.mae for m in monitor.metrics_history] == [2.0, 3.0, 4.0]
+        assert monitor.metrics_history[-1].timestamp == "t4"
+        assert monitor.get_statistics()["count"] == 3
+
+    def test_history_slicing(self):
+        """이력 슬라이싱은 리스트처럼 ModelMetrics 리스트 반환"""
+        monitor = ModelMonitor(history_capacity=4)
+        for i in range(6):
+            monitor.record_metrics(ModelMetrics(mae=float(i), mse=0.0, rmse=0.0, r2=0.5))
+
+        recent = monitor.metrics_history[-2:]
+        assert isinstance(recent, list)
+        assert [m.mae for m in recent] == [4.0, 5.0]
+        assert [m.mae for m in monitor.metrics_history[::-2]] == [5.0, 3.0]
+        assert monitor.metrics_history[10:] == []
+
+    def test_history_rejects_long_timestamp(self):
+        """최대 길이를 넘는 타임스탬프는 잘라서 저장하지 않고 거부"""
+        monitor = ModelMonitor()
+        timestamp = "2024-01-01T00:00:00.000000+09:00"
+        monitor.record_metrics(ModelMetrics(mae=1.0, mse=1.0, rmse=1.0, r2=0.5, timestamp=timestamp))
+        assert monitor.metrics_history[0].timestamp == timestamp
+
+        with pytest.raises(ValueError):
+            monitor.record_metrics(
+                ModelMetrics(mae=1.0, mse=1.0, rmse=1.0, r2=0.5, timestamp=timestamp + "[Asia/Seoul]")
+            )
+        assert len(monitor.metrics_history) == 1
+
+    @pytest.mark.parametrize("window", [1, 7, 50, None])
+    def test_window_statistics_match_numpy(self, window):
+        """증분 윈도우 통계가 직접 계산한 값과 일치 (링 버퍼 순환 포함)"""
+        rng = np.random.default_rng(0)
+        monitor = ModelMonitor(history_capacity=50)
+        mae = rng.uniform(0.3, 0.6, 400)
+        r2 = rng.uniform(0.6, 0.9, 400)
+
+        for i in range(400):
+            monitor.record_metrics(ModelMetrics(mae=mae[i], mse=0.0, rmse=0.0, r2=r2[i]))
+            if i % 37 == 0 or i == 399:
+                stats = monitor.get_statistics(window=window)
+                recent = mae[max(0, i + 1 - (window or 50)):i + 1]
+                assert stats["count"] == len(recent)
+                assert stats["mae"]["mean"] == pytest.approx(round(recent.mean(), 4))
+                assert stats["mae"]["std"] == pytest.approx(round(recent.std(), 4))
+                assert stats["mae"]["min"] == round(recent.min(), 4)
+                assert stats["mae"]["max"] == round(recent.max(), 4)
+
+    def test_window_larger_than_capacity(self):
+        """용량보다 큰 윈도우는 거부"""
+        monitor = ModelMonitor(history_capacity=10)
+        monitor.record_metrics(ModelMetrics(mae=0.3, mse=0.09, rmse=0.3, r2=0.8))
+
+        with pytest.raises(ValueError):
+            monitor.get_statistics(window=11)
+
 
 class TestCalculateDriftScore:
     """calculate_drift_score 함수 테스트"""
@@ -282,3 +920,30 @@ class TestCalculateDriftScore:
         score = calculate_drift_score(reference, current)
 
         assert score > 0.5  # 대부분의 특성에서 드리프트 발생해야 함
+
+    def test_batch_scores_match_single(self):
+        """일괄 계산 결과가 윈도우별 calculate_drift_score와 일치"""
+        np.random.seed(42)
+        reference = np.random.randn(1000, 4)
+        windows = np.random.randn(6, 200, 4) + np.linspace(0, 1, 6)[:, None, None]
+
+        scores, statistics = calculate_drift_scores(reference, windows)
+
+        assert statistics.shape == (6, 4)
+        expected = [calculate_drift_score(reference, window) for window in windows]
+        np.testing.assert_allclose(scores, expected)
+
+    @pytest.mark.parametrize("method", ["ks", "psi"])
+    def test_batch_parallel_matches_serial(self, method):
+        """병렬 평가와 순차 평가 결과 동일 (제너레이터 입력)"""
+        np.random.seed(0)
+        reference = np.random.randn(2000, 3)
+        windows = [np.random.randn(300, 3) * (1 + 0.1 * i) for i in range(5)]
+
+        serial = calculate_drift_scores(reference, iter(windows), method=method)
+        parallel = calculate_drift_scores(
+            reference, (w for w in windows), method=method, n_jobs=2
+        )
+
+        np.testing.assert_array_equal(serial[0], parallel[0])
+        np.testing.assert_array_equal(serial[1], parallel[1])
@@ -2,6 +2,11 @@
 Test cases for serving API module
 """
 
+import io
+import time
+import asyncio
+import threading
+
 import pytest
 import numpy as np
 
@@ -12,7 +17,15 @@ from src.serving.api import (
     HealthResponse,
     validate_input
 )
+from src.serving import codecs
+from src.serving.batching import MicroBatcher
+from src.serving.metrics import Histogram, ServingMetrics
+from src.serving.registry import ModelNotFoundError, ModelRegistry
+from src.serving import streaming
+from src.serving.validation import InputValidationError, validate_array
+from src.serving.backends import check_parity, load_backend
 from src.model.trainer import CaliforniaHousingModel
+from src.monitoring.streaming import StreamingDriftDetector
 
 
 class TestValidateInput:
@@ -45,6 +58,37 @@ class TestValidateInput:
         instances = [["a", "b", "c", "d", "e", "f", "g", "h"]]
         assert validate_input(instances) is False
 
+    def test_ragged_instances(self):
+        """행마다 특성 수가 다른 입력 테스트"""
+        instances = [[1.0] * 8, [1.0] * 7]
+        assert validate_input(instances) is False
+
+    def test_non_finite_reports_cells(self):
+        """NaN/inf 위치(행, 특성 이름) 보고 테스트"""
+        X = np.ones((4, 8))
+        X[1, 2] = np.nan
+        X[3, 7] = np.inf
+
+        with pytest.raises(InputValidationError) as exc_info:
+            validate_array(X)
+
+        assert exc_info.value.rows == [1, 3]
+        assert exc_info.value.columns == ["AveRooms", "Longitude"]
+        assert "(row 1, AveRooms)" in str(exc_info.value)
+
+    def test_feature_ranges(self):
+        """학습 범위 밖 값 거부 테스트"""
+        feature_ranges = np.vstack([np.zeros(8), np.ones(8)])
+        X = np.full((2, 8), 0.5)
+        assert validate_array(X, feature_ranges=feature_ranges) is not None
+
+        X[0, 0] = 1.5
+        with pytest.raises(InputValidationError) as exc_info:
+            validate_array(X, feature_ranges=feature_ranges)
+
+        assert exc_info.value.rows == [0]
+        assert exc_info.value.columns == ["MedInc"]
+
 
 class TestModelServer:
     """ModelServer 테스트"""
@@ -140,6 +184,628 @@ class TestModelServer:
         assert metrics["error_rate"] == 0
         assert metrics["avg_latency_ms"] > 0
         assert metrics["model_loaded"] is True
+        assert metrics["startup_seconds"] is None
+
+    def test_get_metrics_startup_seconds(self):
+        """시작 시간 메트릭 테스트"""
+        server = ModelServer(model=None, startup_seconds=1.23456)
+
+        assert server.get_metrics()["startup_seconds"] == 1.235
+
+
+class TestMicroBatcher:
+    """MicroBatcher 테스트"""
+
+    @staticmethod
+    def _run_concurrent(batcher, inputs):
+        async def run():
+            try:
+                return await asyncio.gather(*(batcher.submit(x) for x in inputs))
+            finally:
+                await batcher.stop()
+        return asyncio.run(run())
+
+    def test_coalesces_concurrent_requests(self):
+        """동시 요청을 하나의 배치로 묶는지 테스트"""
+        calls = []
+
+        def predict_fn(X):
+            calls.append(len(X))
+            return X.sum(axis=1)
+
+        batcher = MicroBatcher(predict_fn, max_batch_size=64, max_wait_us=50000)
+        inputs = [np.full((1, 8), i, dtype=float) for i in range(10)]
+
+        results = self._run_concurrent(batcher, inputs)
+
+        assert calls == [10]
+        assert [r.tolist() for r in results] == [[8.0 * i] for i in range(10)]
+        assert batcher.get_metrics()["batch_size"]["count"] == 1
+        assert batcher.get_metrics()["queue_wait_us"]["count"] == 10
+
+    def test_respects_max_batch_size(self):
+        """최대 배치 크기 제한 테스트"""
+        calls = []
+
+        def predict_fn(X):
+            calls.append(len(X))
+            return X[:, 0]
+
+        batcher = MicroBatcher(predict_fn, max_batch_size=4, max_wait_us=50000)
+        inputs = [np.full((2, 8), i, dtype=float) for i in range(5)]
+
+        results = self._run_concurrent(batcher, inputs)
+
+        assert max(calls) <= 4
+        assert sum(calls) == 10
+        assert [r.tolist() for r in results] == [[float(i)] * 2 for i in range(5)]
+
+    def test_propagates_errors(self):
+        """추론 오류를 각 요청에 전달하는지 테스트"""
+        def predict_fn(X):
+            raise ValueError("boom")
+
+        batcher = MicroBatcher(predict_fn, max_batch_size=8, max_wait_us=1000)
+
+        with pytest.raises(ValueError):
+            self._run_concurrent(batcher, [np.zeros((1, 8))])
+
+    def test_invalid_config(self):
+        """잘못된 설정 테스트"""
+        with pytest.raises(ValueError):
+            MicroBatcher(lambda X: X, max_batch_size=0)
+
+    def test_stop_drains_queued_and_running_batches(self):
+        """drain 종료 시 큐/추론 중인 요청이 모두 완료되는지 테스트"""
+        def predict_fn(X):
+            time.sleep(0.02)
+            return X[:, 0]
+
+        batcher = MicroBatcher(predict_fn, max_batch_size=2, max_wait_us=1000)
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(batcher.submit(np.full((1, 8), i, dtype=float)))
+                for i in range(6)
+            ]
+            await asyncio.sleep(0.005)
+            await batcher.stop()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(run())
+
+        assert [r.tolist() for r in results] == [[float(i)] for i in range(6)]
+        assert batcher.closed is True
+
+    def test_stop_without_drain_cancels_inflight_batch(self):
+        """즉시 종료 시 추론 중인 배치의 요청도 대기 상태로 남지 않는지 테스트"""
+        release = threading.Event()
+
+        def predict_fn(X):
+            release.wait(5)
+            return X[:, 0]
+
+        batcher = MicroBatcher(predict_fn, max_batch_size=1, max_wait_us=0)
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(batcher.submit(np.zeros((1, 8))))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            await batcher.stop(drain=False)
+            release.set()
+            return await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True), 1.0
+            )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+    def test_submit_after_stop_raises(self):
+        """stop() 이후 submit()은 워커를 재시작하지 않고 오류"""
+        batcher = MicroBatcher(lambda X: X[:, 0], max_batch_size=4, max_wait_us=0)
+
+        async def run():
+            await batcher.submit(np.zeros((1, 8)))
+            await batcher.stop()
+            await batcher.submit(np.zeros((1, 8)))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(run())
+
+    def test_server_predict_async(self, synthetic_housing_data):
+        """ModelServer 마이크로 배칭 예측 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        server = ModelServer(model=model)
+        batcher = server.enable_batching(max_batch_size=32, max_wait_us=20000)
+
+        async def run():
+            try:
+                return await asyncio.gather(
+                    *(server.predict_async([x]) for x in X_test[:5].tolist())
+                )
+            finally:
+                await batcher.stop()
+
+        responses = asyncio.run(run())
+
+        expected = model.predict(X_test[:5])
+        np.testing.assert_array_almost_equal(
+            [r.predictions[0] for r in responses], expected
+        )
+        metrics = server.get_metrics()
+        assert metrics["request_count"] == 5
+        assert metrics["batching"]["batch_count"] >= 1
+
+
+class TestBackends:
+    """추론 백엔드 테스트"""
+
+    @pytest.fixture
+    def fitted_model(self, synthetic_housing_data):
+        X_train, _, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        return model
+
+    def test_sklearn_backend_is_model(self, fitted_model):
+        """sklearn 백엔드는 원본 모델 그대로 사용"""
+        assert load_backend(fitted_model, backend="sklearn") is fitted_model
+
+    def test_unsupported_backend(self, fitted_model):
+        """지원하지 않는 백엔드 테스트"""
+        with pytest.raises(ValueError) as exc_info:
+            load_backend(fitted_model, backend="tensorrt")
+
+        assert "Unsupported backend" in str(exc_info.value)
+
+    def test_parity_check_failure(self, fitted_model, synthetic_housing_data):
+        """예측이 어긋나면 패리티 검사 실패"""
+        _, X_test, _, _ = synthetic_housing_data
+
+        class Shifted:
+            name = "shifted"
+
+            def predict(self, X):
+                return fitted_model.predict(X) + 1.0
+
+        with pytest.raises(RuntimeError) as exc_info:
+            check_parity(fitted_model, Shifted(), X_test, tolerance=1e-3)
+
+        assert "Parity check failed" in str(exc_info.value)
+
+    @pytest.mark.parametrize("backend_name", ["onnx", "onnx_quantized"])
+    def test_onnx_backend(self, fitted_model, synthetic_housing_data, tmp_path, backend_name):
+        """ONNX 백엔드 예측 및 캐시 재사용 테스트 (양자화는 선형 모델)"""
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("skl2onnx")
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        onnx_path = str(tmp_path / "model.onnx")
+        if backend_name == "onnx_quantized":
+            fitted_model = CaliforniaHousingModel(model_type="linear_regression")
+            fitted_model.train(X_train, y_train)
+
+        backend = load_backend(fitted_model, backend=backend_name, onnx_path=onnx_path)
+        cached = load_backend(fitted_model, backend=backend_name, onnx_path=onnx_path)
+
+        np.testing.assert_allclose(
+            backend.predict(X_test), fitted_model.predict(X_test), atol=1e-3
+        )
+        np.testing.assert_allclose(cached.predict(X_test), backend.predict(X_test))
+        server = ModelServer(model=backend)
+        assert server.get_metrics()["backend"] == backend_name
+
+    def test_quantized_backend_rejects_tree_model(self, fitted_model, tmp_path):
+        """동적 양자화할 연산이 없는 트리 앙상블은 onnx_quantized 거부 (캐시 파일이 있어도)"""
+        onnx_path = tmp_path / "model.onnx"
+        onnx_path.write_bytes(b"cached")
+
+        with pytest.raises(ValueError) as exc_info:
+            load_backend(fitted_model, backend="onnx_quantized", onnx_path=str(onnx_path))
+
+        assert "quantization" in str(exc_info.value)
+
+
+class TestCodecs:
+    """바이너리 요청 포맷 테스트"""
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_packed_roundtrip(self, dtype):
+        """packed float 포맷 왕복 및 zero-copy 디코딩"""
+        X = np.random.RandomState(0).rand(3, 8).astype(dtype)
+
+        decoded = codecs.decode_request(codecs.encode_packed(X), codecs.OCTET_STREAM)
+
+        assert decoded.dtype == dtype
+        assert not decoded.flags.owndata
+        np.testing.assert_array_equal(decoded, X)
+
+    def test_packed_length_mismatch(self):
+        """헤더와 본문 길이가 다르면 거부"""
+        body = codecs.encode_packed(np.zeros((2, 8)))
+
+        with pytest.raises(ValueError) as exc_info:
+            codecs.decode_request(body[:-8], codecs.OCTET_STREAM)
+
+        assert "length mismatch" in str(exc_info.value)
+
+    def test_npy_roundtrip(self):
+        """.npy 요청 디코딩 및 응답 인코딩"""
+        X = np.random.RandomState(0).rand(4, 8)
+        buffer = io.BytesIO()
+        np.save(buffer, X)
+
+        decoded = codecs.decode_request(buffer.getvalue(), codecs.NPY)
+        body = codecs.encode_response(decoded[:, 0], codecs.NPY, codecs.response_dtype(decoded))
+
+        np.testing.assert_array_equal(decoded, X)
+        np.testing.assert_array_equal(np.load(io.BytesIO(body)), X[:, 0])
+
+    def test_arrow_roundtrip(self):
+        """Arrow IPC 요청 디코딩 및 응답 인코딩"""
+        pa = pytest.importorskip("pyarrow")
+        X = np.random.RandomState(0).rand(4, 8)
+        table = pa.table({f"f{i}": X[:, i] for i in range(8)})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        decoded = codecs.decode_request(sink.getvalue().to_pybytes(), codecs.ARROW_STREAM)
+        body = codecs.encode_response(decoded[:, 0], codecs.ARROW_STREAM, np.float64)
+
+        np.testing.assert_array_equal(decoded, X)
+        result = pa.ipc.open_stream(body).read_all()
+        np.testing.assert_array_equal(result.column("prediction").to_numpy(), X[:, 0])
+
+    def test_unsupported_content_type(self):
+        """지원하지 않는 포맷 테스트"""
+        with pytest.raises(codecs.UnsupportedFormatError):
+            codecs.decode_request(b"1,2,3", "text/csv")
+
+    def test_server_predict_array(self, synthetic_housing_data):
+        """ModelServer 배열 예측 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="random_forest",
+            model_params={"n_estimators": 5, "random_state": 42}
+        )
+        model.train(X_train, y_train)
+        server = ModelServer(model=model)
+
+        X = codecs.decode_request(
+            codecs.encode_packed(X_test[:5].astype(np.float32)), codecs.OCTET_STREAM
+        )
+        predictions, latency_ms = asyncio.run(server.predict_array_async(X))
+
+        np.testing.assert_allclose(predictions, model.predict(X_test[:5]), rtol=1e-5)
+        assert latency_ms >= 0
+        assert server.request_count == 1
+
+
+class TestServingMetrics:
+    """서빙 메트릭 테스트"""
+
+    def test_histogram_threads(self):
+        """여러 스레드에서 기록한 값이 모두 합산되는지 확인"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        histogram = Histogram([0.1, 1.0])
+
+        def record(_):
+            for _ in range(1000):
+                histogram.observe(0.5)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(record, range(8)))
+
+        assert histogram.count == 8000
+        assert histogram.to_dict()["buckets"] == {"0.1": 0, "1": 8000, "+Inf": 8000}
+
+    def test_histogram_quantile(self):
+        """버킷 보간 분위수 테스트"""
+        histogram = Histogram([1.0, 2.0, 4.0])
+        assert histogram.quantile(0.5) is None
+
+        for value in [0.5, 1.5, 1.5, 3.0]:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == pytest.approx(1.5)
+        assert histogram.quantile(1.0) == pytest.approx(4.0)
+
+    def test_render_prometheus(self):
+        """Prometheus 텍스트 포맷 테스트"""
+        metrics = ServingMetrics(labels={"user_id": "user01"}, latency_buckets=[0.01, 0.1])
+        metrics.observe_prediction("success")
+        metrics.observe_request(0.05)
+        metrics.observe_phase("predict", 0.005)
+
+        text = metrics.render_prometheus()
+
+        assert 'model_prediction_total{user_id="user01",status="success"} 1' in text
+        assert 'model_prediction_latency_bucket{user_id="user01",le="0.01"} 0' in text
+        assert 'model_prediction_latency_bucket{user_id="user01",le="+Inf"} 1' in text
+        assert (
+            'model_prediction_phase_latency_bucket'
+            '{user_id="user01",phase="predict",le="0.01"} 1'
+        ) in text
+
+    def test_server_records_predict_phase(self, synthetic_housing_data):
+        """ModelServer 예측 결과/단계 지연시간 기록 테스트"""
+        X_train, X_test, y_train, _ = synthetic_housing_data
+        model = CaliforniaHousingModel(
+            model_type="linear_regression"
+        )
+        model.train(X_train, y_train)
+        server = ModelServer(model=model)
+
+        server.predict_array(X_test[:3])
+        with pytest.raises(ValueError):
+            server.predict_array(X_test[:3, :4])
+
+        metrics = server.get_metrics()
+        assert metrics["request_count"] == 1
+        assert metrics["error_count"] == 1
+        assert metrics["phase_latency_ms"]["predict"]["count"] == 1
+        assert 'status="error"} 1' in server.render_prometheus()
+
+
+class ConstantModel:
+    """고정값을 예측하는 테스트용 모델"""
+
+    def __init__(self, value, size_bytes=100):
+        self.value = value
+        self.size_bytes = size_bytes
+        self.predict_calls = 0
+
+    def predict(self, X):
+        self.predict_calls += 1
+        return np.full(len(X), self.value, dtype=np.float64)
+
+
+class TestModelRegistry:
+    """모델 레지스트리 테스트"""
+
+    def test_default_and_pinned_version(self):
+        """기본 버전 교체 및 버전 고정 조회"""
+        registry = ModelRegistry()
+        registry.register("m", "v1", ConstantModel(1.0))
+        registry.register("m", "v2", ConstantModel(2.0))
+
+        assert registry.get("m").version == "v2"
+        assert registry.get("m", "v1").version == "v1"
+        with pytest.raises(ModelNotFoundError):
+            registry.get("m", "v3")
+
+        registry.set_default("m", "v1")
+        assert registry.get().version == "v1"
+
+    def test_lru_eviction_under_budget(self):
+        """예산 초과 시 기본 버전이 아닌 가장 오래 사용하지 않은 버전 제거"""
+        registry = ModelRegistry(memory_budget_bytes=250)
+        evicted = []
+        registry.on_evict = lambda entry: evicted.append(entry.version)
+
+        registry.register("m", "v1", ConstantModel(1.0))
+        registry.register("m", "v2", ConstantModel(2.0), make_default=False)
+        registry.get("m", "v2")
+        registry.register("m", "v3", ConstantModel(3.0), make_default=False)
+
+        assert evicted == ["v2"]
+        assert [e.version for e in registry.entries()] == ["v1", "v3"]
+        assert registry.default().version == "v1"
+
+    def test_load_async_warms_then_switches(self):
+        """백그라운드 로드 후 워밍업을 마치고 기본 버전 전환"""
+        registry = ModelRegistry(warmup_X=np.zeros((4, 8)))
+        registry.register("m", "v1", ConstantModel(1.0))
+        candidate = ConstantModel(2.0)
+
+        entry = asyncio.run(registry.load_async("m", "v2", lambda: candidate))
+
+        assert candidate.predict_calls == 1
+        assert registry.default() is entry
+        assert registry.describe()["loading"] == {}
+
+    def test_load_async_failure_keeps_default(self):
+        """로드 실패 시 기존 기본 버전 유지"""
+        registry = ModelRegistry()
+        registry.register("m", "v1", ConstantModel(1.0))
+
+        def broken():
+            raise OSError("artifact missing")
+
+        with pytest.raises(OSError):
+            asyncio.run(registry.load_async("m", "v2", broken))
+
+        assert registry.default().version == "v1"
+        assert "failed" in registry.describe()["loading"]["m:v2"]
+
+    def test_server_pins_version(self):
+        """ModelServer 버전 고정 예측"""
+        server = ModelServer(model=ConstantModel(1.0), model_version="v1", model_name="m")
+        server.registry.register("m", "v2", ConstantModel(2.0))
+
+        assert server.model_version == "v2"
+        assert server.predict([[0.0] * 8]).predictions == [2.0]
+        pinned = server.predict([[0.0] * 8], version="v1")
+        assert pinned.predictions == [1.0]
+        assert pinned.model_version == "v1"
+
+    def test_hot_swap_drains_batched_requests(self):
+        """배칭 중 같은 버전을 재적재해도 진행 중인 요청이 모두 완료"""
+        class SlowModel(ConstantModel):
+            def predict(self, X):
+                time.sleep(0.005)
+                return super().predict(X)
+
+        server = ModelServer(model=SlowModel(1.0), model_version="v1", model_name="m")
+        server.enable_batching(max_batch_size=4, max_wait_us=2000)
+
+        async def run():
+            tasks = [
+                asyncio.ensure_future(server.predict_array_async(np.zeros((1, 8))))
+                for _ in range(20)
+            ]
+            await asyncio.sleep(0.01)
+            server.registry.register("m", "v1", SlowModel(2.0))
+            tasks += [
+                asyncio.ensure_future(server.predict_array_async(np.zeros((1, 8))))
+                for _ in range(5)
+            ]
+            try:
+                return await asyncio.wait_for(asyncio.gather(*tasks), 5.0)
+            finally:
+                await server.stop()
+
+        results = asyncio.run(run())
+
+        values = [float(predictions[0]) for predictions, _ in results]
+        assert len(values) == 25
+        assert set(values) <= {1.0, 2.0}
+        assert values[-5:] == [2.0] * 5
+        assert server.error_count == 0
+
+    def test_prometheus_version_follows_serving_entry(self):
+        """Prometheus version 레이블은 요청을 처리한 버전"""
+        server = ModelServer(model=ConstantModel(1.0), model_version="v1", model_name="m")
+        server.predict([[0.0] * 8])
+        server.registry.register("m", "v2", ConstantModel(2.0))
+        server.predict([[0.0] * 8])
+        server.predict([[0.0] * 8])
+
+        text = server.render_prometheus()
+
+        assert 'model_prediction_total{version="v1",status="success"} 1' in text
+        assert 'model_prediction_total{version="v2",status="success"} 2' in text
+        assert server.request_count == 3
+        assert server.health_check().version == "v2"
+
+    def test_server_feeds_drift_detector(self):
+        """예측 입력을 스트리밍 드리프트 감지기에 전달"""
+        detector = StreamingDriftDetector(window_rows=100, emit_every_rows=50, min_window_rows=50)
+        detector.set_reference(np.random.RandomState(0).randn(1000, 8))
+        server = ModelServer(model=ConstantModel(1.0), drift_detector=detector)
+
+        server.predict_array(np.random.RandomState(1).randn(60, 8) + 3)
+
+        status = server.get_metrics()["drift"]
+        assert status["window_rows"] == 60
+        assert status["drift_detected"] is True
+        assert len(status["features"]) == 8
+        assert "model_feature_drift_p_value{" in server.render_prometheus()
+
+
+class TestStreaming:
+    """/predict/stream 청크 스트리밍 테스트"""
+
+    @staticmethod
+    def collect(body_parts, codec, chunk_rows):
+        """스트림 결과 청크 목록 수집"""
+        async def body():
+            for part in body_parts:
+                yield part
+
+        async def predict(X):
+            return X.sum(axis=1)
+
+        async def run():
+            return [
+                chunk async for chunk in streaming.stream_predictions(
+                    body(), codec, predict, validate_array, chunk_rows=chunk_rows
+                )
+            ]
+
+        return asyncio.run(run())
+
+    def test_ndjson_chunks_across_network_boundaries(self):
+        """줄이 네트워크 청크 경계에서 잘려도 행 단위로 복원"""
+        X = np.arange(40, dtype=np.float64).reshape(5, 8)
+        payload = "".join(f"{row}\n" for row in X.tolist()).encode()
+        parts = [payload[i:i + 7] for i in range(0, len(payload), 7)]
+
+        chunks = self.collect(parts, streaming.NdjsonCodec(), chunk_rows=2)
+
+        assert len(chunks) == 3
+        lines = b"".join(chunks).decode().splitlines()
+        predictions = [float(line.split(":")[1].rstrip("}")) for line in lines]
+        np.testing.assert_array_equal(predictions, X.sum(axis=1))
+
+    def test_csv_header_reorders_columns(self):
+        """CSV 헤더 순서를 FEATURE_NAMES 순서로 변환"""
+        names = list(reversed(streaming.FEATURE_NAMES))
+        payload = (",".join(names) + "\n" + ",".join(["1"] + ["0"] * 7) + "\n").encode()
+
+        chunks = self.collect([payload], streaming.CsvCodec(), chunk_rows=10)
+
+        assert b"".join(chunks) == b"prediction\n1.0\n"
+
+    def test_validation_error_uses_global_row(self):
+        """검증 오류 행 번호는 전체 입력 기준"""
+        rows = [[1.0] * 8] * 3 + [[1.0] * 7 + [float("nan")]]
+        payload = "".join(
+            "[" + ",".join("NaN" if np.isnan(v) else repr(v) for v in row) + "]\n"
+            for row in rows
+        ).encode()
+
+        with pytest.raises(InputValidationError) as exc_info:
+            self.collect([payload], streaming.NdjsonCodec(), chunk_rows=2)
+
+        assert exc_info.value.rows == [3]
+        assert exc_info.value.columns == ["Longitude"]
+
+    @pytest.mark.parametrize("chunk_rows", [100, 1024])
+    def test_uvicorn_chunked_body_fully_processed(self, chunk_rows):
+        """실제 uvicorn 서버에서 여러 네트워크 청크로 보낸 본문의 모든 행을 예측"""
+        uvicorn = pytest.importorskip("uvicorn")
+        import http.client
+        from src.serving.api import create_app
+
+        app = create_app(model=ConstantModel(1.0), model_version="v1")
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+        )
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+
+        n_rows = 20_000
+        row = ("[" + ",".join(["1.0"] * 8) + "]\n").encode()
+
+        def body():
+            for _ in range(0, n_rows, 250):
+                yield row * 250
+
+        try:
+            deadline = time.monotonic() + 10
+            while not server.started and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert server.started
+            port = server.servers[0].sockets[0].getsockname()[1]
+
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            connection.request(
+                "POST", f"/predict/stream?chunk_rows={chunk_rows}", body=body(),
+                headers={"Content-Type": streaming.NDJSON}
+            )
+            response = connection.getresponse()
+            lines = response.read().splitlines()
+            connection.close()
+        finally:
+            server.should_exit = True
+            thread.join(timeout=10)
+
+        assert response.status == 200
+        assert len(lines) == n_rows
+        assert set(lines) == {b'{"prediction":1.0}'}
 
 
 class TestPredictionRequest: